@@ -1,12 +1,17 @@
 import os
-import pandas as pd
+import sys
+from pathlib import Path
+
+# The CSV cache (parse once, then load a Feather sidecar) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.csv_cache import cached_read_csv
 
 # Get the directory where the script is located
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_path = os.path.join(script_dir, "weather_data.csv")
 
 # Read the CSV file
-data = pd.read_csv(csv_path)
+data = cached_read_csv(csv_path)
 
 # --- Basic inspection ---
 print("Columns:", list(data.columns))
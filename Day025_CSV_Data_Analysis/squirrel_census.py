@@ -1,25 +1,319 @@
-import pandas as pd
-import os
-
- # Get the directory where the script is located
-script_dir = os.path.dirname(os.path.abspath(__file__))
-# # Create the full path to the CSV file
-csv_path = os.path.join(script_dir, "2018_Central_Park_Squirrel_Census_-_Squirrel_Data.csv")
-
-# Read the CSV file into a DataFrame
-data = pd.read_csv(csv_path)
-
-# Count fur colors 
-fur_color_counts = data["Primary Fur Color"].value_counts()
-
-# Convert the counts to a DataFrame
-fur_color_df = pd.DataFrame(fur_color_counts)
-fur_color_df.columns = ["Count"]
-fur_color_df.index.name = "Fur Color"
-
-# Export to CSV in the same directory
-output_path = os.path.join(script_dir, "squirrel_count.csv")
-fur_color_df.to_csv(output_path)
-
-print("\nSquirrel Fur Color Counts:")
-print(fur_color_counts)
+"""Count Central Park squirrels by fur color, or by any other census columns.
+
+The census is read in chunks, keeping only the group-by columns, as
+categoricals. Each chunk's counts are merged into a running total, so
+memory stays flat however big the export is. With pyarrow installed,
+its streaming CSV reader does the parsing; otherwise pandas' C parser
+with ``usecols`` and ``chunksize`` does.
+
+Counting the same columns of the same file again can skip parsing
+altogether: ``--method cached`` keeps them in a Feather sidecar (see
+``shared/csv_cache.py``) and memory-maps it on later runs.
+
+Usage:
+    python squirrel_census.py                                  # fur colors -> squirrel_count.csv
+    python squirrel_census.py --group-by Shift Age --output by_shift_age.csv
+    python squirrel_census.py export.csv --group-by Hectare --method chunked
+    python squirrel_census.py export.csv --group-by Hectare --method cached
+    python squirrel_census.py --make-synthetic big.csv --rows 4_000_000
+    python squirrel_census.py big.csv --benchmark
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# The CSV cache lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.csv_cache import cached_read_csv
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # the chunked pandas reader works without it
+    pa = pa_csv = None
+
+try:
+    import resource  # peak RSS for --benchmark; POSIX only
+except ImportError:
+    resource = None
+
+SCRIPT_DIR = Path(__file__).parent
+CENSUS_CSV = SCRIPT_DIR / "2018_Central_Park_Squirrel_Census_-_Squirrel_Data.csv"
+OUTPUT_CSV = SCRIPT_DIR / "squirrel_count.csv"
+
+DEFAULT_GROUP_BY = ("Primary Fur Color",)
+# Output headers for columns whose census names are long-winded
+OUTPUT_LABELS = {"Primary Fur Color": "Fur Color"}
+COUNT_COL = "Count"
+
+CHUNK_ROWS = 500_000
+ARROW_BLOCK_BYTES = 1 << 20
+
+# "naive": the original script, the whole file with inferred dtypes
+# "chunked": pandas' C parser, usecols + categoricals, chunksize rows at a time
+# "pyarrow": pyarrow's streaming reader, only the group-by columns converted
+# "cached": the group-by columns as categoricals, from the CSV cache after the first run
+METHODS = ("naive", "chunked", "pyarrow", "cached")
+DEFAULT_METHOD = "pyarrow" if pa_csv is not None else "chunked"
+
+
+def iter_chunks_pandas(
+    csv_path: Path,
+    columns: list[str],
+    chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``columns`` of ``csv_path`` as categorical chunks of ``chunk_rows`` rows."""
+    with pd.read_csv(
+        csv_path,
+        usecols=columns,
+        dtype=dict.fromkeys(columns, "category"),
+        chunksize=chunk_rows,
+    ) as reader:
+        yield from reader
+
+
+def iter_chunks_arrow(
+    csv_path: Path,
+    columns: list[str],
+    chunk_rows: int = CHUNK_ROWS,
+    block_bytes: int = ARROW_BLOCK_BYTES,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``columns`` of ``csv_path`` in chunks of about ``chunk_rows`` rows.
+
+    Every column is read as dictionary-encoded text, like pandas'
+    ``"category"`` dtype, so both readers produce the same keys. The
+    reader parses ahead of the consumer by a few dozen blocks, so memory
+    scales with ``block_bytes``; small blocks are gathered into
+    ``chunk_rows``-row chunks to keep the per-chunk pandas work cheap.
+    """
+    if pa_csv is None:
+        raise RuntimeError("the pyarrow method needs pyarrow installed")
+    text = pa.dictionary(pa.int32(), pa.string())
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=block_bytes),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types=dict.fromkeys(columns, text),
+            strings_can_be_null=True,  # empty fields are missing, as in pandas
+        ),
+    )
+    with reader:
+        batches, rows = [], 0
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= chunk_rows:
+                yield pa.Table.from_batches(batches).to_pandas()
+                batches, rows = [], 0
+        if batches:
+            yield pa.Table.from_batches(batches).to_pandas()
+
+
+def merge_counts(
+    chunks: Iterable[pd.DataFrame],
+    columns: list[str],
+    dropna: bool = True,
+) -> Counter:
+    """Add up each chunk's group sizes into one ``Counter`` keyed by value tuples.
+
+    Missing values become ``None`` in the keys; with ``dropna`` (the
+    ``value_counts()`` default) rows with any missing key are skipped.
+    """
+    totals: Counter = Counter()
+    for chunk in chunks:
+        sizes = chunk.groupby(columns, observed=True, dropna=dropna).size()
+        for key, size in zip(sizes.index, sizes.to_numpy(), strict=True):
+            key = key if isinstance(key, tuple) else (key,)
+            totals[tuple(None if pd.isna(value) else value for value in key)] += int(size)
+    return totals
+
+
+def counts_frame(totals: Counter, columns: list[str]) -> pd.DataFrame:
+    """Turn :func:`merge_counts` output into a table, biggest group first."""
+    rows = [(*key, count) for key, count in totals.items()]
+    table = pd.DataFrame(rows, columns=[*columns, COUNT_COL])
+    return table.sort_values([COUNT_COL, *columns], ascending=[False] + [True] * len(columns))
+
+
+def iter_whole_file(csv_path: Path, columns: list[str]) -> Iterator[pd.DataFrame]:
+    """The original approach: parse every column of the file, then keep ``columns``.
+
+    Values are turned back into text so the keys match the other readers.
+    """
+    data = pd.read_csv(csv_path)[columns]
+    yield data.astype(str).where(data.notna())
+
+
+def iter_cached(
+    csv_path: Path,
+    columns: list[str],
+    cache_dir: Path | None = None,
+) -> Iterator[pd.DataFrame]:
+    """``columns`` of ``csv_path`` as categoricals, in one piece, via the CSV cache."""
+    yield cached_read_csv(
+        csv_path,
+        cache_dir=cache_dir,
+        usecols=columns,
+        dtype=dict.fromkeys(columns, "category"),
+    )
+
+
+def count_census(
+    csv_path: Path = CENSUS_CSV,
+    group_by: Iterable[str] = DEFAULT_GROUP_BY,
+    method: str = DEFAULT_METHOD,
+    dropna: bool = True,
+    chunk_rows: int = CHUNK_ROWS,
+    cache_dir: Path | None = None,
+) -> pd.DataFrame:
+    """Count census rows per combination of ``group_by`` values.
+
+    Args:
+        csv_path: A census export with a header row.
+        group_by: Columns to group by.
+        method: One of ``METHODS``.
+        dropna: Skip rows with a missing value in any group-by column.
+        chunk_rows: Rows per chunk for the streaming methods.
+        cache_dir: Cache directory for the ``"cached"`` method; by
+            default ``.csv_cache/`` next to the CSV.
+
+    Returns:
+        DataFrame with the ``group_by`` columns and ``Count``, biggest
+        group first.
+    """
+    columns = list(group_by)
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}; pick one of {METHODS}")
+    if method == "naive":
+        chunks = iter_whole_file(csv_path, columns)
+    elif method == "cached":
+        chunks = iter_cached(csv_path, columns, cache_dir)
+    elif method == "pyarrow":
+        chunks = iter_chunks_arrow(csv_path, columns, chunk_rows)
+    else:
+        chunks = iter_chunks_pandas(csv_path, columns, chunk_rows)
+    return counts_frame(merge_counts(chunks, columns, dropna), columns)
+
+
+def write_synthetic_census(
+    output_path: Path,
+    rows: int,
+    source: Path = CENSUS_CSV,
+    chunk_rows: int = 200_000,
+    seed: int = 25,
+) -> Path:
+    """Write ``rows`` census rows resampled (with replacement) from ``source``.
+
+    Keeps the real columns, value mix and text width, so a few million
+    rows make a file of the size of a multi-year export.
+    """
+    census = pd.read_csv(source, dtype=str, keep_default_na=False)
+    rng = np.random.default_rng(seed)
+    with output_path.open("w", newline="") as f:
+        for start in range(0, rows, chunk_rows):
+            picks = rng.integers(0, len(census), min(chunk_rows, rows - start))
+            census.iloc[picks].to_csv(f, index=False, header=start == 0)
+    return output_path
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (NaN where unsupported)."""
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _benchmark_method(
+    csv_path: Path,
+    columns: list[str],
+    method: str,
+    cache_dir: Path,
+    label: str,
+) -> dict[str, float]:
+    """Count once with ``method``; runs in its own process so peak RSS is its own."""
+    start = time.perf_counter()
+    table = count_census(csv_path, columns, method, cache_dir=cache_dir)
+    return {
+        "method": label,
+        "seconds": time.perf_counter() - start,
+        "peak_rss_mb": _peak_rss_mb(),
+        "groups": len(table),
+    }
+
+
+def benchmark(
+    csv_path: Path,
+    group_by: Iterable[str] = DEFAULT_GROUP_BY,
+    methods: Iterable[str] = METHODS,
+) -> pd.DataFrame:
+    """Time each method on ``csv_path``, each in a fresh spawned process.
+
+    ``"cached"`` runs twice against an empty temporary cache: the first
+    run parses and writes the entry, the second only loads it.
+    """
+    runs = []
+    for method in methods:
+        if method == "pyarrow" and pa_csv is None:
+            continue
+        if method == "cached":
+            runs += [(method, "cached (first)"), (method, "cached (warm)")]
+        else:
+            runs.append((method, method))
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="census_cache_") as cache_dir:
+        for method, label in runs:
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                args = (csv_path, list(group_by), method, Path(cache_dir), label)
+                rows.append(pool.submit(_benchmark_method, *args).result())
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("csv", type=Path, nargs="?", default=CENSUS_CSV, help="census export")
+    parser.add_argument("--group-by", nargs="+", default=list(DEFAULT_GROUP_BY))
+    parser.add_argument("--method", choices=METHODS, default=DEFAULT_METHOD)
+    parser.add_argument("--keep-missing", action="store_true", help="count missing values too")
+    parser.add_argument("--output", type=Path, default=None, help=f"default: {OUTPUT_CSV.name}")
+    parser.add_argument("--make-synthetic", type=Path, metavar="PATH", help="write a test file")
+    parser.add_argument("--rows", type=int, default=4_000_000, help="rows for --make-synthetic")
+    parser.add_argument("--benchmark", action="store_true", help="time every method on csv")
+    args = parser.parse_args()
+
+    if args.make_synthetic:
+        path = write_synthetic_census(args.make_synthetic, args.rows, source=args.csv)
+        print(f"Wrote {args.rows:,} rows to {path} ({path.stat().st_size / 1e9:.2f} GB)")
+        return
+    if args.benchmark:
+        size = args.csv.stat().st_size / 1e6
+        print(f"{args.csv.name}: {size:,.0f} MB, group by {args.group_by}")
+        print(benchmark(args.csv, args.group_by).round(2).to_string(index=False))
+        return
+
+    table = count_census(args.csv, args.group_by, args.method, dropna=not args.keep_missing)
+    output_path = args.output or OUTPUT_CSV
+    table.rename(columns=OUTPUT_LABELS).to_csv(output_path, index=False)
+
+    print(f"\nSquirrel counts by {', '.join(args.group_by)}:")
+    print(table.to_string(index=False))
+    print(f"\nSaved: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
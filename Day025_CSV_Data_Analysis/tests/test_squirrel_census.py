@@ -0,0 +1,89 @@
+"""Tests for the Day 25 squirrel census counter."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import squirrel_census
+from squirrel_census import (
+    CENSUS_CSV,
+    COUNT_COL,
+    METHODS,
+    count_census,
+    write_synthetic_census,
+)
+
+AVAILABLE_METHODS = [m for m in METHODS if m != "pyarrow" or squirrel_census.pa_csv is not None]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the ``cached`` method's entries out of the day folder."""
+    monkeypatch.setenv("CSV_CACHE_DIR", str(tmp_path / "csv_cache"))
+    return tmp_path / "csv_cache"
+
+
+@pytest.fixture(scope="module")
+def census() -> pd.DataFrame:
+    return pd.read_csv(CENSUS_CSV)
+
+
+@pytest.mark.parametrize("method", AVAILABLE_METHODS)
+def test_fur_colors_match_value_counts(census: pd.DataFrame, method: str) -> None:
+    table = count_census(method=method)
+    expected = census["Primary Fur Color"].value_counts()
+    assert dict(zip(table["Primary Fur Color"], table[COUNT_COL], strict=True)) == expected.to_dict()
+    assert table[COUNT_COL].is_monotonic_decreasing
+
+
+@pytest.mark.parametrize("method", AVAILABLE_METHODS)
+def test_small_chunks_merge_to_the_same_counts(method: str) -> None:
+    columns = ["Shift", "Age", "Primary Fur Color"]
+    whole = count_census(group_by=columns, method="naive", dropna=False)
+    chunked = count_census(group_by=columns, method=method, dropna=False, chunk_rows=97)
+    pd.testing.assert_frame_equal(chunked.reset_index(drop=True), whole.reset_index(drop=True))
+
+
+def test_cached_method_reuses_its_entry(cache_dir: Path) -> None:
+    first = count_census(group_by=["Shift", "Age"], method="cached")
+    (entry,) = cache_dir.iterdir()
+    pd.testing.assert_frame_equal(count_census(group_by=["Shift", "Age"], method="cached"), first)
+    assert list(cache_dir.iterdir()) == [entry]
+
+
+def test_keep_missing_counts_every_row(census: pd.DataFrame) -> None:
+    table = count_census(group_by=["Age"], dropna=False)
+    assert table[COUNT_COL].sum() == len(census)
+    assert table["Age"].isna().sum() == 1
+    assert count_census(group_by=["Age"])[COUNT_COL].sum() == census["Age"].notna().sum()
+
+
+def test_unknown_method() -> None:
+    with pytest.raises(ValueError, match="unknown method"):
+        count_census(method="polars")
+
+
+def test_synthetic_census_keeps_the_value_mix(tmp_path: Path, census: pd.DataFrame) -> None:
+    path = write_synthetic_census(tmp_path / "big.csv", rows=5000, chunk_rows=1500)
+    synthetic = pd.read_csv(path)
+    assert list(synthetic.columns) == list(census.columns)
+    assert len(synthetic) == 5000
+    shares = synthetic["Primary Fur Color"].value_counts(normalize=True)
+    expected = census["Primary Fur Color"].value_counts(normalize=True)
+    assert shares.index.tolist() == expected.index.tolist()
+
+
+def test_cli_writes_labelled_output(tmp_path: Path) -> None:
+    output = tmp_path / "counts.csv"
+    subprocess.run(
+        [sys.executable, squirrel_census.__file__, "--output", str(output)],
+        check=True,
+        capture_output=True,
+    )
+    table = pd.read_csv(output)
+    assert table.columns.tolist() == ["Fur Color", COUNT_COL]
+    assert table.iloc[0].tolist() == ["Gray", 2473]
@@ -1,6 +1,10 @@
 import turtle
-import pandas as pd
 import os
+import sys
+
+# The CSV cache (parse once, then load a Feather sidecar) lives at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.csv_cache import cached_read_csv
 
 # Screen setup
 screen = turtle.Screen()
@@ -28,7 +32,7 @@ background.hideturtle()
 # Load state data
 csv_path = os.path.join(current_dir, "50_states.csv")
 try:
-    data = pd.read_csv(csv_path)
+    data = cached_read_csv(csv_path)
     all_states = data.state.to_list()
 except FileNotFoundError:
     print(f"Error: Could not find {csv_path}")
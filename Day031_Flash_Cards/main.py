@@ -2,8 +2,13 @@ import tkinter as tk
 from tkinter import Canvas
 import pandas as pd
 import random
+import sys
 from pathlib import Path
 
+# The CSV cache (parse once, then load a Feather sidecar) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.csv_cache import cached_read_csv
+
 # ---------------------------- CONSTANTS ------------------------------- #
 BACKGROUND_COLOR = "#B1DDC6"
 current_card = {}
@@ -16,7 +21,7 @@ script_dir = Path(__file__).parent
 try:
     data = pd.read_csv(script_dir / "data" / "words_to_learn.csv")
 except FileNotFoundError:
-    original_data = pd.read_csv(script_dir / "french_words.csv")
+    original_data = cached_read_csv(script_dir / "french_words.csv")
     to_learn = original_data.to_dict(orient="records")
 else:
     to_learn = data.to_dict(orient="records")
@@ -4,6 +4,12 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import Integer, String, Float
 from sqlalchemy.exc import IntegrityError
 import os
+import sys
+from pathlib import Path
+
+# Shared SQLite engine profile (WAL, pool sizing, read-only bind) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.sqlite_engine import init_sqlite_db
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-fallback-key')
@@ -12,9 +18,8 @@ app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-fallback-key')
 class Base(DeclarativeBase):
     pass
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///books-collection.db'
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get('DATABASE_URI', 'sqlite:///books-collection.db'))
 
 # CREATE TABLE
 class Book(db.Model):
@@ -2,6 +2,13 @@ from flask import Flask, render_template, redirect, url_for, request
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import Integer, String, Float
+import os
+import sys
+from pathlib import Path
+
+# Shared SQLite engine profile (WAL, pool sizing, read-only bind) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.sqlite_engine import init_sqlite_db
 
 app = Flask(__name__)
 
@@ -9,9 +16,8 @@ app = Flask(__name__)
 class Base(DeclarativeBase):
     pass
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///movies.db'
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get('DATABASE_URI', 'sqlite:///movies.db'))
 
 # CREATE TABLE
 class Movie(db.Model):
@@ -0,0 +1,192 @@
+"""
+Micro-benchmarks for the Day 66 cafe API.
+
+Seeds a throwaway SQLite database with synthetic cafes and times the hot
+paths of main.py against the naive implementations they replaced. The
+database grows between sizes (10k -> 100k -> 1M) instead of being rebuilt,
+so a full run only inserts the largest size once.
+
+Usage:
+    python benchmarks.py random
+    python benchmarks.py random --sizes 10000 100000 1000000
+    python benchmarks.py search
+    python benchmarks.py serialize --sizes 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# main.py's JSON provider lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.json_provider import OrjsonProvider
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+SEED_BATCH_SIZE = 10_000
+LOCATIONS = ["Peckham", "Shoreditch", "Bermondsey", "Clerkenwell", "Hackney", "Barbican"]
+# Each base location is split into this many numbered areas ("Peckham 17"),
+# so a search returns a handful of rows rather than a sixth of the table
+AREAS_PER_LOCATION = 2000
+
+
+def load_app(db_path):
+    """Import main.py against a scratch database and return the module."""
+    os.environ["DATABASE_URI"] = f"sqlite:///{db_path}"
+    import main
+
+    return main
+
+
+def synthetic_cafe(i):
+    """Return the column values for the i-th synthetic cafe."""
+    return {
+        "name": f"Cafe {i:07d}",
+        "map_url": f"https://example.com/maps/{i}",
+        "img_url": f"https://example.com/img/{i}.jpg",
+        "location": f"{LOCATIONS[i % len(LOCATIONS)]} {i // len(LOCATIONS) % AREAS_PER_LOCATION}",
+        "seats": "20-30",
+        "has_toilet": i % 2 == 0,
+        "has_wifi": True,
+        "has_sockets": i % 3 != 0,
+        "can_take_calls": i % 5 == 0,
+        "coffee_price": f"£{2 + (i % 20) / 10:.2f}",
+    }
+
+
+def grow_table(main, target):
+    """Insert synthetic cafes until the table holds ``target`` rows."""
+    db, Cafe = main.db, main.Cafe
+    current = db.session.scalar(db.select(db.func.count()).select_from(Cafe))
+    for start in range(current, target, SEED_BATCH_SIZE):
+        rows = [synthetic_cafe(i) for i in range(start, min(start + SEED_BATCH_SIZE, target))]
+        db.session.execute(db.insert(Cafe), rows)
+        db.session.commit()
+
+
+def time_call(func, repeat):
+    """Call ``func`` ``repeat`` times and return the median wall time in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+# ==================== BENCHMARKS ====================
+
+
+def bench_random(main, sizes, repeat):
+    """Full-table random.choice vs CafeIdCache + primary-key lookup."""
+    db, Cafe = main.db, main.Cafe
+
+    def legacy():
+        return random.choice(db.session.execute(db.select(Cafe)).scalars().all())
+
+    def cached():
+        db.session.expunge_all()  # don't let the identity map hide the lookup
+        return main.random_cafe()
+
+    print(f"{'rows':>10} {'full scan (ms)':>16} {'id cache load (ms)':>20} {'cached pick (ms)':>18}")
+    for size in sizes:
+        grow_table(main, size)
+        # Loading every row is slow at 1M - a couple of samples is plenty
+        legacy_ms = time_call(legacy, max(1, min(repeat // 10, 200_000 // size)))
+        db.session.expunge_all()
+        main.cafe_ids.clear()
+        version, _ = main.cafe_table_version()
+        load_ms = time_call(lambda: main.cafe_ids.load(version), 1)
+        cached_ms = time_call(cached, repeat)
+        print(f"{size:>10,} {legacy_ms:>16.2f} {load_ms:>20.2f} {cached_ms:>18.4f}")
+
+
+def bench_search(main, sizes, repeat):
+    """Unindexed exact match vs location_key index (exact/prefix) vs FTS5."""
+    db, Cafe = main.db, main.Cafe
+    # Compare lookup cost only - every strategy returns the matching ids
+    strategies = {
+        "raw column": lambda: db.select(Cafe.id).where(Cafe.location == "Hackney 17"),
+        "key exact": lambda: db.select(Cafe.id).where(Cafe.location_key == "hackney 17"),
+        "key prefix": lambda: db.select(Cafe.id).where(
+            Cafe.location_key.between("hackney 17", "hackney 17\U0010ffff")
+        ),
+        "fts5": lambda: db.text(
+            f"SELECT rowid FROM {main.FTS_TABLE} WHERE {main.FTS_TABLE} MATCH '\"hackney\"* \"17\"*'"
+        ),
+    }
+
+    print(f"{'rows':>10} " + " ".join(f"{name + ' (ms)':>16}" for name in strategies))
+    for size in sizes:
+        grow_table(main, size)
+        timings = [
+            time_call(lambda stmt=stmt: db.session.execute(stmt()).all(), repeat)
+            for stmt in strategies.values()
+        ]
+        print(f"{size:>10,} " + " ".join(f"{ms:>16.3f}" for ms in timings))
+
+
+def bench_serialize(main, sizes, repeat):
+    """Rows/sec for the old reflective to_dict vs the precompiled serializers."""
+    db, Cafe = main.db, main.Cafe
+
+    def reflective():
+        cafes = db.session.execute(db.select(Cafe)).scalars().all()
+        rows = [
+            {column.name: getattr(cafe, column.name) for column in cafe.__table__.columns}
+            for cafe in cafes
+        ]
+        db.session.expunge_all()
+        return json.dumps(rows)
+
+    def orm_precompiled():
+        cafes = db.session.execute(db.select(Cafe)).scalars().all()
+        rows = [cafe.to_dict() for cafe in cafes]
+        db.session.expunge_all()
+        return main.app.json.dumps(rows)
+
+    def core_tuples():
+        result = db.session.execute(db.select(*main.CAFE_COLUMNS))
+        return main.app.json.dumps([main.cafe_row_to_dict(row) for row in result])
+
+    strategies = {
+        "reflective+json": reflective,
+        "to_dict+provider": orm_precompiled,
+        "core+provider": core_tuples,
+    }
+    encoder = "orjson" if isinstance(main.app.json, OrjsonProvider) else "stdlib json"
+    print(f"JSON provider: {encoder}")
+    print(f"{'rows':>10} " + " ".join(f"{name + ' (rows/s)':>26}" for name in strategies))
+    for size in sizes:
+        grow_table(main, size)
+        rates = [size / (time_call(func, repeat) / 1000) for func in strategies.values()]
+        print(f"{size:>10,} " + " ".join(f"{rate:>26,.0f}" for rate in rates))
+
+
+BENCHMARKS = {
+    "random": bench_random,
+    "search": bench_search,
+    "serialize": bench_serialize,
+}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=200, help="timed calls per size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="day066_bench_") as tmp:
+        main = load_app(Path(tmp) / "bench.db")
+        with main.app.app_context():
+            BENCHMARKS[args.benchmark](main, sorted(args.sizes), args.repeat)
+
+
+if __name__ == "__main__":
+    main_cli()
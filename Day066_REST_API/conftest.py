@@ -28,6 +28,8 @@ APP = _mod.app
 DB = _mod.db
 CAFE = _mod.Cafe
 API_KEY = _mod.API_KEY
+CAFE_IDS = _mod.cafe_ids
+RESPONSE_CACHE = _mod.response_cache
 
 # Override DATABASE_URI for the rest of the process (in case main is
 # re-imported in a later session).
@@ -55,6 +57,12 @@ def cafe_class():
     return CAFE
 
 
+@pytest.fixture
+def app():
+    """The Flask app (for app_context() in tests that query the db directly)."""
+    return APP
+
+
 @pytest.fixture
 def api_key():
     """API key used by secured endpoints."""
@@ -67,6 +75,8 @@ def reset_db():
     with APP.app_context():
         DB.drop_all()
         DB.create_all()
+    CAFE_IDS.clear()
+    RESPONSE_CACHE.clear()
     yield
 
 
@@ -94,3 +104,16 @@ def add_sample_cafe(client, sample_cafe):
     assert response.status_code == 201
     cafes = client.get("/all").get_json()["cafes"]
     return cafes[0]["id"]
+
+
+@pytest.fixture
+def add_cafes(client, sample_cafe):
+    """Factory: add ``n`` uniquely-named cafes via the API, return their ids."""
+
+    def _add(n):
+        for i in range(n):
+            payload = {**sample_cafe, "name": f"Cafe {i:04d}", "location": f"Town {i % 3}"}
+            assert client.post("/add", data=payload).status_code == 201
+        return [cafe["id"] for cafe in client.get("/all").get_json()["cafes"]]
+
+    return _add
@@ -7,23 +7,47 @@ remote-work friendly cafes with WiFi, power outlets, and coffee prices.
 
 API Endpoints:
 - GET  /random           - Get a random cafe
-- GET  /all              - Get all cafes
-- GET  /search?loc=<location> - Search cafes by location
+- GET  /all              - Get all cafes (?after_id=&limit= for keyset pages,
+                           ?format=ndjson to stream one cafe per line)
+- GET  /search?loc=<location> - Search cafes by location (case/accent-insensitive,
+                           &match=prefix for prefix matches)
+- GET  /search?q=<text>  - Full-text search over name and location (SQLite FTS5)
 - POST /add              - Add a new cafe (requires parameters)
+- POST /bulk-add         - Add many cafes from a JSON array or CSV upload
 - PATCH /update-price/<cafe_id> - Update coffee price (requires API key)
 - DELETE /report-closed/<cafe_id> - Delete a cafe (requires API key)
 """
 
+import bisect
+import csv
+import hashlib
+import io
+import operator
 import os
 import random
-
-from flask import Flask, jsonify, render_template, request
+import re
+import sys
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+from pathlib import Path
+
+from flask import Flask, jsonify, render_template, request, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Boolean, Integer, String
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, Integer, String, event, exc, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, validates
+
+# Shared SQLite engine profile and orjson JSON provider live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.json_provider import use_orjson
+from shared.sqlite_engine import init_sqlite_db
 
 # Initialize Flask app
 app = Flask(__name__)
+use_orjson(app)
 
 
 # Configure SQLite database
@@ -31,17 +55,47 @@ class Base(DeclarativeBase):
     pass
 
 
-app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URI", "sqlite:///cafes.db")
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get("DATABASE_URI", "sqlite:///cafes.db"))
 
 # API Key for secured endpoints - Load from environment
 API_KEY = os.environ.get("API_KEY", "TopSecretAPIKey")
 
+# Keyset pagination for GET /all
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Rows fetched from the DB cursor per round-trip when streaming NDJSON
+STREAM_BATCH_SIZE = 500
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# POST /bulk-add inserts validated rows in one transaction per chunk
+BULK_CHUNK_SIZE = 1000
+
+# In-process LRU of serialized GET responses (see HTTP CACHING below)
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 # ==================== DATABASE MODEL ====================
 
 
+def normalize_location(location):
+    """
+    Fold a location into its search key: accents stripped, case-folded, trimmed.
+
+    "Peckham", " peckham " and "Péckham" all become "peckham".
+    """
+    if location is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", location)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold().strip()
+
+
+def _location_key_default(context):
+    """Column default so Core/bulk inserts get a location_key too."""
+    return normalize_location(context.get_current_parameters().get("location"))
+
+
 class Cafe(db.Model):
     """Database model for Cafe with all remote-work related information."""
 
@@ -56,11 +110,26 @@ class Cafe(db.Model):
     has_sockets: Mapped[bool] = mapped_column(Boolean, nullable=False)
     can_take_calls: Mapped[bool] = mapped_column(Boolean, nullable=False)
     coffee_price: Mapped[str] = mapped_column(String(250), nullable=True)
+    # Indexed search key derived from location - internal, never serialized
+    location_key: Mapped[str] = mapped_column(
+        String(250),
+        index=True,
+        nullable=True,
+        default=_location_key_default,
+        info={"private": True},
+    )
+
+    @validates("location")
+    def _sync_location_key(self, key, location):
+        """Keep location_key in step whenever location is set through the ORM."""
+        self.location_key = normalize_location(location)
+        return location
 
     def to_dict(self):
         """Convert Cafe object to dictionary for JSON serialization."""
-        # Method 1: Using dictionary comprehension
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        # Method 1: Zip the precompiled field names with one attrgetter call
+        # (see CAFE_FIELDS below) instead of reflecting on the table per row
+        return dict(zip(CAFE_FIELDS, _cafe_values(self), strict=True))
 
         # Method 2: Manual dictionary creation (alternative)
         # return {
@@ -78,9 +147,390 @@ class Cafe(db.Model):
         # }
 
 
+# Precompiled serializer, built once: the public column names, the matching
+# Core columns (to SELECT plain tuples instead of hydrating ORM objects) and
+# a single attrgetter that reads them all off a Cafe instance.
+CAFE_FIELDS = tuple(
+    column.name for column in Cafe.__table__.columns if not column.info.get("private")
+)
+CAFE_COLUMNS = tuple(Cafe.__table__.c[name] for name in CAFE_FIELDS)
+_cafe_values = operator.attrgetter(*CAFE_FIELDS)
+
+
+def cafe_row_to_dict(row):
+    """Serialize a row selected from CAFE_COLUMNS (no ORM object involved)."""
+    return dict(zip(CAFE_FIELDS, row, strict=True))
+
+
+class TableVersion(db.Model):
+    """
+    Change counter for a table, bumped in the same transaction as every write.
+
+    Drives the ETag / Last-Modified headers on the read endpoints and tells
+    each worker process when its in-memory caches are out of date.
+    """
+
+    table_name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+def utc_now():
+    """Naive UTC now, truncated to whole seconds like HTTP dates."""
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _seed_table_version(target, connection, **kw):
+    connection.execute(target.insert().values(table_name="cafe", version=0, updated_at=utc_now()))
+
+
+def cafe_table_version():
+    """
+    Return the cafe table's current ``(version, updated_at)``.
+
+    updated_at is a timezone-aware UTC datetime (None if never recorded).
+    """
+    row = db.session.execute(
+        db.select(TableVersion.version, TableVersion.updated_at).where(
+            TableVersion.table_name == "cafe"
+        )
+    ).first()
+    if row is None:
+        return 0, None
+    return row.version, row.updated_at.replace(tzinfo=timezone.utc)
+
+
+def bump_cafe_version():
+    """Increment the cafe table version inside the current transaction and return it."""
+    db.session.execute(
+        db.update(TableVersion)
+        .where(TableVersion.table_name == "cafe")
+        .values(version=TableVersion.version + 1, updated_at=utc_now())
+    )
+    return db.session.scalar(
+        db.select(TableVersion.version).where(TableVersion.table_name == "cafe")
+    )
+
+
+# ==================== SEARCH INDEXES ====================
+
+# SQLite FTS5 index over name + location, kept in sync by triggers.
+# "remove_diacritics 2" makes full-text matches accent-insensitive as well.
+FTS_TABLE = "cafe_fts"
+FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        name, location, content='cafe', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON cafe BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, location) VALUES (new.id, new.name, new.location);
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON cafe BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF name, location ON cafe BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+        INSERT INTO {FTS_TABLE}(rowid, name, location) VALUES (new.id, new.name, new.location);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+full_text_search_enabled = False
+
+
+def setup_full_text_search(connection):
+    """
+    Create the FTS5 index and its triggers if this database supports them.
+
+    Safe to call repeatedly. Returns True if full-text search is usable;
+    non-SQLite databases, or SQLite builds without FTS5, return False.
+    """
+    global full_text_search_enabled
+    if connection.dialect.name != "sqlite":
+        full_text_search_enabled = False
+        return False
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+    if not exists:
+        try:
+            for statement in FTS_DDL:
+                connection.execute(text(statement))
+        except exc.OperationalError:
+            # This SQLite was compiled without FTS5 (the first CREATE fails,
+            # so nothing is left half-built)
+            full_text_search_enabled = False
+            return False
+    full_text_search_enabled = True
+    return True
+
+
+@event.listens_for(Cafe.__table__, "after_create")
+def _create_fts(target, connection, **kw):
+    setup_full_text_search(connection)
+
+
+@event.listens_for(Cafe.__table__, "before_drop")
+def _drop_fts(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+
+def upgrade_location_key(connection):
+    """Add and backfill location_key on databases created before it existed."""
+    columns = {column["name"] for column in db.inspect(connection).get_columns("cafe")}
+    if "location_key" in columns:
+        return
+
+    connection.execute(text("ALTER TABLE cafe ADD COLUMN location_key VARCHAR(250)"))
+    for index in Cafe.__table__.indexes:
+        index.create(connection, checkfirst=True)
+    rows = connection.execute(db.select(Cafe.id, Cafe.location)).all()
+    if rows:
+        connection.execute(
+            db.update(Cafe).where(Cafe.id == db.bindparam("cafe_id")),
+            [{"cafe_id": row.id, "location_key": normalize_location(row.location)} for row in rows],
+        )
+
+
+def fts_match_expression(query):
+    """
+    Turn free text into an FTS5 MATCH expression with prefix matching.
+
+    Every word becomes a quoted prefix term, so user input can't inject
+    FTS5 operators: "sci caf" -> '"sci"* "caf"*' (implicit AND).
+    """
+    words = re.findall(r"\w+", query or "")
+    return " ".join(f'"{word}"*' for word in words)
+
+
 # Create tables (only needs to run once)
 with app.app_context():
     db.create_all()
+    with db.engine.begin() as connection:
+        upgrade_location_key(connection)
+        setup_full_text_search(connection)
+
+
+# ==================== RANDOM SAMPLING ====================
+
+
+class CafeIdCache:
+    """
+    Sorted, in-process copy of every cafe id, tagged with the table version.
+
+    GET /random picks an id from here and then does a single primary-key
+    lookup, instead of loading the whole table to call random.choice().
+    The ids live in a compact ``array('q')`` (8 bytes per cafe) and are
+    loaded lazily on first use. This process's own writes are applied in
+    place through note_change(); a table version we didn't produce (another
+    worker wrote) means the next pick reloads. So does a pick whose row has
+    gone, which covers writes that bypassed the API.
+    """
+
+    def __init__(self):
+        self._ids = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def load(self, version):
+        """(Re)load every cafe id from the database as of ``version``."""
+        ids = array("q", db.session.scalars(db.select(Cafe.id).order_by(Cafe.id)))
+        with self._lock:
+            self._ids, self._version = ids, version
+
+    def clear(self):
+        """Forget the cached ids; the next pick reloads them."""
+        with self._lock:
+            self._ids, self._version = None, None
+
+    def note_change(self, version, added=None, removed=None):
+        """
+        Apply a write this process just committed, which moved the table to ``version``.
+
+        Args:
+            version: The table version returned by bump_cafe_version().
+            added: Id of a newly inserted cafe, if any.
+            removed: Id of a deleted cafe, if any.
+        """
+        with self._lock:
+            if self._ids is None:
+                return
+            if self._version != version - 1:
+                # Someone else wrote in between - start afresh
+                self._ids, self._version = None, None
+                return
+            if added is not None:
+                index = bisect.bisect_left(self._ids, added)
+                if index == len(self._ids) or self._ids[index] != added:
+                    self._ids.insert(index, added)
+            if removed is not None:
+                index = bisect.bisect_left(self._ids, removed)
+                if index < len(self._ids) and self._ids[index] == removed:
+                    del self._ids[index]
+            self._version = version
+
+    def choice(self, version):
+        """Return a uniformly random id as of ``version``, or None if there are no cafes."""
+        if self._ids is None or self._version != version:
+            self.load(version)
+        with self._lock:
+            return random.choice(self._ids) if self._ids else None
+
+
+cafe_ids = CafeIdCache()
+
+
+def random_cafe(version=None):
+    """
+    Pick a random cafe with one primary-key lookup.
+
+    Args:
+        version: The current cafe table version, if the caller already has it.
+
+    Returns:
+        Cafe | None: A random cafe, or None if the table is empty.
+    """
+    if version is None:
+        version, _ = cafe_table_version()
+    for _ in range(2):
+        cafe_id = cafe_ids.choice(version)
+        if cafe_id is None:
+            return None
+        cafe = db.session.get(Cafe, cafe_id)
+        if cafe is not None:
+            return cafe
+        # The id was deleted behind our back - reload and try once more
+        cafe_ids.clear()
+    return None
+
+
+# ==================== HTTP CACHING ====================
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of serialized response bodies.
+
+    Keys include the cafe table version, so entries never need explicit
+    invalidation - after a write they simply stop being asked for and age
+    out. Bounded both by entry count and by total body size.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return ``(body, status, mimetype)`` for ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, body, status, mimetype):
+        """Store a response body, evicting least recently used entries as needed."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            self._entries[key] = (body, status, mimetype)
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES)
+
+
+def make_etag(key):
+    """Stable strong ETag for a cache key (the same in every worker process)."""
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:20]
+
+
+def is_not_modified(etag, last_modified):
+    """True if the request's conditional headers say the client is up to date."""
+    if request.if_none_match:
+        # If-None-Match wins over If-Modified-Since (RFC 9110)
+        return request.if_none_match.contains(etag)
+    since = request.if_modified_since
+    return since is not None and last_modified is not None and last_modified <= since
+
+
+def serve_cached(key, last_modified, build):
+    """
+    Serve a GET response from the LRU with ETag / Last-Modified validators.
+
+    Answers 304 Not Modified without touching the body when the client's
+    copy is current; otherwise replays the cached body or calls ``build()``
+    (a view-style callable) and caches its output. Streamed responses are
+    validated but never cached.
+
+    Args:
+        key: Hashable cache key; must include the table version.
+        last_modified: Value for Last-Modified, or None to omit it.
+        build: Zero-argument callable returning a Flask response/tuple.
+    """
+    etag = make_etag(key)
+    if is_not_modified(etag, last_modified):
+        response = app.response_class(status=304)
+    else:
+        cached = response_cache.get(key)
+        if cached is not None:
+            body, status, mimetype = cached
+            response = app.response_class(body, status=status, mimetype=mimetype)
+        else:
+            response = app.make_response(build())
+            if not response.is_streamed:
+                response_cache.put(key, response.get_data(), response.status_code, response.mimetype)
+
+    if response.status_code in (200, 304):
+        response.set_etag(etag)
+        if last_modified is not None:
+            response.last_modified = last_modified
+        # Let clients keep the body but revalidate it on every use
+        response.cache_control.no_cache = True
+    return response
+
+
+def cached_read(endpoint):
+    """Decorator: serve a read-only view through serve_cached()."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Read the version *before* building the body: a write racing
+            # with us can then only make the ETag too old (the client just
+            # refetches), never newer than the data it labels.
+            version, updated_at = cafe_table_version()
+            key = (
+                endpoint,
+                tuple(sorted(request.args.items(multi=True))),
+                request.headers.get("Accept", ""),
+                version,
+            )
+            return serve_cached(key, updated_at, lambda: view(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
 
 
 # ==================== ROUTES ====================
@@ -100,6 +550,9 @@ def get_random_cafe():
     """
     GET a random cafe from the database.
 
+    Picks an id from the in-process CafeIdCache and fetches only that row,
+    so the cost doesn't grow with the size of the table.
+
     Returns:
         JSON: Random cafe object
 
@@ -120,23 +573,88 @@ def get_random_cafe():
             }
         }
     """
-    result = db.session.execute(db.select(Cafe))
-    all_cafes = result.scalars().all()
+    version, _ = cafe_table_version()
+    cafe = random_cafe(version)
 
-    if all_cafes:
-        random_cafe = random.choice(all_cafes)
-        return jsonify(cafe=random_cafe.to_dict())
+    if cafe:
+        # The ETag identifies this cafe at this table version. No
+        # Last-Modified: a date can't tell one random pick from another.
+        return serve_cached(
+            ("random", cafe.id, version),
+            None,
+            lambda: jsonify(cafe=cafe.to_dict()),
+        )
     else:
         return jsonify(error={"Not Found": "No cafes in database."}), 404
 
 
+def parse_page_args(args):
+    """
+    Read the keyset pagination parameters from a request's query string.
+
+    Args:
+        args: The request's query-string mapping (``request.args``).
+
+    Returns:
+        tuple: ``(after_id, limit)``; either may be None if not supplied.
+
+    Raises:
+        ValueError: If a parameter is not an integer or is out of range.
+    """
+    after_id = args.get("after_id")
+    limit = args.get("limit")
+    try:
+        after_id = int(after_id) if after_id is not None else None
+        limit = int(limit) if limit is not None else None
+    except ValueError:
+        raise ValueError("after_id and limit must be integers.") from None
+
+    if limit is not None and not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+    return after_id, limit
+
+
+def select_cafes_after(after_id=None):
+    """Build a SELECT of cafe rows in primary-key order, starting after ``after_id``."""
+    stmt = db.select(*CAFE_COLUMNS).order_by(Cafe.id)
+    if after_id is not None:
+        stmt = stmt.where(Cafe.id > after_id)
+    return stmt
+
+
+def wants_ndjson():
+    """True if the client asked for a streamed NDJSON response.
+
+    The Accept header only opts in when it prefers NDJSON to JSON outright:
+    curl, requests and browsers send ``*/*``, which must keep getting the
+    plain JSON body.
+    """
+    if request.args.get("format") == "ndjson":
+        return True
+    accept = request.accept_mimetypes
+    return accept.quality(NDJSON_MIMETYPE) > accept.quality("application/json")
+
+
 @app.route("/all")
+@cached_read("all")
 def get_all_cafes():
     """
     GET all cafes from the database.
 
+    Query Parameters (all optional):
+        after_id (int): Keyset cursor - only return cafes with a larger id.
+        limit (int): Page size, 1-1000 (defaults to 100 when after_id is given).
+        format (str): "ndjson" streams one cafe per line straight from the
+            database cursor, so memory stays flat however big the table is.
+            Sending "Accept: application/x-ndjson" does the same.
+
+    Without any parameters every cafe is returned in one response, sorted
+    by name. With after_id/limit the cafes are sorted by id and the response
+    carries a "next_after_id" cursor for the following page (null on the last
+    page).
+
     Returns:
-        JSON: List of all cafe objects
+        JSON: List of cafe objects (or NDJSON lines when streaming)
 
     Example Response:
         {
@@ -153,29 +671,74 @@ def get_all_cafes():
                 }
             ]
         }
+
+    Example Paginated Request:
+        GET /all?after_id=2&limit=2
+
+    Example Paginated Response:
+        {
+            "cafes": [{"id": 3, ...}, {"id": 4, ...}],
+            "next_after_id": 4
+        }
     """
-    result = db.session.execute(db.select(Cafe).order_by(Cafe.name))
-    all_cafes = result.scalars().all()
+    try:
+        after_id, limit = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify(error={"Bad Request": str(e)}), 400
+
+    if wants_ndjson():
+        stmt = select_cafes_after(after_id).execution_options(yield_per=STREAM_BATCH_SIZE)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        def generate():
+            for row in db.session.execute(stmt):
+                yield app.json.dumps(cafe_row_to_dict(row)) + "\n"
+
+        return app.response_class(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
 
-    # Convert list of Cafe objects to list of dictionaries
-    cafes_list = [cafe.to_dict() for cafe in all_cafes]
+    if after_id is None and limit is None:
+        # Select plain column tuples - no ORM objects to hydrate
+        result = db.session.execute(db.select(*CAFE_COLUMNS).order_by(Cafe.name))
 
-    return jsonify(cafes=cafes_list)
+        # Convert rows to a list of dictionaries
+        cafes_list = [cafe_row_to_dict(row) for row in result]
+
+        return jsonify(cafes=cafes_list)
+
+    # Keyset page: fetch one extra row to know whether another page exists
+    limit = limit or DEFAULT_PAGE_SIZE
+    page = db.session.execute(select_cafes_after(after_id).limit(limit + 1)).all()
+    has_more = len(page) > limit
+    page = page[:limit]
+    next_after_id = page[-1].id if has_more else None
+
+    return jsonify(cafes=[cafe_row_to_dict(row) for row in page], next_after_id=next_after_id)
 
 
 @app.route("/search")
+@cached_read("search")
 def search_cafe():
     """
     GET cafes by location query parameter.
 
+    Locations are matched on an indexed, case-folded and accent-stripped key,
+    so "peckham" and "Péckham" both find "Peckham" without a table scan.
+
     Query Parameters:
         loc (str): Location to search for (e.g., ?loc=Peckham)
+        match (str, optional): "prefix" to match locations starting with loc
+        q (str, optional): Full-text search over cafe name and location
+            instead of loc; every word is prefix-matched (e.g., ?q=sci caf).
+            Needs SQLite with FTS5 - otherwise returns 400.
 
     Returns:
         JSON: List of cafes in that location or error message
 
     Example Request:
         GET /search?loc=Peckham
+        GET /search?loc=peck&match=prefix
+        GET /search?q=science
 
     Example Response (Success):
         {
@@ -196,15 +759,42 @@ def search_cafe():
             }
         }
     """
-    # Get query parameter 'loc' from URL
-    query_location = request.args.get("loc")
-
-    # Search database for cafes in that location (case-insensitive)
-    result = db.session.execute(db.select(Cafe).where(Cafe.location == query_location))
-    all_cafes = result.scalars().all()
-
-    if all_cafes:
-        return jsonify(cafes=[cafe.to_dict() for cafe in all_cafes])
+    # Full-text mode: ?q= searches name and location through the FTS5 index
+    query_text = request.args.get("q")
+    if query_text is not None:
+        if not full_text_search_enabled:
+            return jsonify(
+                error={"Bad Request": "Full-text search is not available on this database."}
+            ), 400
+        match = fts_match_expression(query_text)
+        rows = []
+        if match:
+            columns = ", ".join(f"cafe.{name}" for name in CAFE_FIELDS)
+            stmt = (
+                text(
+                    f"SELECT {columns} FROM cafe JOIN {FTS_TABLE} ON {FTS_TABLE}.rowid = cafe.id "
+                    f"WHERE {FTS_TABLE} MATCH :match ORDER BY {FTS_TABLE}.rank"
+                )
+                .bindparams(match=match)
+                .columns(*CAFE_COLUMNS)
+            )
+            rows = db.session.execute(stmt).all()
+    else:
+        # Get query parameter 'loc' from URL
+        location_key = normalize_location(request.args.get("loc"))
+
+        # Search the indexed, accent/case-folded key instead of the raw column
+        if request.args.get("match") == "prefix" and location_key:
+            # A range scan on the index - LIKE 'x%' can't use it under SQLite's
+            # default case-insensitive LIKE
+            condition = Cafe.location_key.between(location_key, location_key + "\U0010ffff")
+        else:
+            condition = Cafe.location_key == location_key
+        stmt = db.select(*CAFE_COLUMNS).where(condition).order_by(Cafe.id)
+        rows = db.session.execute(stmt).all()
+
+    if rows:
+        return jsonify(cafes=[cafe_row_to_dict(row) for row in rows])
     else:
         return jsonify(error={"Not Found": "Sorry, we don't have a cafe at that location."}), 404
 
@@ -266,7 +856,9 @@ def add_cafe():
         )
 
         db.session.add(new_cafe)
+        version = bump_cafe_version()
         db.session.commit()
+        cafe_ids.note_change(version, added=new_cafe.id)
 
         return jsonify(
             response={"success": "Successfully added the new cafe."}
@@ -276,6 +868,221 @@ def add_cafe():
         return jsonify(error={"Bad Request": f"Failed to add cafe. {e!s}"}), 400
 
 
+# ==================== HTTP POST - Bulk Create ====================
+
+REQUIRED_TEXT_FIELDS = ("name", "map_url", "img_url", "location", "seats")
+BOOL_FIELDS = ("has_toilet", "has_wifi", "has_sockets", "can_take_calls")
+TRUE_STRINGS = {"true", "t", "yes", "y", "1"}
+FALSE_STRINGS = {"false", "f", "no", "n", "0", ""}
+
+
+def parse_bool(value):
+    """Parse a JSON/CSV boolean ("True", "no", 1, ...); missing means False."""
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    normalized = str(value).strip().lower()
+    if normalized in TRUE_STRINGS:
+        return True
+    if normalized in FALSE_STRINGS:
+        return False
+    raise ValueError(f"'{value}' is not a valid boolean")
+
+
+def validate_cafe_row(raw):
+    """
+    Validate one incoming cafe and return the column values to insert.
+
+    Raises:
+        ValueError: Describing the first problem found in the row.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("Each cafe must be an object.")
+
+    values = {}
+    for field in REQUIRED_TEXT_FIELDS:
+        value = raw.get(field)
+        if value is None or not str(value).strip():
+            raise ValueError(f"Missing required field '{field}'.")
+        values[field] = str(value).strip()
+    for field in BOOL_FIELDS:
+        try:
+            values[field] = parse_bool(raw.get(field))
+        except ValueError as e:
+            raise ValueError(f"Field '{field}': {e}.") from None
+    price = raw.get("coffee_price")
+    values["coffee_price"] = str(price).strip() if price not in (None, "") else None
+    return values
+
+
+def iter_bulk_rows():
+    """
+    Yield raw cafe rows from the request body without materialising CSVs.
+
+    Accepts a multipart CSV upload (field "file"), a text/csv body, or a
+    JSON array of objects.
+
+    Raises:
+        ValueError: If the body is in none of those formats.
+    """
+    upload = request.files.get("file")
+    if upload is not None:
+        yield from csv.DictReader(io.TextIOWrapper(upload.stream, encoding="utf-8-sig"))
+    elif request.mimetype == "text/csv":
+        yield from csv.DictReader(io.TextIOWrapper(request.stream, encoding="utf-8-sig"))
+    elif request.is_json:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            raise ValueError("Expected a JSON array of cafes.")
+        yield from rows
+    else:
+        raise ValueError("Send a JSON array of cafes or a CSV file.")
+
+
+def insert_cafe_chunk(chunk, errors):
+    """
+    Insert one chunk of validated ``(row_number, values)`` pairs.
+
+    Names that already exist are reported up front, the rest go in with a
+    single executemany and one commit. If the chunk still hits a constraint
+    (e.g. a concurrent insert), it is retried row by row so only the
+    offending rows fail.
+
+    Returns:
+        int: Number of cafes inserted.
+    """
+    names = [values["name"] for _, values in chunk]
+    existing = set(db.session.scalars(db.select(Cafe.name).where(Cafe.name.in_(names))))
+    fresh = []
+    for row_number, values in chunk:
+        if values["name"] in existing:
+            errors.append({"row": row_number, "error": f"Cafe '{values['name']}' already exists."})
+        else:
+            fresh.append((row_number, values))
+    if not fresh:
+        return 0
+
+    try:
+        db.session.execute(db.insert(Cafe), [values for _, values in fresh])
+        bump_cafe_version()
+        db.session.commit()
+        return len(fresh)
+    except exc.IntegrityError:
+        db.session.rollback()
+
+    inserted = 0
+    for row_number, values in fresh:
+        try:
+            db.session.execute(db.insert(Cafe), values)
+            bump_cafe_version()
+            db.session.commit()
+            inserted += 1
+        except exc.IntegrityError as e:
+            db.session.rollback()
+            errors.append({"row": row_number, "error": f"Failed to add cafe. {e.orig!s}"})
+    return inserted
+
+
+def bulk_insert_cafes(raw_rows, chunk_size=None):
+    """
+    Validate a stream of raw cafe rows and insert them in chunks.
+
+    Rows are validated as they arrive and flushed every ``chunk_size``
+    rows, so memory stays bounded by the chunk (plus the set of names
+    seen, used to catch duplicates within the batch).
+
+    Args:
+        raw_rows: Iterable of dicts, e.g. from iter_bulk_rows().
+        chunk_size: Rows per transaction; defaults to BULK_CHUNK_SIZE.
+
+    Returns:
+        tuple: ``(inserted_count, errors)`` where errors is a list of
+        ``{"row": <1-based row number>, "error": <message>}``.
+    """
+    chunk_size = chunk_size or BULK_CHUNK_SIZE
+    inserted, errors, chunk, seen_names = 0, [], [], set()
+
+    row_number = 0
+    try:
+        for row_number, raw in enumerate(raw_rows, start=1):
+            try:
+                values = validate_cafe_row(raw)
+            except ValueError as e:
+                errors.append({"row": row_number, "error": str(e)})
+                continue
+            if values["name"] in seen_names:
+                errors.append(
+                    {"row": row_number, "error": f"Duplicate name '{values['name']}' in batch."}
+                )
+                continue
+            seen_names.add(values["name"])
+
+            chunk.append((row_number, values))
+            if len(chunk) >= chunk_size:
+                inserted += insert_cafe_chunk(chunk, errors)
+                chunk = []
+    except (UnicodeDecodeError, csv.Error) as e:
+        # A corrupt upload: keep what was read so far and report where it broke
+        errors.append({"row": row_number + 1, "error": f"Unreadable input. {e!s}"})
+    if chunk:
+        inserted += insert_cafe_chunk(chunk, errors)
+
+    if inserted:
+        # Core inserts don't hand back ids cheaply - let /random reload them
+        cafe_ids.clear()
+    errors.sort(key=lambda error: error["row"])
+    return inserted, errors
+
+
+@app.route("/bulk-add", methods=["POST"])
+def bulk_add_cafes():
+    """
+    POST many cafes at once.
+
+    Accepts either a JSON array of cafe objects (same fields as /add, with
+    real JSON booleans or "True"/"False" strings) or a CSV file with a
+    header row - uploaded as multipart field "file" or sent as a text/csv
+    body. Rows are validated one by one and inserted in chunks of
+    BULK_CHUNK_SIZE, one transaction per chunk. Invalid or duplicate rows
+    are reported individually and don't stop the rest of the batch.
+
+    Returns:
+        JSON: Counts of inserted/failed rows plus the per-row errors.
+        201 if anything was inserted, 400 if nothing could be.
+
+    Example Request:
+        curl -X POST http://127.0.0.1:5000/bulk-add -F "file=@cafes.csv"
+
+    Example Response:
+        {
+            "response": {
+                "success": "Added 2 cafes.",
+                "inserted": 2,
+                "failed": 1
+            },
+            "errors": [
+                {"row": 3, "error": "Missing required field 'map_url'."}
+            ]
+        }
+    """
+    try:
+        inserted, errors = bulk_insert_cafes(iter_bulk_rows())
+    except ValueError as e:
+        return jsonify(error={"Bad Request": f"Failed to read cafes. {e!s}"}), 400
+
+    if not inserted and not errors:
+        return jsonify(error={"Bad Request": "No cafes to add."}), 400
+
+    status = 201 if inserted else 400
+    return jsonify(
+        response={
+            "success": f"Added {inserted} cafes.",
+            "inserted": inserted,
+            "failed": len(errors),
+        },
+        errors=errors,
+    ), status
+
+
 # ==================== HTTP PATCH - Update Record ====================
 
 
@@ -333,7 +1140,9 @@ def update_price(cafe_id):
 
     if cafe:
         cafe.coffee_price = new_price
+        version = bump_cafe_version()
         db.session.commit()
+        cafe_ids.note_change(version)
         return jsonify(response={"success": "Successfully updated the price."}), 200
     else:
         return jsonify(
@@ -393,7 +1202,9 @@ def delete_cafe(cafe_id):
 
     if cafe:
         db.session.delete(cafe)
+        version = bump_cafe_version()
         db.session.commit()
+        cafe_ids.note_change(version, removed=cafe_id)
         return jsonify(response={"success": "Successfully deleted the cafe."}), 200
     else:
         return jsonify(
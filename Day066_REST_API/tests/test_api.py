@@ -9,7 +9,11 @@ use.
 
 from __future__ import annotations
 
-import pytest  # noqa: F401  — fixtures (client, api_key, etc.) injected by conftest
+import csv
+import io
+import json
+
+import pytest
 
 
 class TestHome:
@@ -31,6 +35,31 @@ class TestGetRandom:
         assert "cafe" in body
         assert body["cafe"]["name"] == "Test Cafe"
 
+    def test_random_eventually_returns_every_cafe(self, client, add_cafes) -> None:
+        ids = set(add_cafes(3))
+        seen = {client.get("/random").get_json()["cafe"]["id"] for _ in range(100)}
+        assert seen == ids
+
+    def test_random_never_returns_deleted_cafe(self, client, add_cafes, api_key) -> None:
+        ids = add_cafes(2)
+        client.delete(f"/report-closed/{ids[0]}", query_string={"api-key": api_key})
+        for _ in range(20):
+            assert client.get("/random").get_json()["cafe"]["id"] == ids[1]
+
+    def test_random_recovers_from_out_of_band_delete(
+        self,
+        client,
+        add_sample_cafe,
+        app,
+        db,
+        cafe_class,
+    ) -> None:
+        client.get("/random")  # warm the id cache
+        with app.app_context():
+            db.session.execute(db.delete(cafe_class))
+            db.session.commit()
+        assert client.get("/random").status_code == 404
+
 
 class TestGetAll:
     def test_all_with_no_cafes_returns_empty_list(self, client) -> None:
@@ -47,6 +76,73 @@ class TestGetAll:
         assert cafes[0]["name"] == "Test Cafe"
 
 
+class TestGetAllPagination:
+    def test_limit_returns_first_page_and_cursor(self, client, add_cafes) -> None:
+        ids = sorted(add_cafes(5))
+        body = client.get("/all", query_string={"limit": 2}).get_json()
+        assert [cafe["id"] for cafe in body["cafes"]] == ids[:2]
+        assert body["next_after_id"] == ids[1]
+
+    def test_after_id_walks_every_page(self, client, add_cafes) -> None:
+        ids = sorted(add_cafes(5))
+        seen, cursor = [], 0
+        while cursor is not None:
+            body = client.get("/all", query_string={"after_id": cursor, "limit": 2}).get_json()
+            seen += [cafe["id"] for cafe in body["cafes"]]
+            cursor = body["next_after_id"]
+        assert seen == ids
+
+    def test_last_page_has_null_cursor(self, client, add_cafes) -> None:
+        ids = sorted(add_cafes(2))
+        body = client.get("/all", query_string={"after_id": ids[0], "limit": 5}).get_json()
+        assert [cafe["id"] for cafe in body["cafes"]] == ids[1:]
+        assert body["next_after_id"] is None
+
+    @pytest.mark.parametrize("params", [{"limit": 0}, {"limit": 5000}, {"after_id": "abc"}])
+    def test_invalid_page_args_return_400(self, client, params) -> None:
+        response = client.get("/all", query_string=params)
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+
+
+class TestGetAllStreaming:
+    def test_ndjson_streams_one_cafe_per_line(self, client, add_cafes) -> None:
+        ids = sorted(add_cafes(3))
+        response = client.get("/all", query_string={"format": "ndjson"})
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = response.get_data(as_text=True).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ids
+
+    def test_ndjson_via_accept_header_honours_cursor(self, client, add_cafes) -> None:
+        ids = sorted(add_cafes(3))
+        response = client.get(
+            "/all",
+            query_string={"after_id": ids[0]},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        lines = response.get_data(as_text=True).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ids[1:]
+
+    @pytest.mark.parametrize(
+        "accept",
+        [None, "*/*", "application/*", "application/json, application/x-ndjson"],
+    )
+    def test_generic_accept_headers_keep_the_json_body(self, client, add_cafes, accept) -> None:
+        ids = sorted(add_cafes(2))
+        headers = {} if accept is None else {"Accept": accept}
+        response = client.get("/all", headers=headers)
+        assert response.mimetype == "application/json"
+        assert sorted(cafe["id"] for cafe in response.get_json()["cafes"]) == ids
+
+    def test_accept_header_preferring_ndjson_streams(self, client, add_cafes) -> None:
+        add_cafes(2)
+        response = client.get(
+            "/all", headers={"Accept": "application/json;q=0.5, application/x-ndjson"}
+        )
+        assert response.mimetype == "application/x-ndjson"
+
+
 class TestSearch:
     def test_search_with_match_returns_200(self, client, add_sample_cafe) -> None:
         response = client.get("/search", query_string={"loc": "TestCity"})
@@ -65,6 +161,56 @@ class TestSearch:
         # query_location is None, so WHERE location = None matches nothing → 404
         assert response.status_code == 404
 
+    @pytest.mark.parametrize("loc", ["testcity", "TESTCITY", " TestCity ", "TéstCity"])
+    def test_search_ignores_case_and_accents(self, client, add_sample_cafe, loc) -> None:
+        response = client.get("/search", query_string={"loc": loc})
+        assert response.status_code == 200
+        assert response.get_json()["cafes"][0]["location"] == "TestCity"
+
+    def test_search_prefix_match(self, client, add_cafes) -> None:
+        add_cafes(3)  # locations "Town 0", "Town 1", "Town 2"
+        response = client.get("/search", query_string={"loc": "town", "match": "prefix"})
+        assert len(response.get_json()["cafes"]) == 3
+        exact = client.get("/search", query_string={"loc": "town"})
+        assert exact.status_code == 404
+
+    def test_search_key_is_not_serialized(self, client, add_sample_cafe) -> None:
+        cafe = client.get("/search", query_string={"loc": "TestCity"}).get_json()["cafes"][0]
+        assert "location_key" not in cafe
+
+    def test_search_uses_location_index(self, app, db) -> None:
+        with app.app_context():
+            plan = db.session.execute(
+                db.text("EXPLAIN QUERY PLAN SELECT id FROM cafe WHERE location_key = 'x'")
+            ).all()
+        assert "ix_cafe_location_key" in " ".join(row[-1] for row in plan)
+
+
+class TestFullTextSearch:
+    def test_matches_name_prefix(self, client, add_sample_cafe) -> None:
+        response = client.get("/search", query_string={"q": "tes caf"})
+        assert response.status_code == 200
+        assert response.get_json()["cafes"][0]["name"] == "Test Cafe"
+
+    def test_matches_location(self, client, add_cafes) -> None:
+        add_cafes(3)
+        cafes = client.get("/search", query_string={"q": "town"}).get_json()["cafes"]
+        assert len(cafes) == 3
+
+    def test_deleted_cafe_leaves_index(self, client, add_sample_cafe, api_key) -> None:
+        client.delete(f"/report-closed/{add_sample_cafe}", query_string={"api-key": api_key})
+        assert client.get("/search", query_string={"q": "test"}).status_code == 404
+
+    def test_operators_in_query_are_treated_as_text(self, client, sample_cafe) -> None:
+        name = 'Test" OR NEAR(* Cafe'
+        assert client.post("/add", data={**sample_cafe, "name": name}).status_code == 201
+        response = client.get("/search", query_string={"q": 'test" OR NEAR(*'})
+        assert response.status_code == 200
+        assert [cafe["name"] for cafe in response.get_json()["cafes"]] == [name]
+        # As an FTS5 OR this would match on "test"; as text, "plaza" must match too
+        response = client.get("/search", query_string={"q": 'test" OR plaza(*'})
+        assert response.status_code == 404
+
 
 class TestAddCafe:
     def test_add_valid_cafe_returns_201(self, client, sample_cafe) -> None:
@@ -85,6 +231,79 @@ class TestAddCafe:
         assert "error" in response.get_json()
 
 
+class TestBulkAdd:
+    @staticmethod
+    def make_rows(n, prefix="Bulk"):
+        return [
+            {
+                "name": f"{prefix} {i}",
+                "map_url": "https://example.com/maps",
+                "img_url": "https://example.com/img.jpg",
+                "location": "Péckham",
+                "seats": "10-20",
+                "has_toilet": True,
+                "has_wifi": "False",
+                "has_sockets": "yes",
+                "can_take_calls": False,
+                "coffee_price": "£2.80",
+            }
+            for i in range(n)
+        ]
+
+    def test_json_array_inserts_all_rows(self, client) -> None:
+        response = client.post("/bulk-add", json=self.make_rows(3))
+        assert response.status_code == 201
+        assert response.get_json()["response"]["inserted"] == 3
+        cafes = client.get("/search", query_string={"loc": "peckham"}).get_json()["cafes"]
+        assert len(cafes) == 3
+        assert cafes[0]["has_wifi"] is False
+        assert cafes[0]["has_sockets"] is True
+
+    def test_bad_rows_reported_without_aborting_batch(self, client, sample_cafe) -> None:
+        client.post("/add", data={**sample_cafe, "name": "Bulk 1"})
+        rows = self.make_rows(4)
+        del rows[0]["map_url"]
+        rows[2]["has_wifi"] = "maybe"
+        rows.append(dict(rows[3]))  # duplicate within the batch
+        body = client.post("/bulk-add", json=rows).get_json()
+        assert body["response"]["inserted"] == 1
+        assert [error["row"] for error in body["errors"]] == [1, 2, 3, 5]
+        assert "already exists" in body["errors"][1]["error"]
+
+    def test_batch_larger_than_one_chunk(self, client, sample_cafe) -> None:
+        client.post("/add", data={**sample_cafe, "name": "Bulk 1500"})
+        body = client.post("/bulk-add", json=self.make_rows(2500)).get_json()
+        assert body["response"]["inserted"] == 2499
+        assert body["errors"] == [{"row": 1501, "error": "Cafe 'Bulk 1500' already exists."}]
+
+    def test_csv_upload(self, client) -> None:
+        rows = self.make_rows(2)
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+        data = {"file": (io.BytesIO(buffer.getvalue().encode()), "cafes.csv")}
+        response = client.post("/bulk-add", data=data, content_type="multipart/form-data")
+        assert response.status_code == 201
+        assert len(client.get("/all").get_json()["cafes"]) == 2
+
+    def test_csv_body(self, client) -> None:
+        body = (
+            "name,map_url,img_url,location,seats,has_toilet,has_wifi,has_sockets,can_take_calls\n"
+            "Csv Cafe,https://m,https://i,Hackney,5,1,0,1,0\n"
+        )
+        response = client.post("/bulk-add", data=body, content_type="text/csv")
+        assert response.status_code == 201
+        assert client.get("/random").get_json()["cafe"]["name"] == "Csv Cafe"
+
+    def test_unsupported_payload_returns_400(self, client) -> None:
+        assert client.post("/bulk-add", json={"name": "not a list"}).status_code == 400
+        assert client.post("/bulk-add", data="x", content_type="text/plain").status_code == 400
+
+    def test_empty_batch_returns_400(self, client) -> None:
+        assert client.post("/bulk-add", json=[]).status_code == 400
+
+
 class TestUpdatePrice:
     def test_update_with_correct_api_key(
         self,
@@ -169,6 +388,72 @@ class TestDeleteCafe:
         assert response.status_code == 403
 
 
+class TestConditionalGet:
+    def test_all_sends_etag_and_last_modified(self, client, add_sample_cafe) -> None:
+        response = client.get("/all")
+        assert response.headers["ETag"]
+        assert response.last_modified is not None
+        assert response.cache_control.no_cache
+
+    def test_matching_etag_returns_304(self, client, add_sample_cafe) -> None:
+        etag = client.get("/all").headers["ETag"]
+        response = client.get("/all", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.get_data() == b""
+
+    def test_if_modified_since_returns_304(self, client, add_sample_cafe) -> None:
+        last_modified = client.get("/search", query_string={"loc": "TestCity"}).headers[
+            "Last-Modified"
+        ]
+        response = client.get(
+            "/search",
+            query_string={"loc": "TestCity"},
+            headers={"If-Modified-Since": last_modified},
+        )
+        assert response.status_code == 304
+
+    def test_etag_depends_on_query(self, client, add_sample_cafe) -> None:
+        etag = client.get("/all").headers["ETag"]
+        response = client.get("/all", query_string={"limit": 1}, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("write", ["add", "update", "delete"])
+    def test_writes_change_the_etag(self, client, add_sample_cafe, sample_cafe, api_key, write):
+        etag = client.get("/all").headers["ETag"]
+        if write == "add":
+            client.post("/add", data={**sample_cafe, "name": "Another Cafe"})
+        elif write == "update":
+            client.patch(
+                f"/update-price/{add_sample_cafe}",
+                query_string={"new_price": "£9.99", "api-key": api_key},
+            )
+        else:
+            client.delete(f"/report-closed/{add_sample_cafe}", query_string={"api-key": api_key})
+        response = client.get("/all", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_repeat_reads_are_served_from_cache(
+        self,
+        client,
+        add_sample_cafe,
+        app,
+        db,
+        cafe_class,
+    ) -> None:
+        first = client.get("/all").get_json()
+        # A write that bypasses the API (and so the version counter) isn't
+        # seen: the second response is replayed from the LRU
+        with app.app_context():
+            db.session.execute(db.update(cafe_class).values(coffee_price="£0.01"))
+            db.session.commit()
+        assert client.get("/all").get_json() == first
+
+    def test_random_etag_identifies_the_cafe(self, client, add_sample_cafe) -> None:
+        etag = client.get("/random").headers["ETag"]
+        assert client.get("/random", headers={"If-None-Match": etag}).status_code == 304
+
+
 class TestConstants:
     def test_default_api_key(self, api_key) -> None:
         # main.py falls back to a default if API_KEY env var is unset
@@ -0,0 +1,29 @@
+"""Smoke tests for the Day 66 micro-benchmarks.
+
+Each subcommand runs in its own interpreter, as it would from the
+command line, at a size small enough to finish in about a second.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+DAY_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("benchmark", ["random", "search", "serialize"])
+def test_benchmark_runs_at_a_tiny_size(benchmark: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "benchmarks.py", benchmark, "--sizes", "20", "--repeat", "2"],
+        cwd=DAY_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    # a header line and one row of timings for the single size
+    assert result.stdout.splitlines()[-1].split()[0] == "20"
@@ -22,6 +22,12 @@ from wtforms.validators import DataRequired, URL
 from flask_ckeditor import CKEditor, CKEditorField
 from datetime import date
 import os
+import sys
+from pathlib import Path
+
+# Shared SQLite engine profile (WAL, pool sizing, read-only bind) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.sqlite_engine import init_sqlite_db
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -37,9 +43,8 @@ Bootstrap(app)
 class Base(DeclarativeBase):
     pass
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///posts.db'
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get('DATABASE_URI', 'sqlite:///posts.db'))
 
 
 # ==================== DATABASE MODEL ====================
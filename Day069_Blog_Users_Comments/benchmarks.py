@@ -0,0 +1,227 @@
+"""
+Page-render benchmarks for the Day 69 blog.
+
+Seeds a throwaway SQLite database with synthetic users, posts and
+comments and times full requests through the Flask test client. The
+post table grows between sizes instead of being rebuilt.
+
+Usage:
+    python benchmarks.py index
+    python benchmarks.py index --sizes 1000 10000
+    python benchmarks.py post --sizes 50 200 500
+    python benchmarks.py profile
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_SIZES = {"index": [1_000, 10_000], "post": [50, 200, 500], "profile": [500]}
+SEED_BATCH_SIZE = 5_000
+N_USERS = 100
+
+
+def load_app(db_path):
+    """Import main.py against a scratch database and return the module."""
+    os.environ["DATABASE_URI"] = f"sqlite:///{db_path}"
+    import main
+
+    return main
+
+
+def seed_users(main):
+    """Insert ``N_USERS`` commenters (user 1 is the admin who writes the posts)."""
+    db = main.db
+    db.session.execute(
+        db.insert(main.User),
+        [
+            {"email": f"Reader{i}@Example.com", "password": "x", "name": f"Reader {i}"}
+            for i in range(1, N_USERS + 1)
+        ],
+    )
+    db.session.commit()
+
+
+def grow_posts(main, target):
+    """Insert synthetic posts until the table holds ``target`` rows."""
+    db, BlogPost = main.db, main.BlogPost
+    current = db.session.scalar(db.select(db.func.count()).select_from(BlogPost))
+    for start in range(current, target, SEED_BATCH_SIZE):
+        rows = [
+            {
+                "title": f"Post {i:06d}",
+                "subtitle": f"Subtitle {i}",
+                "date": "January 01, 2024",
+                "body": "<p>" + "Lorem ipsum dolor sit amet. " * 40 + "</p>",
+                "img_url": "https://example.com/img.jpg",
+                "author_id": 1,
+            }
+            for i in range(start, min(start + SEED_BATCH_SIZE, target))
+        ]
+        db.session.execute(db.insert(BlogPost), rows)
+        db.session.commit()
+
+
+def add_comments(main, post_id, n):
+    """Give ``post_id`` ``n`` comments spread over all users."""
+    db = main.db
+    db.session.execute(
+        db.insert(main.Comment),
+        [
+            {"text": f"<p>Comment {c}</p>", "author_id": c % N_USERS + 1, "post_id": post_id}
+            for c in range(n)
+        ],
+    )
+    db.session.commit()
+
+
+def time_call(func, repeat):
+    """Call ``func`` ``repeat`` times and return the median wall time in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def get(client, url):
+    """GET ``url`` and fail loudly on anything but a 200."""
+    response = client.get(url)
+    assert response.status_code == 200, (url, response.status_code)
+    return response
+
+
+# ==================== BENCHMARKS ====================
+
+
+def bench_index(main, sizes, repeat):
+    """Every post on one page vs numbered pages vs keyset ("Older Posts") pages."""
+    db, BlogPost = main.db, main.BlogPost
+    client = main.app.test_client()
+
+    def legacy():
+        # The front page before pagination: every post with its author
+        with main.app.test_request_context("/"):
+            posts = db.session.execute(main.newest_posts()).scalars().all()
+            main.render_template("index.html", all_posts=posts, pagination=None)
+            db.session.remove()
+
+    print(
+        f"{'posts':>8} {'all posts (ms)':>16} {'page 1 (ms)':>13} "
+        f"{'middle page (ms)':>18} {'keyset middle (ms)':>20}"
+    )
+    for size in sizes:
+        grow_posts(main, size)
+        middle = size // main.POSTS_PER_PAGE // 2
+        # keyset page starting at the same post as the numbered middle page
+        before = db.session.scalar(db.select(db.func.max(BlogPost.id))) + 1 - (
+            middle - 1
+        ) * main.POSTS_PER_PAGE
+        db.session.remove()
+        legacy_ms = time_call(legacy, max(1, min(repeat, 20_000 // size)))
+        timings = [
+            time_call(lambda url=url: get(client, url), repeat)
+            for url in ("/", f"/?page={middle}", f"/?before={before}")
+        ]
+        print(f"{size:>8,} {legacy_ms:>16.2f} " + " ".join(
+            f"{ms:>{width}.2f}" for ms, width in zip(timings, (13, 18, 20), strict=True)
+        ))
+
+
+def bench_post(main, sizes, repeat):
+    """A post page with N comments: rendering the thread vs the fragment cache."""
+    db = main.db
+    client = main.app.test_client()
+    grow_posts(main, len(sizes))
+    post_ids = db.session.scalars(db.select(main.BlogPost.id).order_by(main.BlogPost.id)).all()
+
+    def cold(url):
+        main.fragment_cache.clear()
+        return get(client, url)
+
+    print(f"{'comments':>10} {'uncached (ms)':>15} {'cached (ms)':>13}")
+    for size, post_id in zip(sizes, post_ids, strict=False):
+        add_comments(main, post_id, size)
+        url = f"/post/{post_id}"
+        cold_ms = time_call(lambda url=url: cold(url), repeat)
+        get(client, url)
+        warm_ms = time_call(lambda url=url: get(client, url), repeat)
+        print(f"{size:>10,} {cold_ms:>15.2f} {warm_ms:>13.2f}")
+
+
+def bench_profile(main, sizes, repeat):
+    """Gravatar memo and user cache for a logged-in view of a post with N comments."""
+    db = main.db
+    client = main.app.test_client()
+    with client.session_transaction() as session:
+        session["_user_id"] = "2"
+    grow_posts(main, len(sizes))
+    post_ids = db.session.scalars(db.select(main.BlogPost.id).order_by(main.BlogPost.id)).all()
+
+    def avatars(emails, memo):
+        gravatar = main.gravatar_url if memo else main.gravatar_url.__wrapped__
+        for email in emails:
+            gravatar(email)
+
+    def load_user(cached):
+        if not cached:
+            main.user_cache.clear()
+        main.load_user("2")
+        db.session.remove()
+
+    print(
+        f"{'comments':>10} {'avatars hashed':>15} {'avatars memo':>13} "
+        f"{'load_user query':>16} {'load_user cached':>17} {'thread render':>14} {'page':>8}"
+    )
+    for size, post_id in zip(sizes, post_ids, strict=False):
+        add_comments(main, post_id, size)
+        comments = main.load_comments(post_id)
+        emails = [comment.comment_author.email for comment in comments]
+        url = f"/post/{post_id}"
+
+        def render_thread(comments=comments):
+            with main.app.test_request_context(url):
+                main.render_template("comments.html", comments=comments)
+
+        get(client, url)  # warm the fragment and both caches
+        timings = [
+            time_call(lambda memo=memo: avatars(emails, memo), repeat) for memo in (False, True)
+        ]
+        timings += [
+            time_call(lambda cached=cached: load_user(cached), repeat) for cached in (False, True)
+        ]
+        timings += [time_call(render_thread, repeat), time_call(lambda: get(client, url), repeat)]
+        widths = (15, 13, 16, 17, 14, 8)
+        print(f"{size:>10,} " + " ".join(
+            f"{ms:>{width}.3f}" for ms, width in zip(timings, widths, strict=True)
+        ))
+
+
+BENCHMARKS = {
+    "index": bench_index,
+    "post": bench_post,
+    "profile": bench_profile,
+}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=50, help="timed calls per size")
+    args = parser.parse_args()
+    sizes = sorted(args.sizes or DEFAULT_SIZES[args.benchmark])
+
+    with tempfile.TemporaryDirectory(prefix="day069_bench_") as tmp:
+        main = load_app(Path(tmp) / "bench.db")
+        with main.app.app_context():
+            seed_users(main)
+            BENCHMARKS[args.benchmark](main, sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,160 @@
+"""Test configuration for the Day 69 blog.
+
+Points the app at a temp-file database, then loads this day's
+``main.py`` under a per-day module name so pytest collecting tests
+from multiple days doesn't return a previously-cached ``main``
+module. Provides a ``seed`` factory for posts/comments and an
+``assert_queries`` fixture that fails a block running more SQL than
+expected.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import warnings
+from contextlib import contextmanager
+from pathlib import Path
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR))
+
+# Must be set before main.py is executed - it reads DATABASE_URI at import
+_TMP_DB_DIR = tempfile.mkdtemp(prefix="day069_test_")
+os.environ["DATABASE_URI"] = f"sqlite:///{os.path.join(_TMP_DB_DIR, 'test.db')}"
+
+_MODULE_NAME = f"_main_{THIS_DIR.name}"
+_spec = importlib.util.spec_from_file_location(_MODULE_NAME, THIS_DIR / "main.py")
+_mod = importlib.util.module_from_spec(_spec)
+sys.modules[_MODULE_NAME] = _mod
+with warnings.catch_warnings():
+    # Flask-CKEditor warns at import when the optional bleach package is missing
+    warnings.filterwarnings("ignore", message='The "bleach" library', category=UserWarning)
+    _spec.loader.exec_module(_mod)
+
+APP = _mod.app
+DB = _mod.db
+APP.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+
+import pytest  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Flask test client for making requests to the app."""
+    return APP.test_client()
+
+
+@pytest.fixture
+def app():
+    """The Flask app (for app_context() in tests that query the db directly)."""
+    return APP
+
+
+@pytest.fixture
+def db():
+    """SQLAlchemy db instance."""
+    return DB
+
+
+@pytest.fixture
+def models():
+    """The main module, for its User / BlogPost / Comment classes."""
+    return _mod
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    """Drop and recreate all tables before each test for isolation."""
+    with APP.app_context():
+        DB.drop_all()
+        DB.create_all()
+    _mod.fragment_cache.clear()
+    _mod.user_cache.clear()
+    _mod.gravatar_url.cache_clear()
+    APP.config["SQL_QUERY_COUNTER"] = False
+    yield
+
+
+@pytest.fixture
+def seed():
+    """Factory: ``n_posts`` posts with ``n_comments`` comments each from ``n_users`` users.
+
+    User 1 (the admin) writes the posts. Returns the post ids.
+    """
+
+    def _seed(n_posts=1, n_comments=0, n_users=5):
+        with APP.app_context():
+            users = [
+                _mod.User(email=f"User{i}@Example.com", password="x", name=f"User {i}")
+                for i in range(1, n_users + 1)
+            ]
+            posts = [
+                _mod.BlogPost(
+                    title=f"Post {p}",
+                    subtitle=f"Subtitle {p}",
+                    date="January 01, 2024",
+                    body=f"<p>Body of post {p}</p>",
+                    img_url="https://example.com/img.jpg",
+                    author=users[0],
+                )
+                for p in range(n_posts)
+            ]
+            DB.session.add_all(users + posts)
+            for post in posts:
+                DB.session.add_all(
+                    _mod.Comment(
+                        text=f"<p>Comment {c}</p>",
+                        comment_author=users[c % n_users],
+                        parent_post=post,
+                    )
+                    for c in range(n_comments)
+                )
+            DB.session.commit()
+            return [post.id for post in posts]
+
+    return _seed
+
+
+@pytest.fixture
+def login(client):
+    """Log the test client in as the user with the given id."""
+
+    def _login(user_id=1):
+        with client.session_transaction() as session:
+            session["_user_id"] = str(user_id)
+            session["_fresh"] = True
+
+    return _login
+
+
+@pytest.fixture
+def assert_queries():
+    """Context manager failing if the block runs more than ``expected`` statements.
+
+    Yields the list of executed SQL so tests can inspect it further.
+    """
+
+    @contextmanager
+    def _assert_queries(expected):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with APP.app_context():
+            engines = list(DB.engines.values())
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for engine in engines:
+                event.remove(engine, "before_cursor_execute", record)
+        assert len(statements) <= expected, (
+            f"expected at most {expected} queries, ran {len(statements)}:\n"
+            + "\n".join(statements)
+        )
+
+    return _assert_queries
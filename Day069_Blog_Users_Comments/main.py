@@ -1,16 +1,28 @@
 from datetime import date
-from flask import Flask, abort, render_template, redirect, url_for, flash
+from flask import Flask, abort, render_template, redirect, url_for, flash, g, has_request_context, request
 from flask_bootstrap import Bootstrap5
 from flask_ckeditor import CKEditor
 from flask_login import UserMixin, login_user, LoginManager, current_user, logout_user, login_required
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import relationship, DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import Integer, String, Text, ForeignKey
-from functools import wraps
+from sqlalchemy.orm import relationship, DeclarativeBase, Mapped, mapped_column, joinedload
+from sqlalchemy import Integer, String, Text, ForeignKey, event, text
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from markupsafe import Markup
 from werkzeug.security import generate_password_hash, check_password_hash
 from forms import CreatePostForm, RegisterForm, LoginForm, CommentForm
 import hashlib
 import os
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+# Shared SQLite engine profile (WAL, pool sizing, read-only bind) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.sqlite_engine import init_sqlite_db
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-fallback-key')
@@ -25,7 +37,8 @@ login_manager.login_view = 'login'
 
 @login_manager.user_loader
 def load_user(user_id):
-    return db.get_or_404(User, user_id)
+    # Served from user_cache; a deleted user's session just becomes anonymous
+    return cached_user(int(user_id)) if user_id.isdigit() else None
 
 
 # CREATE DATABASE
@@ -33,9 +46,8 @@ class Base(DeclarativeBase):
     pass
 
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///blog.db'
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get('DATABASE_URI', 'sqlite:///blog.db'))
 
 
 # CONFIGURE TABLES
@@ -60,6 +72,11 @@ class BlogPost(db.Model):
     date: Mapped[str] = mapped_column(String(250), nullable=False)
     body: Mapped[str] = mapped_column(Text, nullable=False)
     img_url: Mapped[str] = mapped_column(String(250), nullable=False)
+    # Bumped on every edit and new comment; part of the fragment cache key
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Also in the cache key: SQLite reuses the id of the newest post once it's
+    # deleted, and the post that gets it must not match the old post's fragments
+    uid: Mapped[str] = mapped_column(String(32), nullable=False, default=lambda: uuid.uuid4().hex)
     
     # Foreign Key to link to User (author_id)
     author_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
@@ -67,7 +84,8 @@ class BlogPost(db.Model):
     author = relationship("User", back_populates="posts")
     
     # One to Many relationship with Comment (One Post can have many comments)
-    comments = relationship("Comment", back_populates="parent_post")
+    # Comments go with their post: post_id is NOT NULL, so they can't be orphaned
+    comments = relationship("Comment", back_populates="parent_post", cascade="all, delete-orphan")
 
 
 class Comment(db.Model):
@@ -81,17 +99,269 @@ class Comment(db.Model):
     comment_author = relationship("User", back_populates="comments")
     
     # Foreign Key to link to BlogPost (post_id)
-    post_id: Mapped[int] = mapped_column(Integer, ForeignKey("blog_posts.id"))
+    post_id: Mapped[int] = mapped_column(Integer, ForeignKey("blog_posts.id"), index=True)
     # Reference to the BlogPost object
     parent_post = relationship("BlogPost", back_populates="comments")
 
 
+def upgrade_post_revision(connection):
+    """Add blog_posts.revision, blog_posts.uid and the comments.post_id index to older databases."""
+    columns = {column["name"] for column in db.inspect(connection).get_columns("blog_posts")}
+    if "revision" not in columns:
+        connection.execute(text("ALTER TABLE blog_posts ADD COLUMN revision INTEGER NOT NULL DEFAULT 0"))
+    if "uid" not in columns:
+        connection.execute(text("ALTER TABLE blog_posts ADD COLUMN uid VARCHAR(32) NOT NULL DEFAULT ''"))
+        connection.execute(text("UPDATE blog_posts SET uid = lower(hex(randomblob(16))) WHERE uid = ''"))
+    for index in Comment.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
 with app.app_context():
     db.create_all()
+    with db.engine.begin() as connection:
+        upgrade_post_revision(connection)
+
+
+USER_CACHE_MAX_ENTRIES = 1024
+# How long another worker may keep serving a profile after it changes
+USER_CACHE_TTL = 60  # seconds
+GRAVATAR_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class UserIdentity(UserMixin):
+    """
+    Read-only snapshot of a User, used as Flask-Login's current_user.
+
+    It outlives the request that loaded it, so unlike a User row it can't
+    try to lazy-load from a closed session or end up in two sessions.
+    """
+
+    id: int
+    email: str
+    name: str
+
+
+class UserCache:
+    """Thread-safe LRU of UserIdentity objects that expire after ``ttl`` seconds."""
+
+    def __init__(self, max_entries, ttl, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        """Return the cached identity for ``user_id``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            identity, expires = entry
+            if expires <= self._clock():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return identity
+
+    def put(self, identity):
+        """Cache ``identity`` for ``ttl`` seconds, evicting the least recently used."""
+        with self._lock:
+            self._entries[identity.id] = (identity, self._clock() + self.ttl)
+            self._entries.move_to_end(identity.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id):
+        """Forget one user (after a profile change)."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Drop every cached identity."""
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL)
+
+
+def cached_user(user_id):
+    """UserIdentity for ``user_id`` from user_cache, loading it on a miss; None if gone."""
+    identity = user_cache.get(user_id)
+    if identity is None:
+        query = db.select(User.id, User.email, User.name).where(User.id == user_id)
+        row = db.session.execute(query).first()
+        if row is None:
+            return None
+        identity = UserIdentity(*row)
+        user_cache.put(identity)
+    return identity
+
+
+def rekey_comment_threads(connection, user_id):
+    """
+    Bump the revision of every post ``user_id`` commented on.
+
+    That changes the posts' fragment cache keys in every worker, so no
+    cached thread keeps showing the user's old name or avatar.
+    """
+    commented = db.select(Comment.post_id).where(Comment.author_id == user_id)
+    connection.execute(
+        db.update(BlogPost).where(BlogPost.id.in_(commented)).values(revision=BlogPost.revision + 1)
+    )
+
+
+@event.listens_for(User, "after_update")
+def user_profile_changed(mapper, connection, target):
+    """Invalidate caches showing this user when their name or email changes."""
+    user_cache.discard(target.id)
+    state = db.inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("name", "email")):
+        rekey_comment_threads(connection, target.id)
+
+
+@event.listens_for(User, "after_delete")
+def user_deleted(mapper, connection, target):
+    """Invalidate caches showing this user once they're deleted."""
+    user_cache.discard(target.id)
+    rekey_comment_threads(connection, target.id)
+
+
+# Eager-loading strategies for the pages that walk relationships. Lazy
+# loading would fire one query per post for post.author on the index,
+# and one per comment for comment.comment_author on a post page.
+# Authors are joined into the same SELECT. A post's comments are loaded
+# by load_comments() only when their rendered fragment isn't cached.
+POST_LIST_OPTIONS = (joinedload(BlogPost.author),)
+POST_PAGE_OPTIONS = (joinedload(BlogPost.author),)
+COMMENT_OPTIONS = (joinedload(Comment.comment_author),)
+POSTS_PER_PAGE = 10
+FRAGMENT_CACHE_MAX_ENTRIES = 1024
+
+
+def newest_posts():
+    """SELECT for the front page: newest first, authors joined."""
+    return db.select(BlogPost).options(*POST_LIST_OPTIONS).order_by(BlogPost.id.desc())
+
+
+def load_comments(post_id):
+    """A post's comments in posting order, with their authors."""
+    query = (
+        db.select(Comment)
+        .where(Comment.post_id == post_id)
+        .options(*COMMENT_OPTIONS)
+        .order_by(Comment.id)
+    )
+    return db.session.execute(query).scalars().all()
+
+
+class FragmentCache:
+    """
+    Thread-safe LRU of rendered HTML fragments.
+
+    Keys end with the post's uid and revision, so after an edit or a new
+    comment no worker process serves the old fragment: the key just
+    changes. The uid covers a deleted post whose id SQLite hands to the
+    next new post, which starts again at revision 0.
+    drop_post() frees the stale entries early in the process that made
+    the change.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached fragment for ``key``, or None."""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def put(self, key, html):
+        """Store a fragment, evicting the least recently used past max_entries."""
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def drop_post(self, post_id):
+        """Forget every fragment of one post (keys are ``(kind, post_id, uid, revision)``)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == post_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every cached fragment."""
+        with self._lock:
+            self._entries.clear()
+
 
+fragment_cache = FragmentCache(FRAGMENT_CACHE_MAX_ENTRIES)
 
-# Custom Gravatar filter
+
+def cached_fragment(key, render):
+    """Return the fragment cached under ``key``, rendering and storing it on a miss."""
+    html = fragment_cache.get(key)
+    if html is None:
+        html = Markup(render())
+        fragment_cache.put(key, html)
+    return html
+
+
+# Debug-toolbar-style SQL counter. With SQL_QUERY_COUNTER=true every
+# response carries X-SQL-Queries and a Server-Timing entry, which the
+# browser devtools show under Network > Timing.
+app.config['SQL_QUERY_COUNTER'] = os.environ.get('SQL_QUERY_COUNTER', 'false').lower() == 'true'
+
+
+def _counting():
+    return has_request_context() and 'sql_queries' in g
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if _counting():
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if _counting() and conn.info.get('query_start'):
+        g.sql_queries += 1
+        g.sql_seconds += time.perf_counter() - conn.info['query_start'].pop()
+
+
+with app.app_context():
+    for engine in db.engines.values():
+        event.listen(engine, 'before_cursor_execute', _start_query_timer)
+        event.listen(engine, 'after_cursor_execute', _stop_query_timer)
+
+
+@app.before_request
+def start_query_counter():
+    if app.config['SQL_QUERY_COUNTER']:
+        g.sql_queries = 0
+        g.sql_seconds = 0.0
+
+
+@app.after_request
+def report_query_count(response):
+    if 'sql_queries' in g:
+        response.headers['X-SQL-Queries'] = str(g.sql_queries)
+        response.headers.add(
+            'Server-Timing', f'sql;dur={g.sql_seconds * 1000:.2f};desc="{g.sql_queries} queries"'
+        )
+    return response
+
+
+# Custom Gravatar filter. The URL depends only on the email, so a bounded
+# memo is always correct: a changed email is simply a different key.
 @app.template_filter('gravatar')
+@lru_cache(maxsize=GRAVATAR_CACHE_SIZE)
 def gravatar_url(email, size=100):
     """Generate gravatar URL from email."""
     email_hash = hashlib.md5(email.lower().encode('utf-8')).hexdigest()
@@ -179,14 +449,37 @@ def logout():
 
 @app.route('/')
 def get_all_posts():
-    result = db.session.execute(db.select(BlogPost))
-    posts = result.scalars().all()
-    return render_template("index.html", all_posts=posts, current_user=current_user)
+    # ?page=<n> is a numbered page; ?before=<id> is a keyset page, which
+    # "Older Posts" uses because it costs the same at any depth
+    before = request.args.get('before', type=int)
+    if before is not None:
+        query = newest_posts().where(BlogPost.id < before).limit(POSTS_PER_PAGE + 1)
+        posts = db.session.execute(query).scalars().all()
+        pagination = None
+        has_older = len(posts) > POSTS_PER_PAGE
+        posts = posts[:POSTS_PER_PAGE]
+    else:
+        pagination = db.paginate(
+            newest_posts(),
+            page=request.args.get('page', 1, type=int),
+            per_page=POSTS_PER_PAGE,
+            error_out=False,
+        )
+        posts = pagination.items
+        has_older = pagination.has_next
+    older_before = posts[-1].id if has_older else None
+    return render_template(
+        "index.html",
+        all_posts=posts,
+        pagination=pagination,
+        older_before=older_before,
+        current_user=current_user,
+    )
 
 
 @app.route("/post/<int:post_id>", methods=["GET", "POST"])
 def show_post(post_id):
-    requested_post = db.get_or_404(BlogPost, post_id)
+    requested_post = db.get_or_404(BlogPost, post_id, options=POST_PAGE_OPTIONS)
     comment_form = CommentForm()
     
     # Only allow logged-in users to comment
@@ -195,16 +488,30 @@ def show_post(post_id):
             flash("You need to login or register to comment.")
             return redirect(url_for("login"))
         
+        # Set the foreign keys rather than the relationships, so adding a
+        # comment doesn't load the post's and the user's comment lists
         new_comment = Comment(
             text=comment_form.comment_text.data,
-            comment_author=current_user,
-            parent_post=requested_post
+            author_id=current_user.id,
+            post_id=requested_post.id
         )
+        requested_post.revision = BlogPost.revision + 1
         db.session.add(new_comment)
         db.session.commit()
+        fragment_cache.drop_post(post_id)
         return redirect(url_for("show_post", post_id=post_id))
     
-    return render_template("post.html", post=requested_post, current_user=current_user, form=comment_form)
+    comments_html = cached_fragment(
+        ("comments", requested_post.id, requested_post.uid, requested_post.revision),
+        lambda: render_template("comments.html", comments=load_comments(requested_post.id)),
+    )
+    return render_template(
+        "post.html",
+        post=requested_post,
+        comments_html=comments_html,
+        current_user=current_user,
+        form=comment_form,
+    )
 
 
 @app.route("/new-post", methods=["GET", "POST"])
@@ -217,7 +524,7 @@ def add_new_post():
             subtitle=form.subtitle.data,
             body=form.body.data,
             img_url=form.img_url.data,
-            author=current_user,
+            author_id=current_user.id,
             date=date.today().strftime("%B %d, %Y")
         )
         db.session.add(new_post)
@@ -242,7 +549,9 @@ def edit_post(post_id):
         post.subtitle = edit_form.subtitle.data
         post.img_url = edit_form.img_url.data
         post.body = edit_form.body.data
+        post.revision = BlogPost.revision + 1
         db.session.commit()
+        fragment_cache.drop_post(post_id)
         return redirect(url_for("show_post", post_id=post.id))
     return render_template("make-post.html", form=edit_form, is_edit=True, current_user=current_user)
 
@@ -253,6 +562,7 @@ def delete_post(post_id):
     post_to_delete = db.get_or_404(BlogPost, post_id)
     db.session.delete(post_to_delete)
     db.session.commit()
+    fragment_cache.drop_post(post_id)
     return redirect(url_for('get_all_posts'))
 
 
@@ -0,0 +1,298 @@
+"""Tests for the Day 69 blog: page content and SQL round-trips per request."""
+
+from __future__ import annotations
+
+from flask_login import current_user
+
+
+class TestIndex:
+    def test_lists_posts_with_author(self, client, seed) -> None:
+        seed(n_posts=3)
+        html = client.get("/").get_data(as_text=True)
+        assert "Post 0" in html and "Post 2" in html
+        assert "User 1" in html
+
+    def test_queries_dont_grow_with_post_count(self, client, seed, assert_queries) -> None:
+        seed(n_posts=50, n_users=10)
+        # COUNT(*) for the page links, then one page of posts with authors
+        with assert_queries(2):
+            assert client.get("/").status_code == 200
+        with assert_queries(1):
+            assert client.get("/", query_string={"before": 30}).status_code == 200
+
+
+class TestPagination:
+    def test_first_page_is_newest_posts(self, client, seed) -> None:
+        seed(n_posts=25)
+        html = client.get("/").get_data(as_text=True)
+        assert html.index("Post 24") < html.index("Post 15")
+        assert "Post 14<" not in html
+
+    def test_numbered_pages(self, client, seed) -> None:
+        seed(n_posts=25)
+        html = client.get("/", query_string={"page": 3}).get_data(as_text=True)
+        assert "Post 4<" in html and "Post 0<" in html
+        assert "Post 5<" not in html
+        assert 'href="/?page=2"' in html
+
+    def test_out_of_range_page_is_empty(self, client, seed) -> None:
+        seed(n_posts=5)
+        response = client.get("/", query_string={"page": 9})
+        assert response.status_code == 200
+        assert "Post 0" not in response.get_data(as_text=True)
+
+    def test_older_posts_link_walks_keyset_pages(self, client, seed) -> None:
+        ids = seed(n_posts=25)
+        html = client.get("/").get_data(as_text=True)
+        assert f"/?before={ids[15]}" in html
+        html = client.get("/", query_string={"before": ids[15]}).get_data(as_text=True)
+        assert "Post 14<" in html and "Post 5<" in html and "Post 15<" not in html
+        html = client.get("/", query_string={"before": ids[5]}).get_data(as_text=True)
+        assert "Post 0<" in html
+        assert "Older Posts" not in html
+
+    def test_single_page_has_no_page_links(self, client, seed) -> None:
+        seed(n_posts=3)
+        html = client.get("/").get_data(as_text=True)
+        assert "page-link" not in html and "Older Posts" not in html
+
+
+class TestShowPost:
+    def test_renders_comments_with_authors(self, client, seed) -> None:
+        (post_id,) = seed(n_comments=3, n_users=3)
+        html = client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert "Body of post 0" in html
+        for i in range(3):
+            assert f"Comment {i}" in html
+            assert f"User {i + 1}</h5>" in html
+        assert html.count("gravatar.com/avatar/") == 3
+
+    def test_constant_queries_with_200_comments(self, client, seed, assert_queries) -> None:
+        (post_id,) = seed(n_comments=200, n_users=50)
+        # post + author, then comments + their authors (both joined)
+        with assert_queries(2):
+            assert client.get(f"/post/{post_id}").status_code == 200
+        # comment thread now comes from the fragment cache
+        with assert_queries(1):
+            assert client.get(f"/post/{post_id}").status_code == 200
+
+    def test_missing_post_is_404(self, client) -> None:
+        assert client.get("/post/999").status_code == 404
+
+    def test_logged_in_comment_is_saved(self, client, seed, login) -> None:
+        (post_id,) = seed()
+        login(2)
+        response = client.post(f"/post/{post_id}", data={"comment_text": "Nice post"})
+        assert response.status_code == 302
+        html = client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert "Nice post" in html and "User 2</h5>" in html
+
+    def test_logged_in_page_adds_only_the_user_lookup(
+        self, client, seed, login, assert_queries
+    ) -> None:
+        (post_id,) = seed(n_comments=20)
+        login(1)
+        with assert_queries(3):
+            assert client.get(f"/post/{post_id}").status_code == 200
+
+
+class TestFragmentCache:
+    def test_cached_thread_matches_fresh_render(self, client, seed) -> None:
+        (post_id,) = seed(n_comments=5)
+        first = client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert client.get(f"/post/{post_id}").get_data(as_text=True) == first
+
+    def test_new_comment_invalidates_thread(self, client, seed, login) -> None:
+        (post_id,) = seed(n_comments=2)
+        client.get(f"/post/{post_id}")
+        login(3)
+        client.post(f"/post/{post_id}", data={"comment_text": "Fresh comment"})
+        assert "Fresh comment" in client.get(f"/post/{post_id}").get_data(as_text=True)
+
+    def test_edit_and_delete_drop_fragments(self, client, seed, login, models) -> None:
+        (post_id,) = seed(n_comments=2)
+        client.get(f"/post/{post_id}")
+        login(1)
+        form = {
+            "title": "Edited",
+            "subtitle": "New subtitle",
+            "img_url": "https://example.com/new.jpg",
+            "body": "<p>Edited body</p>",
+        }
+        assert client.post(f"/edit-post/{post_id}", data=form).status_code == 302
+        assert not any(key[1] == post_id for key in models.fragment_cache._entries)
+        html = client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert "Edited body" in html and "Comment 1" in html
+
+        client.get(f"/delete/{post_id}")
+        assert not any(key[1] == post_id for key in models.fragment_cache._entries)
+        assert client.get(f"/post/{post_id}").status_code == 404
+
+    def test_revision_bump_from_another_worker_is_seen(self, client, seed, app, db, models) -> None:
+        (post_id,) = seed(n_comments=1, n_users=2)
+        client.get(f"/post/{post_id}")
+        # Another process adds a comment: this process's cache isn't told,
+        # but the post's revision - and with it the cache key - changes
+        with app.app_context():
+            db.session.add(models.Comment(text="From elsewhere", author_id=2, post_id=post_id))
+            db.session.execute(
+                db.update(models.BlogPost)
+                .where(models.BlogPost.id == post_id)
+                .values(revision=models.BlogPost.revision + 1)
+            )
+            db.session.commit()
+        assert "From elsewhere" in client.get(f"/post/{post_id}").get_data(as_text=True)
+
+    def test_reused_post_id_gets_a_fresh_thread(self, client, seed, app, db, models) -> None:
+        (post_id,) = seed(n_comments=1)
+        assert "Comment 0" in client.get(f"/post/{post_id}").get_data(as_text=True)
+        # Another worker deletes the newest post, so this process's cache
+        # isn't told, and SQLite gives the next post the same id at revision 0
+        with app.app_context():
+            db.session.delete(db.session.get(models.BlogPost, post_id))
+            db.session.commit()
+            new_post = models.BlogPost(
+                title="Replacement",
+                subtitle="New",
+                date="January 02, 2024",
+                body="<p>Replacement body</p>",
+                img_url="https://example.com/img.jpg",
+                author_id=1,
+            )
+            db.session.add(new_post)
+            db.session.commit()
+            assert (new_post.id, new_post.revision) == (post_id, 0)
+        html = client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert "Replacement body" in html and "Comment 0" not in html
+
+    def test_upgrade_backfills_uids(self, app, db, models) -> None:
+        with app.app_context(), db.engine.begin() as connection:
+            connection.execute(db.text("DROP TABLE comments"))
+            connection.execute(db.text("DROP TABLE blog_posts"))
+            connection.execute(
+                db.text(
+                    "CREATE TABLE blog_posts (id INTEGER PRIMARY KEY, title VARCHAR(250), "
+                    "subtitle VARCHAR(250), date VARCHAR(250), body TEXT, img_url VARCHAR(250), "
+                    "author_id INTEGER)"
+                )
+            )
+            connection.execute(db.text("INSERT INTO blog_posts (title) VALUES ('a'), ('b')"))
+            connection.execute(db.text("CREATE TABLE comments (id INTEGER PRIMARY KEY, post_id INTEGER)"))
+            models.upgrade_post_revision(connection)
+            uids = connection.execute(db.text("SELECT uid FROM blog_posts")).scalars().all()
+        assert len(set(uids)) == 2 and all(len(uid) == 32 for uid in uids)
+
+    def test_lru_evicts_oldest(self, models) -> None:
+        cache = models.FragmentCache(max_entries=2)
+        cache.put(("comments", 1, 0), "a")
+        cache.put(("comments", 2, 0), "b")
+        cache.get(("comments", 1, 0))
+        cache.put(("comments", 3, 0), "c")
+        assert cache.get(("comments", 2, 0)) is None
+        assert cache.get(("comments", 1, 0)) == "a"
+
+
+class TestUserCache:
+    def test_logged_in_views_reuse_cached_user(self, client, seed, login, assert_queries) -> None:
+        (post_id,) = seed(n_comments=20)
+        login(2)
+        client.get(f"/post/{post_id}")
+        # post + author only: the comment thread and the user are both cached
+        with assert_queries(1):
+            assert client.get(f"/post/{post_id}").status_code == 200
+
+    def test_current_user_is_a_detached_snapshot(self, client, seed, login, models) -> None:
+        seed()
+        login(1)
+        with client:
+            client.get("/")
+            assert isinstance(current_user._get_current_object(), models.UserIdentity)
+            assert current_user.name == "User 1" and current_user.is_authenticated
+
+    def test_entries_expire_after_ttl(self, models) -> None:
+        now = [100.0]
+        cache = models.UserCache(max_entries=10, ttl=60, clock=lambda: now[0])
+        identity = models.UserIdentity(id=1, email="a@example.com", name="A")
+        cache.put(identity)
+        now[0] += 59
+        assert cache.get(1) == identity
+        now[0] += 2
+        assert cache.get(1) is None
+
+    def test_profile_change_invalidates_user_and_threads(
+        self, client, seed, login, app, db, models
+    ) -> None:
+        (post_id,) = seed(n_comments=4, n_users=2)
+        login(2)
+        assert "User 2</h5>" in client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert models.user_cache.get(2) is not None
+        with app.app_context():
+            db.session.get(models.User, 2).name = "Renamed"
+            db.session.commit()
+        assert models.user_cache.get(2) is None
+        html = client.get(f"/post/{post_id}").get_data(as_text=True)
+        assert "Renamed</h5>" in html and "User 2</h5>" not in html
+
+    def test_password_change_keeps_cached_threads(self, client, seed, app, db, models) -> None:
+        (post_id,) = seed(n_comments=2, n_users=2)
+        client.get(f"/post/{post_id}")
+        with app.app_context():
+            db.session.get(models.User, 2).password = "new-hash"
+            db.session.commit()
+            assert db.session.get(models.BlogPost, post_id).revision == 0
+
+    def test_deleted_users_session_becomes_anonymous(self, client, seed, login, app, db, models) -> None:
+        seed(n_users=3)
+        login(3)
+        with app.app_context():
+            db.session.delete(db.session.get(models.User, 3))
+            db.session.commit()
+        html = client.get("/").get_data(as_text=True)
+        assert "Login" in html
+
+    def test_admin_can_create_post(self, client, seed, login) -> None:
+        seed(n_posts=0)
+        login(1)
+        form = {
+            "title": "Brand new",
+            "subtitle": "Sub",
+            "img_url": "https://example.com/new.jpg",
+            "body": "<p>Hello</p>",
+        }
+        assert client.post("/new-post", data=form).status_code == 302
+        assert "Brand new" in client.get("/").get_data(as_text=True)
+
+
+class TestGravatar:
+    def test_url_uses_lowercased_email_hash(self, models) -> None:
+        url = models.gravatar_url("User1@Example.com")
+        assert url == models.gravatar_url.__wrapped__("user1@example.com")
+        assert url.endswith("?d=retro&s=100")
+
+    def test_thread_reuses_memoized_urls(self, client, seed, models) -> None:
+        (post_id,) = seed(n_comments=50, n_users=5)
+        client.get(f"/post/{post_id}")
+        info = models.gravatar_url.cache_info()
+        assert info.misses == 5 and info.hits == 45
+
+
+class TestSqlQueryCounter:
+    def test_headers_absent_by_default(self, client, seed) -> None:
+        seed()
+        response = client.get("/")
+        assert "X-SQL-Queries" not in response.headers
+        assert "Server-Timing" not in response.headers
+
+    def test_reports_queries_per_request(self, client, app, seed) -> None:
+        (post_id,) = seed(n_comments=10)
+        app.config["SQL_QUERY_COUNTER"] = True
+        response = client.get(f"/post/{post_id}")
+        assert response.headers["X-SQL-Queries"] == "2"
+        assert response.headers["Server-Timing"].startswith("sql;dur=")
+        assert 'desc="2 queries"' in response.headers["Server-Timing"]
+
+    def test_counts_are_per_request(self, client, app, seed) -> None:
+        seed()
+        app.config["SQL_QUERY_COUNTER"] = True
+        client.get("/")
+        assert client.get("/").headers["X-SQL-Queries"] == "2"
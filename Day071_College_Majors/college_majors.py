@@ -1,7 +1,25 @@
-import pandas as pd
+"""Day 71: exploring a synthetic college-majors salary dataset with pandas.
+
+One row per major at the default scale; ``--scale`` repeats the majors
+(think one row per major and graduating cohort) to test the same
+exploration on millions of rows.
+
+    python college_majors.py
+    python college_majors.py --scale 500000 --no-save
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
 import numpy as np
+import pandas as pd
 
-np.random.seed(42)
+# The synthetic-data helpers live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.synthetic import DEFAULT_SEED, cycle, integers, make_rng, scaled, uniform
+
+OUTPUT_DIR = Path(__file__).parent / "output"
 
 majors = [
     "Computer Science", "Electrical Engineering", "Mechanical Engineering",
@@ -24,65 +42,86 @@ categories = {
     "Nursing": "Health", "Education": "Education"
 }
 
-data = {
-    "Major": majors,
-    "Category": [categories[m] for m in majors],
-    "Median_Salary": np.random.randint(35000, 130000, len(majors)),
-    "P25_Salary": np.random.randint(25000, 90000, len(majors)),
-    "P75_Salary": np.random.randint(50000, 180000, len(majors)),
-    "Employment_Rate": np.round(np.random.uniform(0.65, 0.98, len(majors)), 3),
-    "Total_Employed": np.random.randint(5000, 500000, len(majors)),
-    "Unemployment_Rate": np.round(np.random.uniform(0.01, 0.12, len(majors)), 3),
-}
-
-df = pd.DataFrame(data)
-df.loc[5, "Median_Salary"] = np.nan
-
-print("=" * 60)
-print("COLLEGE MAJOR SALARY ANALYSIS")
-print("=" * 60)
-
-print("\n--- First 5 rows ---")
-print(df.head())
-
-print("\n--- Last 5 rows ---")
-print(df.tail())
-
-print(f"\n--- Shape: {df.shape[0]} rows, {df.shape[1]} columns ---")
-
-print("\n--- Column names ---")
-print(df.columns.tolist())
-
-print("\n--- Missing values ---")
-print(df.isna().sum())
-
-print("\n--- Summary statistics ---")
-print(df.describe())
-
-print("\n--- Majors by category ---")
-print(df["Category"].value_counts())
-
-print("\n--- Top 5 highest paying majors ---")
-print(df.dropna(subset=["Median_Salary"])
-      .sort_values("Median_Salary", ascending=False)[["Major", "Median_Salary", "Category"]]
-      .head())
-
-print("\n--- Lowest 5 paying majors ---")
-print(df.dropna(subset=["Median_Salary"])
-      .sort_values("Median_Salary")[["Major", "Median_Salary", "Category"]]
-      .head())
-
-print("\n--- Average salary by category ---")
-category_stats = df.groupby("Category").agg(
-    Avg_Salary=("Median_Salary", "mean"),
-    Avg_Employment=("Employment_Rate", "mean"),
-    Count=("Major", "count")
-).sort_values("Avg_Salary", ascending=False)
-print(category_stats.round(2))
-
-print("\n--- STEM majors with salary > $80,000 ---")
-stem_high = df[(df["Category"] == "STEM") & (df["Median_Salary"] > 80000)]
-print(stem_high[["Major", "Median_Salary"]])
 
-df.to_csv("Day071/college_majors.csv", index=False)
-print("\nData saved to Day071/college_majors.csv")
+def generate_majors(scale: float = 1.0, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    """The majors table, ``len(majors) * scale`` rows, with one missing salary (row 5)."""
+    rng = make_rng(seed)
+    n = scaled(len(majors), scale)
+    major = cycle(majors, n)
+    df = pd.DataFrame({
+        "Major": major,
+        "Category": pd.Categorical(major.map(categories)),
+        "Median_Salary": integers(rng, 35000, 130000, n).astype(float),
+        "P25_Salary": integers(rng, 25000, 90000, n),
+        "P75_Salary": integers(rng, 50000, 180000, n),
+        "Employment_Rate": uniform(rng, 0.65, 0.98, n, decimals=3),
+        "Total_Employed": integers(rng, 5000, 500000, n),
+        "Unemployment_Rate": uniform(rng, 0.01, 0.12, n, decimals=3),
+    })
+    if n > 5:
+        df.loc[5, "Median_Salary"] = np.nan
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the row count")
+    parser.add_argument("--no-save", action="store_true", help="skip writing the CSV")
+    args = parser.parse_args()
+
+    df = generate_majors(args.scale)
+
+    print("=" * 60)
+    print("COLLEGE MAJOR SALARY ANALYSIS")
+    print("=" * 60)
+
+    print("\n--- First 5 rows ---")
+    print(df.head())
+
+    print("\n--- Last 5 rows ---")
+    print(df.tail())
+
+    print(f"\n--- Shape: {df.shape[0]} rows, {df.shape[1]} columns ---")
+
+    print("\n--- Column names ---")
+    print(df.columns.tolist())
+
+    print("\n--- Missing values ---")
+    print(df.isna().sum())
+
+    print("\n--- Summary statistics ---")
+    print(df.describe())
+
+    print("\n--- Majors by category ---")
+    print(df["Category"].value_counts())
+
+    print("\n--- Top 5 highest paying majors ---")
+    print(df.dropna(subset=["Median_Salary"])
+          .sort_values("Median_Salary", ascending=False)[["Major", "Median_Salary", "Category"]]
+          .head())
+
+    print("\n--- Lowest 5 paying majors ---")
+    print(df.dropna(subset=["Median_Salary"])
+          .sort_values("Median_Salary")[["Major", "Median_Salary", "Category"]]
+          .head())
+
+    print("\n--- Average salary by category ---")
+    category_stats = df.groupby("Category").agg(
+        Avg_Salary=("Median_Salary", "mean"),
+        Avg_Employment=("Employment_Rate", "mean"),
+        Count=("Major", "count")
+    ).sort_values("Avg_Salary", ascending=False)
+    print(category_stats.round(2))
+
+    print("\n--- STEM majors with salary > $80,000 ---")
+    stem_high = df[(df["Category"] == "STEM") & (df["Median_Salary"] > 80000)]
+    print(stem_high[["Major", "Median_Salary"]])
+
+    if not args.no_save:
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        df.to_csv(OUTPUT_DIR / "college_majors.csv", index=False)
+        print("\nData saved to output/college_majors.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,21 @@
-import pandas as pd
+"""Day 73: merging, grouping and pivoting a synthetic LEGO sets dataset.
+
+    python lego_analysis.py
+    python lego_analysis.py --scale 130000 --no-save
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
 import numpy as np
+import pandas as pd
+
+# The synthetic-data helpers live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.synthetic import DEFAULT_SEED, integers, make_rng, scaled, uniform
 
-np.random.seed(42)
+OUTPUT_DIR = Path(__file__).parent / "output"
 
 n_sets = 77
 themes_list = [
@@ -9,65 +23,91 @@ themes_list = [
     "Ninjago", "Harry Potter", "Marvel", "DC", "Classic",
     "Architecture", "Minecraft", "Duplo", "Ideas", "Speed Champions"
 ]
+licensed_themes = ["Star Wars", "Harry Potter", "Marvel", "DC", "Minecraft"]
+
+
+def generate_themes() -> pd.DataFrame:
+    """The fixed themes table: ``theme_id``, ``theme_name``, ``licensed``."""
+    return pd.DataFrame({
+        "theme_id": range(1, len(themes_list) + 1),
+        "theme_name": themes_list,
+        "licensed": [t in licensed_themes for t in themes_list]
+    })
+
+
+def generate_sets(scale: float = 1.0, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    """``n_sets * scale`` sets with a random theme, year, size and price; 4% lack a price."""
+    rng = make_rng(seed)
+    n = scaled(n_sets, scale)
+    sets_df = pd.DataFrame({
+        "set_id": np.arange(1, n + 1),
+        "theme_id": integers(rng, 1, len(themes_list) + 1, n),
+        "year": integers(rng, 1978, 2024, n),
+        "pieces": integers(rng, 10, 5500, n),
+        "price_usd": uniform(rng, 4.99, 499.99, n, decimals=2),
+    })
+    # 3 of the original 77 sets have no price
+    missing = rng.choice(n, max(1, round(n * 3 / n_sets)), replace=False)
+    sets_df.loc[missing, "price_usd"] = np.nan
+    return sets_df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the row count")
+    parser.add_argument("--no-save", action="store_true", help="skip writing the CSVs")
+    args = parser.parse_args()
+
+    themes_df = generate_themes()
+    sets_df = generate_sets(args.scale)
+
+    print("=" * 60)
+    print("LEGO DATASET ANALYSIS")
+    print("=" * 60)
+
+    print("\n--- Sets DataFrame head ---")
+    print(sets_df.head())
+
+    print("\n--- Themes DataFrame ---")
+    print(themes_df)
+
+    merged = sets_df.merge(themes_df, on="theme_id")
+    print(f"\n--- Merged shape: {merged.shape} ---")
+
+    print("\n--- Average pieces per year ---")
+    yearly = merged.groupby("year").agg(
+        avg_pieces=("pieces", "mean"),
+        avg_price=("price_usd", "mean"),
+        set_count=("set_id", "count")
+    ).round(1)
+    print(yearly.head(10))
+
+    print("\n--- Top 5 themes by set count ---")
+    theme_counts = merged["theme_name"].value_counts().head()
+    print(theme_counts)
+
+    print("\n--- Licensed vs Non-Licensed ---")
+    licensed_stats = merged.groupby("licensed").agg(
+        avg_pieces=("pieces", "mean"),
+        avg_price=("price_usd", "mean"),
+        set_count=("set_id", "count")
+    ).round(1)
+    print(licensed_stats)
+
+    print("\n--- Most expensive sets ---")
+    print(merged.nlargest(5, "price_usd")[["set_id", "theme_name", "year", "price_usd", "pieces"]])
+
+    pivot = merged.pivot_table(
+        values="set_id", index="theme_name", columns="year", aggfunc="count", fill_value=0
+    )
+    print(f"\n--- Pivot table shape: {pivot.shape} ---")
+
+    if not args.no_save:
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        sets_df.to_csv(OUTPUT_DIR / "lego_sets.csv", index=False)
+        themes_df.to_csv(OUTPUT_DIR / "lego_themes.csv", index=False)
+        print("\nData saved to output/lego_sets.csv and lego_themes.csv")
+
 
-themes_df = pd.DataFrame({
-    "theme_id": range(1, len(themes_list) + 1),
-    "theme_name": themes_list,
-    "licensed": [t in ["Star Wars", "Harry Potter", "Marvel", "DC", "Minecraft"] for t in themes_list]
-})
-
-sets_data = {
-    "set_id": range(1, n_sets + 1),
-    "theme_id": np.random.choice(themes_df["theme_id"], n_sets),
-    "year": np.random.randint(1978, 2024, n_sets),
-    "pieces": np.random.randint(10, 5500, n_sets),
-    "price_usd": np.round(np.random.uniform(4.99, 499.99, n_sets), 2),
-}
-
-sets_df = pd.DataFrame(sets_data)
-sets_df.loc[np.random.choice(n_sets, 3, replace=False), "price_usd"] = np.nan
-
-print("=" * 60)
-print("LEGO DATASET ANALYSIS")
-print("=" * 60)
-
-print("\n--- Sets DataFrame head ---")
-print(sets_df.head())
-
-print("\n--- Themes DataFrame ---")
-print(themes_df)
-
-merged = sets_df.merge(themes_df, on="theme_id")
-print(f"\n--- Merged shape: {merged.shape} ---")
-
-print("\n--- Average pieces per year ---")
-yearly = merged.groupby("year").agg(
-    avg_pieces=("pieces", "mean"),
-    avg_price=("price_usd", "mean"),
-    set_count=("set_id", "count")
-).round(1)
-print(yearly.head(10))
-
-print("\n--- Top 5 themes by set count ---")
-theme_counts = merged["theme_name"].value_counts().head()
-print(theme_counts)
-
-print("\n--- Licensed vs Non-Licensed ---")
-licensed_stats = merged.groupby("licensed").agg(
-    avg_pieces=("pieces", "mean"),
-    avg_price=("price_usd", "mean"),
-    set_count=("set_id", "count")
-).round(1)
-print(licensed_stats)
-
-print("\n--- Most expensive sets ---")
-print(merged.nlargest(5, "price_usd")[["set_id", "theme_name", "year", "price_usd", "pieces"]])
-
-pivot = merged.pivot_table(
-    values="set_id", index="theme_name", columns="year", aggfunc="count", fill_value=0
-)
-print(f"\n--- Pivot table shape: {pivot.shape} ---")
-
-sets_df.to_csv("Day073/lego_sets.csv", index=False)
-themes_df.to_csv("Day073/lego_themes.csv", index=False)
-print("\nData saved to Day073/lego_sets.csv and lego_themes.csv")
+if __name__ == "__main__":
+    main()
@@ -1,74 +1,115 @@
+"""Day 75: interactive Plotly charts of a synthetic app store.
+
+    python app_store_analysis.py
+    python app_store_analysis.py --scale 125000 --no-save
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
 import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
 
-np.random.seed(42)
+# The synthetic-data helpers live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.synthetic import (
+    DEFAULT_SEED, choice, clipped_normal, integers, labels, make_rng, scaled, uniform,
+)
+
+OUTPUT_DIR = Path(__file__).parent / "output"
 
 categories_list = ["Games", "Productivity", "Social", "Education", "Health", "Finance", "Music", "Travel"]
+install_tiers = [1000, 5000, 10000, 50000, 100000, 500000, 1000000, 5000000]
 n_apps = 80
+# Scatter and box plots embed every point in the HTML; beyond this many
+# apps they show a random sample instead
+PLOT_SAMPLE = 5_000
 
-data = {
-    "App": [f"App_{i}" for i in range(1, n_apps + 1)],
-    "Category": np.random.choice(categories_list, n_apps),
-    "Rating": np.round(np.clip(np.random.normal(4.0, 0.6, n_apps), 1.0, 5.0), 1),
-    "Reviews": np.random.randint(50, 500000, n_apps),
-    "Installs": [f"{x}+" for x in np.random.choice([1000, 5000, 10000, 50000, 100000, 500000, 1000000, 5000000], n_apps)],
-    "Price": np.where(np.random.random(n_apps) < 0.4, 0, np.round(np.random.uniform(0.99, 19.99, n_apps), 2)),
-    "Size_MB": np.round(np.random.uniform(2, 250, n_apps), 1),
-}
-
-df = pd.DataFrame(data)
-df["Free"] = df["Price"] == 0
-
-print("=" * 60)
-print("ANDROID APP STORE ANALYSIS WITH PLOTLY")
-print("=" * 60)
-
-print(f"\nTotal apps: {len(df)}")
-print(f"Free apps: {df['Free'].sum()} ({df['Free'].mean()*100:.0f}%)")
-print(f"Average rating: {df['Rating'].mean():.2f}")
-print(f"Categories: {df['Category'].nunique()}")
-
-fig1 = px.scatter(
-    df, x="Reviews", y="Rating", color="Category", size="Size_MB",
-    hover_data=["App", "Price"], log_x=True, title="Rating vs Reviews by Category",
-    color_discrete_sequence=px.colors.qualitative.Set2
-)
-fig1.write_html("Day075/01_scatter.html")
-print("Saved: 01_scatter.html")
 
-fig2 = px.bar(
-    df.groupby("Category").size().reset_index(name="Count").sort_values("Count"),
-    x="Count", y="Category", orientation="h", title="Apps per Category",
-    color="Count", color_continuous_scale="Blues"
-)
-fig2.write_html("Day075/02_bars.html")
-print("Saved: 02_bars.html")
+def generate_apps(scale: float = 1.0, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    """``n_apps * scale`` apps with a category, rating, reviews, installs tier, price and size."""
+    rng = make_rng(seed)
+    n = scaled(n_apps, scale)
+    paid_price = uniform(rng, 0.99, 19.99, n, decimals=2)
+    paid_price[rng.random(n) < 0.4] = 0
+    df = pd.DataFrame({
+        "App": labels("App_", n),
+        "Category": choice(rng, categories_list, n),
+        "Rating": clipped_normal(rng, 4.0, 0.6, n, 1.0, 5.0, decimals=1),
+        "Reviews": integers(rng, 50, 500000, n),
+        "Installs": choice(rng, [f"{x}+" for x in install_tiers], n),
+        "Price": paid_price,
+        "Size_MB": uniform(rng, 2, 250, n, decimals=1),
+    })
+    df["Free"] = df["Price"] == 0
+    return df
 
-fig3 = px.box(
-    df, x="Category", y="Rating", color="Category", title="Rating Distribution by Category",
-    color_discrete_sequence=px.colors.qualitative.Set2
-)
-fig3.write_html("Day075/03_boxplot.html")
-print("Saved: 03_boxplot.html")
 
-fig4 = px.pie(
-    df, names="Free", title="Free vs Paid Apps",
-    color_discrete_sequence=["#2ecc71", "#e74c3c"],
-    hole=0.4
-)
-fig4.write_html("Day075/04_pie.html")
-print("Saved: 04_pie.html")
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the row count")
+    parser.add_argument("--no-save", action="store_true", help="skip writing the CSV")
+    args = parser.parse_args()
+
+    df = generate_apps(args.scale)
+    points = df.sample(PLOT_SAMPLE, random_state=DEFAULT_SEED) if len(df) > PLOT_SAMPLE else df
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    print("=" * 60)
+    print("ANDROID APP STORE ANALYSIS WITH PLOTLY")
+    print("=" * 60)
+
+    print(f"\nTotal apps: {len(df)}")
+    print(f"Free apps: {df['Free'].sum()} ({df['Free'].mean()*100:.0f}%)")
+    print(f"Average rating: {df['Rating'].mean():.2f}")
+    print(f"Categories: {df['Category'].nunique()}")
+
+    fig1 = px.scatter(
+        points, x="Reviews", y="Rating", color="Category", size="Size_MB",
+        hover_data=["App", "Price"], log_x=True, title="Rating vs Reviews by Category",
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+    fig1.write_html(OUTPUT_DIR / "01_scatter.html")
+    print("Saved: 01_scatter.html")
+
+    fig2 = px.bar(
+        df.groupby("Category").size().reset_index(name="Count").sort_values("Count"),
+        x="Count", y="Category", orientation="h", title="Apps per Category",
+        color="Count", color_continuous_scale="Blues"
+    )
+    fig2.write_html(OUTPUT_DIR / "02_bars.html")
+    print("Saved: 02_bars.html")
+
+    fig3 = px.box(
+        points, x="Category", y="Rating", color="Category", title="Rating Distribution by Category",
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+    fig3.write_html(OUTPUT_DIR / "03_boxplot.html")
+    print("Saved: 03_boxplot.html")
+
+    fig4 = px.pie(
+        df["Free"].value_counts().reset_index(), names="Free", values="count",
+        title="Free vs Paid Apps",
+        color_discrete_sequence=["#2ecc71", "#e74c3c"],
+        hole=0.4
+    )
+    fig4.write_html(OUTPUT_DIR / "04_pie.html")
+    print("Saved: 04_pie.html")
+
+    fig5 = px.sunburst(
+        df, path=["Free", "Category"], values="Reviews",
+        title="Review Distribution: Free/Paid → Category",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig5.write_html(OUTPUT_DIR / "05_sunburst.html")
+    print("Saved: 05_sunburst.html")
+
+    if not args.no_save:
+        df.to_csv(OUTPUT_DIR / "app_store_data.csv", index=False)
+        print("\nData saved to output/app_store_data.csv")
+    print("\nOpen any .html file in a browser to view interactive charts.")
 
-fig5 = px.sunburst(
-    df, path=["Free", "Category"], values="Reviews",
-    title="Review Distribution: Free/Paid → Category",
-    color_discrete_sequence=px.colors.qualitative.Set3
-)
-fig5.write_html("Day075/05_sunburst.html")
-print("Saved: 05_sunburst.html")
 
-df.to_csv("Day075/app_store_data.csv", index=False)
-print("\nData saved to Day075/app_store_data.csv")
-print("\nOpen any .html file in a browser to view interactive charts.")
+if __name__ == "__main__":
+    main()
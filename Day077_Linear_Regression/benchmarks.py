@@ -0,0 +1,73 @@
+"""
+Stage benchmarks for Day 77, run by the shared harness.
+
+The MPG dataset has 392 rows and comes from the network, so every size
+runs on synthetic cars with the same columns (heavier cars, bigger
+engines, lower mpg).
+
+Usage (from the repo root):
+    python -m shared.benchmark Day077_Linear_Regression
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from linear_regression import (
+    multiple_regression,
+    plot_pairplot,
+    plot_regression_analysis,
+    simple_regression,
+)
+
+# The benchmark harness lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.benchmark import Stage
+
+# Benchmark sizes are in rows; the real dataset is 392
+SIZES = (400, 4_000, 40_000)
+
+
+@functools.cache
+def make_cars(n):
+    """``n`` synthetic cars with the MPG dataset's columns."""
+    rng = np.random.default_rng(77)
+    cylinders = rng.choice([4, 6, 8], n, p=[0.5, 0.25, 0.25])
+    displacement = cylinders * 40 + rng.normal(0, 20, n)
+    horsepower = displacement * 0.45 + rng.normal(20, 12, n)
+    weight = 1200 + displacement * 8 + rng.normal(0, 250, n)
+    return pd.DataFrame({
+        "mpg": (60 - weight * 0.0065 - horsepower * 0.04 + rng.normal(0, 3, n)).clip(9, 47),
+        "cylinders": cylinders,
+        "displacement": displacement,
+        "horsepower": horsepower,
+        "weight": weight,
+        "acceleration": 25 - horsepower * 0.05 + rng.normal(0, 2, n),
+        "model_year": rng.integers(70, 83, n),
+        "origin": rng.choice(["usa", "europe", "japan"], n, p=[0.6, 0.2, 0.2]),
+    })
+
+
+def _plot_args(n, scratch, name):
+    cars = make_cars(n)
+    return cars, simple_regression(cars), scratch / name
+
+
+STAGES = [
+    Stage("simple_regression", simple_regression, lambda n, scratch: (make_cars(n),)),
+    Stage("multiple_regression", multiple_regression, lambda n, scratch: (make_cars(n),)),
+    Stage(
+        "plot_regression_analysis",
+        plot_regression_analysis,
+        lambda n, scratch: _plot_args(n, scratch, "linear_regression.png"),
+    ),
+    # 25 panels with KDE diagonals: the slow one, so it skips the largest size
+    Stage(
+        "plot_pairplot",
+        plot_pairplot,
+        lambda n, scratch: (make_cars(n), scratch / "pairplot.png"),
+        sizes=SIZES[:2],
+    ),
+]
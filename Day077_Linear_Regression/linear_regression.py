@@ -1,76 +1,141 @@
+"""Day 77: linear regression on the seaborn MPG dataset.
+
+Fits weight -> mpg with scipy.stats.linregress, then weight + horsepower
+-> mpg with least squares, and saves an analysis grid and a pairplot to
+``figures/``.
+
+    python linear_regression.py
+"""
+
+from pathlib import Path
+
 import matplotlib
+
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import pandas as pd
+import seaborn as sns
 from scipy import stats
 
+try:
+    import statsmodels  # seaborn's LOWESS smoother for the residual plot
+except ImportError:
+    statsmodels = None
+
 sns.set_theme(style="whitegrid")
-mpg = sns.load_dataset("mpg").dropna()
-
-print("=" * 60)
-print("LINEAR REGRESSION WITH SEABORN")
-print("=" * 60)
-
-print(f"\nDataset: {mpg.shape[0]} rows, {mpg.shape[1]} columns")
-print(f"Columns: {mpg.columns.tolist()}")
-
-# EDA
-fig, axes = plt.subplots(2, 2, figsize=(14, 12))
-fig.suptitle("MPG Dataset: Linear Regression Analysis", fontsize=14, fontweight="bold")
-
-sns.scatterplot(data=mpg, x="weight", y="mpg", hue="origin", ax=axes[0, 0], alpha=0.7)
-axes[0, 0].set_title("MPG vs Weight by Origin")
-
-numeric_cols = mpg.select_dtypes(include=[np.number]).columns
-corr = mpg[numeric_cols].corr()
-sns.heatmap(corr, annot=True, cmap="coolwarm", center=0, fmt=".2f", ax=axes[0, 1], square=True)
-axes[0, 1].set_title("Correlation Matrix")
-
-slope, intercept, r_value, p_value, std_err = stats.linregress(mpg["weight"], mpg["mpg"])
-print(f"\n--- Weight vs MPG Regression ---")
-print(f"Slope: {slope:.4f}")
-print(f"Intercept: {intercept:.2f}")
-print(f"R-squared: {r_value**2:.4f}")
-print(f"P-value: {p_value:.2e}")
-print(f"Standard Error: {std_err:.4f}")
-
-sns.regplot(data=mpg, x="weight", y="mpg", scatter_kws={"alpha": 0.5}, line_kws={"color": "red"}, ax=axes[1, 0])
-axes[1, 0].set_title(f"Regression Line (R² = {r_value**2:.3f})")
-
-predicted = slope * mpg["weight"] + intercept
-residuals = mpg["mpg"] - predicted
-
-sns.residplot(x=predicted, y=residuals, lowess=True, ax=axes[1, 1],
-              scatter_kws={"alpha": 0.5}, line_kws={"color": "red"})
-axes[1, 1].axhline(0, color="gray", linestyle="--")
-axes[1, 1].set_title("Residual Plot")
-axes[1, 1].set_xlabel("Fitted Values")
-
-plt.tight_layout()
-plt.savefig("Day077/linear_regression.png", dpi=150, bbox_inches="tight")
-print("\nSaved: Day077/linear_regression.png")
-plt.close()
-
-# Pairplot
-g = sns.pairplot(mpg[["mpg", "weight", "horsepower", "displacement", "acceleration"]],
-                 diag_kind="kde", plot_kws={"alpha": 0.5})
-g.fig.suptitle("Pairwise Relationships", y=1.02, fontsize=14)
-g.savefig("Day077/pairplot.png", dpi=150, bbox_inches="tight")
-print("Saved: Day077/pairplot.png")
-plt.close()
-
-# Multiple regression demo
-print("\n--- Multiple Regression (weight + horsepower → mpg) ---")
-X = mpg[["weight", "horsepower"]].values
-y = mpg["mpg"].values
-X_with_intercept = np.column_stack([np.ones(len(X)), X])
-coefficients = np.linalg.lstsq(X_with_intercept, y, rcond=None)[0]
-predictions = X_with_intercept @ coefficients
-ss_res = np.sum((y - predictions) ** 2)
-ss_tot = np.sum((y - np.mean(y)) ** 2)
-r2 = 1 - ss_res / ss_tot
-print(f"Intercept: {coefficients[0]:.2f}")
-print(f"Weight coefficient: {coefficients[1]:.4f}")
-print(f"Horsepower coefficient: {coefficients[2]:.4f}")
-print(f"Multiple R²: {r2:.4f}")
+
+FIGURES_DIR = Path(__file__).parent / "figures"
+PAIRPLOT_COLUMNS = ["mpg", "weight", "horsepower", "displacement", "acceleration"]
+
+
+def load_mpg() -> pd.DataFrame:
+    """Load seaborn's MPG dataset without its incomplete rows."""
+    return sns.load_dataset("mpg").dropna()
+
+
+def simple_regression(df: pd.DataFrame, x: str = "weight", y: str = "mpg") -> dict[str, float]:
+    """Fit ``y`` on ``x`` with linregress; returns slope, intercept, r2, p_value, std_err."""
+    fit = stats.linregress(df[x], df[y])
+    return {
+        "slope": fit.slope,
+        "intercept": fit.intercept,
+        "r2": fit.rvalue**2,
+        "p_value": fit.pvalue,
+        "std_err": fit.stderr,
+    }
+
+
+def multiple_regression(
+    df: pd.DataFrame,
+    features: tuple[str, ...] = ("weight", "horsepower"),
+    target: str = "mpg",
+) -> tuple[np.ndarray, float]:
+    """Least-squares fit of ``target`` on ``features``; returns (coefficients, R²).
+
+    ``coefficients[0]`` is the intercept.
+    """
+    X = df[list(features)].values
+    y = df[target].values
+    X_with_intercept = np.column_stack([np.ones(len(X)), X])
+    coefficients = np.linalg.lstsq(X_with_intercept, y, rcond=None)[0]
+    predictions = X_with_intercept @ coefficients
+    ss_res = np.sum((y - predictions) ** 2)
+    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    return coefficients, 1 - ss_res / ss_tot
+
+
+def plot_regression_analysis(df: pd.DataFrame, fit: dict[str, float], output_path: Path) -> None:
+    """Save the 2x2 grid: scatter by origin, correlations, regression line, residuals."""
+    fig, axes = plt.subplots(2, 2, figsize=(14, 12))
+    fig.suptitle("MPG Dataset: Linear Regression Analysis", fontsize=14, fontweight="bold")
+
+    sns.scatterplot(data=df, x="weight", y="mpg", hue="origin", ax=axes[0, 0], alpha=0.7)
+    axes[0, 0].set_title("MPG vs Weight by Origin")
+
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    corr = df[numeric_cols].corr()
+    sns.heatmap(corr, annot=True, cmap="coolwarm", center=0, fmt=".2f", ax=axes[0, 1], square=True)
+    axes[0, 1].set_title("Correlation Matrix")
+
+    sns.regplot(data=df, x="weight", y="mpg", scatter_kws={"alpha": 0.5}, line_kws={"color": "red"}, ax=axes[1, 0])
+    axes[1, 0].set_title(f"Regression Line (R² = {fit['r2']:.3f})")
+
+    predicted = fit["slope"] * df["weight"] + fit["intercept"]
+    residuals = df["mpg"] - predicted
+
+    sns.residplot(x=predicted, y=residuals, lowess=statsmodels is not None, ax=axes[1, 1],
+                  scatter_kws={"alpha": 0.5}, line_kws={"color": "red"})
+    axes[1, 1].axhline(0, color="gray", linestyle="--")
+    axes[1, 1].set_title("Residual Plot")
+    axes[1, 1].set_xlabel("Fitted Values")
+
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=150, bbox_inches="tight")
+    plt.close()
+
+
+def plot_pairplot(df: pd.DataFrame, output_path: Path) -> None:
+    """Save a KDE-diagonal pairplot of mpg and the main engine/body columns."""
+    g = sns.pairplot(df[PAIRPLOT_COLUMNS], diag_kind="kde", plot_kws={"alpha": 0.5})
+    g.fig.suptitle("Pairwise Relationships", y=1.02, fontsize=14)
+    g.savefig(output_path, dpi=150, bbox_inches="tight")
+    plt.close()
+
+
+def main() -> None:
+    FIGURES_DIR.mkdir(exist_ok=True)
+    mpg = load_mpg()
+
+    print("=" * 60)
+    print("LINEAR REGRESSION WITH SEABORN")
+    print("=" * 60)
+
+    print(f"\nDataset: {mpg.shape[0]} rows, {mpg.shape[1]} columns")
+    print(f"Columns: {mpg.columns.tolist()}")
+
+    fit = simple_regression(mpg)
+    print("\n--- Weight vs MPG Regression ---")
+    print(f"Slope: {fit['slope']:.4f}")
+    print(f"Intercept: {fit['intercept']:.2f}")
+    print(f"R-squared: {fit['r2']:.4f}")
+    print(f"P-value: {fit['p_value']:.2e}")
+    print(f"Standard Error: {fit['std_err']:.4f}")
+
+    plot_regression_analysis(mpg, fit, FIGURES_DIR / "linear_regression.png")
+    print("\nSaved: figures/linear_regression.png")
+
+    plot_pairplot(mpg, FIGURES_DIR / "pairplot.png")
+    print("Saved: figures/pairplot.png")
+
+    # Multiple regression demo
+    print("\n--- Multiple Regression (weight + horsepower → mpg) ---")
+    coefficients, r2 = multiple_regression(mpg)
+    print(f"Intercept: {coefficients[0]:.2f}")
+    print(f"Weight coefficient: {coefficients[1]:.4f}")
+    print(f"Horsepower coefficient: {coefficients[2]:.4f}")
+    print(f"Multiple R²: {r2:.4f}")
+
+
+if __name__ == "__main__":
+    main()
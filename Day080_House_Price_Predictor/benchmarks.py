@@ -0,0 +1,119 @@
+"""
+Stage benchmarks for Day 80, run by the shared harness.
+
+Sizes are rows of the synthetic housing sample from
+``fixtures/build_housing_fixture.py`` (the real dataset has 20,640), so
+the suite runs offline and can go past the real dataset's size.
+
+Usage (from the repo root):
+    python -m shared.benchmark Day080_House_Price_Predictor
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from pathlib import Path
+
+from house_price_predictor import (
+    TARGET_COL,
+    cross_validate_model,
+    make_tree_model,
+    plot_correlation_matrix,
+    plot_feature_importance,
+    plot_model_comparison,
+    plot_predictions_vs_actual,
+    split_data,
+    train_linear_regression,
+    train_random_forest,
+)
+
+# The benchmark harness lives at the repo root; the sample generator in fixtures/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent / "fixtures"))
+from build_housing_fixture import make_sample
+
+from shared.benchmark import Stage
+
+SIZES = (1_000, 5_000, 20_000)
+
+
+@functools.cache
+def housing(n: int):
+    return make_sample(n)
+
+
+@functools.cache
+def split(n: int):
+    return split_data(housing(n))
+
+
+@functools.cache
+def fitted(n: int):
+    """(predictions, metrics, importances) of both models, for the plot stages."""
+    X_train, X_test, y_train, y_test, _ = split(n)
+    lr, lr_metrics = train_linear_regression(X_train, y_train, X_test, y_test)
+    rf, rf_metrics = train_random_forest(X_train, y_train, X_test, y_test)
+    predictions = {"Linear Regression": lr.predict(X_test), "Random Forest": rf.predict(X_test)}
+    metrics = {"Linear Regression": lr_metrics, "Random Forest": rf_metrics}
+    return predictions, metrics, rf.feature_importances_
+
+
+def _train_args(n: int, scratch: Path) -> tuple:
+    X_train, X_test, y_train, y_test, _ = split(n)
+    return X_train, y_train, X_test, y_test
+
+
+def _train(engine: str):
+    def train(X_train, y_train, X_test, y_test):
+        return train_random_forest(X_train, y_train, X_test, y_test, engine=engine)
+
+    return train
+
+
+def _cv_args(engine: str):
+    def setup(n: int, scratch: Path) -> tuple:
+        X_train, _, y_train, _, _ = split(n)
+        return make_tree_model(engine), X_train, y_train
+
+    return setup
+
+
+def _features(n: int) -> list[str]:
+    return [c for c in housing(n).columns if c != TARGET_COL]
+
+
+STAGES = [
+    Stage("split_data", split_data, lambda n, scratch: (housing(n),)),
+    Stage("train_linear_regression", train_linear_regression, _train_args),
+    Stage("train_random_forest[rf]", _train("rf"), _train_args),
+    Stage("train_random_forest[rf_parallel]", _train("rf_parallel"), _train_args),
+    Stage("train_random_forest[hist_gb]", _train("hist_gb"), _train_args),
+    # Five forest fits per call: keep it off the largest size
+    Stage("cross_validate_model[rf]", cross_validate_model, _cv_args("rf"), sizes=SIZES[:2]),
+    Stage(
+        "cross_validate_model[hist_gb]",
+        lambda model, X, y: cross_validate_model(model, X, y, n_jobs=-1),
+        _cv_args("hist_gb"),
+    ),
+    Stage(
+        "plot_correlation_matrix",
+        plot_correlation_matrix,
+        lambda n, scratch: (housing(n), scratch / "correlation_matrix.png"),
+    ),
+    Stage(
+        "plot_feature_importance",
+        plot_feature_importance,
+        lambda n, scratch: (_features(n), fitted(n)[2], scratch / "importance.png"),
+    ),
+    Stage(
+        "plot_predictions_vs_actual",
+        plot_predictions_vs_actual,
+        lambda n, scratch: (split(n)[3], fitted(n)[0], scratch / "evaluation.png"),
+    ),
+    Stage(
+        "plot_model_comparison",
+        plot_model_comparison,
+        lambda n, scratch: (fitted(n)[1], scratch / "comparison.png"),
+    ),
+]
@@ -5,9 +5,20 @@ cross-validation, feature importance, and a 4-panel diagnostic chart.
 Outputs go to ``figures/`` (PNGs) and ``data/`` (CSVs); both are
 gitignored.
 
+The dataset is downloaded once, stored under ``data/california_housing/``
+as a single column-major ``.npy`` with a checksum, and memory-mapped on
+later runs. Without network access the pipeline falls back to a small
+bundled sample in ``fixtures/``.
+
 Run from the command line:
 
     python house_price_predictor.py
+    python house_price_predictor.py --no-plots
+    python house_price_predictor.py --dataset fixture    # never touch the network
+    python house_price_predictor.py --engine hist_gb     # boosted trees instead of the forest
+    python house_price_predictor.py --benchmark          # fit time, R^2, peak RSS per engine
+    python house_price_predictor.py --init-online        # seed the incremental model
+    python house_price_predictor.py --ingest deltas/     # update it with new sales CSVs
 
 Or import the pipeline:
 
@@ -17,51 +28,193 @@ Or import the pipeline:
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
 import warnings
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import matplotlib
-
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
+import joblib
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from sklearn.datasets import fetch_california_housing
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.linear_model import LinearRegression
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.inspection import permutation_importance
+from sklearn.linear_model import LinearRegression, SGDRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.model_selection import cross_val_score, train_test_split
 from sklearn.preprocessing import StandardScaler
 
-warnings.filterwarnings("ignore")
+# Lazy plotting imports and the background plot stage live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.plotting import PLOT_WORKERS, PlotStage, pyplot, seaborn
 
-sns.set_theme(style="whitegrid")
+try:
+    import resource  # peak RSS for the engine benchmark; POSIX only
+except ImportError:
+    resource = None
+
+warnings.filterwarnings("ignore")
 
 OUTPUT_DIR = Path(__file__).parent
 FIGURES_DIR = OUTPUT_DIR / "figures"
 DATA_DIR = OUTPUT_DIR / "data"
+DATASET_CACHE_DIR = DATA_DIR / "california_housing"
+FIXTURE_DIR = OUTPUT_DIR / "fixtures" / "california_housing_sample"
+ONLINE_DIR = DATA_DIR / "online"
 
 RANDOM_STATE = 42
 TEST_SIZE = 0.2
 RF_N_ESTIMATORS = 100
 CV_FOLDS = 5
+HGB_MAX_ITER = 300
+PERMUTATION_REPEATS = 5
+
+# Tree model behind the "Random Forest" slot of the pipeline:
+# "rf": the original single-threaded forest, CV folds one after another
+# "rf_parallel": the same forest with one tree per core, CV folds in parallel
+# "hist_gb": histogram gradient boosting (binned features, OpenMP), CV folds in parallel
+ENGINES = ("rf", "rf_parallel", "hist_gb")
+ENGINE_NAMES = {
+    "rf": "Random Forest",
+    "rf_parallel": "Random Forest",
+    "hist_gb": "Hist Gradient Boosting",
+}
+ENGINE_CV_JOBS = {"rf": None, "rf_parallel": -1, "hist_gb": -1}
 
 TARGET_COL = "Price"
 TARGET_DOLLAR_MULTIPLIER = 100_000  # CA housing target is in $100,000 units
 
+# "auto": local cache, else download (and cache), else the bundled sample
+# "download": always fetch and rewrite the cache
+# "fixture": the bundled sample only, never the network
+DATASET_SOURCES = ("auto", "download", "fixture")
+DATASET_FORMAT_VERSION = 1
+DATASET_FILE = "columns.npy"
+DATASET_MANIFEST = "manifest.json"
+
+# Incremental model: a running StandardScaler + SGDRegressor, checkpointed
+# after every CSV delta. Drift is the population stability index of each
+# feature against decile bins of the seed data; 0.1-0.2 is a moderate
+# shift, above 0.2 a significant one.
+ONLINE_FORMAT_VERSION = 1
+ONLINE_STATE_FILE = "state.joblib"
+ONLINE_CHECKPOINT = "checkpoint.json"
+ONLINE_SEED_EPOCHS = 5
+DELTA_CHUNK_SIZE = 50_000
+DRIFT_BINS = 10
+PSI_ALERT = 0.2
 
-def load_housing_data() -> tuple[pd.DataFrame, pd.Series]:
-    """Load the California Housing dataset as a DataFrame + target Series.
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def write_dataset_cache(cache_dir: Path, df: pd.DataFrame, source: str) -> Path:
+    """Store ``df`` as one column-major float64 ``.npy`` plus a manifest.
+
+    Column ``i`` of ``df`` is row ``i`` of the array, so each column is
+    contiguous on disk and the whole frame can be memory-mapped as a
+    single pandas block. The manifest records the column names, row
+    count, the file's SHA-256 and where the data came from.
 
     Returns:
-        Tuple of (features_with_target_df, target_series).
+        Path of the manifest.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    data_path = cache_dir / DATASET_FILE
+    tmp_path = cache_dir / f"{DATASET_FILE}.{os.getpid()}.tmp"
+    with tmp_path.open("wb") as f:
+        np.save(f, np.ascontiguousarray(df.to_numpy(np.float64).T))
+    tmp_path.replace(data_path)
+
+    manifest = {
+        "format_version": DATASET_FORMAT_VERSION,
+        "columns": list(df.columns),
+        "rows": len(df),
+        "dtype": "float64",
+        "sha256": _file_sha256(data_path),
+        "source": source,
+    }
+    manifest_path = cache_dir / DATASET_MANIFEST
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return manifest_path
+
+
+def read_dataset_cache(cache_dir: Path, verify: bool = True) -> pd.DataFrame:
+    """Memory-map a :func:`write_dataset_cache` directory as a DataFrame.
+
+    The frame is a read-only view of the file: nothing is copied until
+    pandas' copy-on-write kicks in on a modification.
+
+    Raises:
+        FileNotFoundError: No cache in ``cache_dir``.
+        ValueError: Unknown format version, or (with ``verify``) the
+            file doesn't match the manifest's checksum or shape.
     """
+    manifest = json.loads((cache_dir / DATASET_MANIFEST).read_text())
+    if manifest.get("format_version") != DATASET_FORMAT_VERSION:
+        raise ValueError(f"unsupported dataset cache format {manifest.get('format_version')!r}")
+    data_path = cache_dir / DATASET_FILE
+    if verify and _file_sha256(data_path) != manifest["sha256"]:
+        raise ValueError(f"{data_path} does not match the checksum in {DATASET_MANIFEST}")
+    columns = np.load(data_path, mmap_mode="r")
+    if columns.shape != (len(manifest["columns"]), manifest["rows"]):
+        raise ValueError(f"{data_path} has shape {columns.shape}, manifest disagrees")
+    return pd.DataFrame(columns.T, columns=manifest["columns"], copy=False)
+
+
+def download_housing_data(cache_dir: Path = DATASET_CACHE_DIR) -> pd.DataFrame:
+    """Fetch the dataset with scikit-learn and write it to ``cache_dir``."""
+    # Deferred: sklearn.datasets alone is a noticeable share of import time
+    from sklearn.datasets import fetch_california_housing
+
     housing = fetch_california_housing()
     df = pd.DataFrame(housing.data, columns=housing.feature_names)
     df[TARGET_COL] = housing.target
+    write_dataset_cache(cache_dir, df, source="sklearn.datasets.fetch_california_housing")
+    return read_dataset_cache(cache_dir)
+
+
+def load_housing_data(
+    source: str = "auto",
+    cache_dir: Path = DATASET_CACHE_DIR,
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Load the California Housing dataset as a DataFrame + target Series.
+
+    Args:
+        source: One of ``DATASET_SOURCES``. ``"auto"`` memory-maps the
+            local cache, downloads into it on the first run, and uses
+            the bundled sample if the download fails (no network).
+        cache_dir: Where the downloaded dataset is cached.
+
+    Returns:
+        Tuple of (features_with_target_df, target_series).
+    """
+    if source not in DATASET_SOURCES:
+        raise ValueError(f"unknown dataset source {source!r}; pick one of {DATASET_SOURCES}")
+    if source == "fixture":
+        df = read_dataset_cache(FIXTURE_DIR)
+    elif source == "download":
+        df = download_housing_data(cache_dir)
+    else:
+        try:
+            df = read_dataset_cache(cache_dir)
+        except (FileNotFoundError, ValueError):
+            try:
+                df = download_housing_data(cache_dir)
+            except OSError as exc:
+                print(f"Could not download the dataset ({exc}); using the bundled sample")
+                df = read_dataset_cache(FIXTURE_DIR)
     return df, df[TARGET_COL]
 
 
@@ -116,15 +269,42 @@ def train_linear_regression(
     return model, compute_metrics(y_test, pred)
 
 
+def make_tree_model(
+    engine: str = "rf",
+    n_estimators: int = RF_N_ESTIMATORS,
+) -> RandomForestRegressor | HistGradientBoostingRegressor:
+    """Build the unfitted tree model for ``engine`` (one of ``ENGINES``).
+
+    ``n_estimators`` sizes the forests; boosting uses ``HGB_MAX_ITER``
+    rounds, stopping early on a held-out tenth once the data has more
+    than 10,000 rows.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}; pick one of {ENGINES}")
+    if engine == "hist_gb":
+        return HistGradientBoostingRegressor(max_iter=HGB_MAX_ITER, random_state=RANDOM_STATE)
+    n_jobs = -1 if engine == "rf_parallel" else None
+    return RandomForestRegressor(
+        n_estimators=n_estimators,
+        n_jobs=n_jobs,
+        random_state=RANDOM_STATE,
+    )
+
+
 def train_random_forest(
     X_train: np.ndarray,
     y_train: pd.Series,
     X_test: np.ndarray,
     y_test: pd.Series,
     n_estimators: int = RF_N_ESTIMATORS,
-) -> tuple[RandomForestRegressor, dict[str, float]]:
-    """Fit a Random Forest Regressor and return (model, metrics)."""
-    model = RandomForestRegressor(n_estimators=n_estimators, random_state=RANDOM_STATE)
+    engine: str = "rf",
+) -> tuple[RandomForestRegressor | HistGradientBoostingRegressor, dict[str, float]]:
+    """Fit the tree model for ``engine`` and return (model, metrics).
+
+    The default is the original single-threaded Random Forest; see
+    ``ENGINES`` for the alternatives.
+    """
+    model = make_tree_model(engine, n_estimators)
     model.fit(X_train, y_train)
     pred = model.predict(X_test)
     return model, compute_metrics(y_test, pred)
@@ -135,12 +315,308 @@ def cross_validate_model(
     X_train: np.ndarray,
     y_train: pd.Series,
     cv: int = CV_FOLDS,
+    n_jobs: int | None = None,
 ) -> tuple[float, float]:
-    """Return (mean, std) of 5-fold CV R^2."""
-    scores = cross_val_score(model, X_train, y_train, cv=cv, scoring="r2")
+    """Return (mean, std) of 5-fold CV R^2.
+
+    Args:
+        n_jobs: Folds fitted at once (``-1``: one per core). When the
+            folds run in parallel, a model with its own ``n_jobs`` is
+            cloned with ``n_jobs=1`` so workers don't each claim every
+            core.
+    """
+    if n_jobs not in (None, 1) and "n_jobs" in model.get_params():
+        model = clone(model).set_params(n_jobs=1)
+    scores = cross_val_score(model, X_train, y_train, cv=cv, scoring="r2", n_jobs=n_jobs)
     return float(scores.mean()), float(scores.std())
 
 
+def tree_feature_importances(
+    model: Any,
+    X_test: np.ndarray,
+    y_test: pd.Series,
+) -> np.ndarray:
+    """Impurity importances for a forest; permutation importances otherwise.
+
+    ``HistGradientBoostingRegressor`` has no ``feature_importances_``,
+    so its importances are the mean drop in test R^2 when each feature
+    is shuffled (``PERMUTATION_REPEATS`` times).
+    """
+    if hasattr(model, "feature_importances_"):
+        return model.feature_importances_
+    result = permutation_importance(
+        model,
+        X_test,
+        y_test,
+        n_repeats=PERMUTATION_REPEATS,
+        random_state=RANDOM_STATE,
+    )
+    return result.importances_mean
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (NaN where unsupported)."""
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _benchmark_engine(
+    engine: str,
+    X_train: np.ndarray,
+    y_train: pd.Series,
+    X_test: np.ndarray,
+    y_test: pd.Series,
+    cv: int,
+) -> dict[str, Any]:
+    """Fit, score and cross-validate one engine; runs in its own process."""
+    start = time.perf_counter()
+    model, metrics = train_random_forest(X_train, y_train, X_test, y_test, engine=engine)
+    fit_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    cv_mean, _ = cross_validate_model(
+        model, X_train, y_train, cv=cv, n_jobs=ENGINE_CV_JOBS[engine]
+    )
+    cv_seconds = time.perf_counter() - start
+    return {
+        "Engine": engine,
+        "Fit_s": fit_seconds,
+        "CV_s": cv_seconds,
+        "Test_R2": metrics["r2"],
+        "CV_R2": cv_mean,
+        "Peak_RSS_MB": _peak_rss_mb(),
+    }
+
+
+def benchmark_engines(
+    df: pd.DataFrame,
+    engines: tuple[str, ...] = ENGINES,
+    cv: int = CV_FOLDS,
+) -> pd.DataFrame:
+    """Time each tree engine on ``df`` and tabulate cost against score.
+
+    Every engine runs in a fresh spawned process, so its peak RSS isn't
+    inflated by the engines before it.
+
+    Returns:
+        DataFrame with one row per engine: ``Engine``, ``Fit_s`` (one
+        fit on the training split), ``CV_s`` (the ``cv``-fold
+        cross-validation), ``Test_R2``, ``CV_R2`` and ``Peak_RSS_MB``
+        (the benchmark process, interpreter and data included; parallel
+        CV folds run in joblib worker processes and aren't counted).
+    """
+    X_train, X_test, y_train, y_test, _ = split_data(df)
+    rows = []
+    for engine in engines:
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            future = pool.submit(_benchmark_engine, engine, X_train, y_train, X_test, y_test, cv)
+            rows.append(future.result())
+    return pd.DataFrame(rows)
+
+
+def _bin_counts(X: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Count each column of ``X`` into its ``DRIFT_BINS`` bins; shape (features, bins)."""
+    return np.stack(
+        [
+            np.bincount(np.searchsorted(col_edges, column, side="right"), minlength=DRIFT_BINS)
+            for column, col_edges in zip(X.T, edges, strict=True)
+        ],
+    )
+
+
+def population_stability_index(expected: np.ndarray, actual: np.ndarray) -> np.ndarray:
+    """PSI per row of two (features, bins) count arrays.
+
+    ``sum((a - e) * ln(a / e))`` over the bins' shares; empty bins are
+    floored at 1e-4 so a bin that empties or fills doesn't give infinity.
+    """
+    e = np.clip(expected / expected.sum(axis=1, keepdims=True), 1e-4, None)
+    a = np.clip(actual / actual.sum(axis=1, keepdims=True), 1e-4, None)
+    return ((a - e) * np.log(a / e)).sum(axis=1)
+
+
+def _save_online_state(checkpoint_dir: Path, state: dict[str, Any], log: dict[str, Any]) -> None:
+    """Write the model state, then the checkpoint log that vouches for it."""
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    state_path = checkpoint_dir / ONLINE_STATE_FILE
+    tmp_path = checkpoint_dir / f"{ONLINE_STATE_FILE}.{os.getpid()}.tmp"
+    joblib.dump(state, tmp_path)
+    tmp_path.replace(state_path)
+    log["sha256"] = _file_sha256(state_path)
+    tmp_path = checkpoint_dir / f"{ONLINE_CHECKPOINT}.{os.getpid()}.tmp"
+    tmp_path.write_text(json.dumps(log, indent=2))
+    tmp_path.replace(checkpoint_dir / ONLINE_CHECKPOINT)
+
+
+def load_online_state(checkpoint_dir: Path = ONLINE_DIR) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Load an incremental-model checkpoint.
+
+    Returns:
+        Tuple of (state, log). ``state`` holds the ``scaler``, the
+        ``model``, the drift reference (``edges``, ``reference_counts``)
+        and ``baseline_mae``; ``log`` is the JSON checkpoint with the
+        rows seen so far and one entry per ingested delta.
+
+    Raises:
+        FileNotFoundError: No checkpoint yet (run :func:`init_online_model`).
+        ValueError: Unknown format version, or the state file doesn't
+            match the checkpoint's checksum.
+    """
+    log = json.loads((checkpoint_dir / ONLINE_CHECKPOINT).read_text())
+    if log.get("format_version") != ONLINE_FORMAT_VERSION:
+        raise ValueError(f"unsupported online checkpoint format {log.get('format_version')!r}")
+    state_path = checkpoint_dir / ONLINE_STATE_FILE
+    if _file_sha256(state_path) != log["sha256"]:
+        raise ValueError(f"{state_path} does not match the checksum in {ONLINE_CHECKPOINT}")
+    return joblib.load(state_path), log
+
+
+def init_online_model(
+    df: pd.DataFrame,
+    checkpoint_dir: Path = ONLINE_DIR,
+    epochs: int = ONLINE_SEED_EPOCHS,
+) -> dict[str, Any]:
+    """Seed the incremental model from a full dataset and checkpoint it.
+
+    Fits the scaler, then ``epochs`` shuffled passes of
+    ``SGDRegressor.partial_fit``. The seed data's feature deciles become
+    the drift reference, and its in-sample MAE the baseline that later
+    deltas are compared against.
+
+    Returns:
+        The checkpoint log.
+    """
+    feature_names = [c for c in df.columns if c != TARGET_COL]
+    X = df[feature_names].to_numpy(np.float64)
+    y = df[TARGET_COL].to_numpy(np.float64)
+    scaler = StandardScaler().partial_fit(X)
+    X_scaled = scaler.transform(X)
+    model = SGDRegressor(random_state=RANDOM_STATE)
+    rng = np.random.default_rng(RANDOM_STATE)
+    for _ in range(epochs):
+        order = rng.permutation(len(y))
+        model.partial_fit(X_scaled[order], y[order])
+
+    quantiles = np.linspace(0, 1, DRIFT_BINS + 1)[1:-1]
+    edges = np.quantile(X, quantiles, axis=0).T
+    state = {
+        "scaler": scaler,
+        "model": model,
+        "feature_names": feature_names,
+        "edges": edges,
+        "reference_counts": _bin_counts(X, edges),
+        "baseline_mae": mean_absolute_error(y, model.predict(X_scaled)) * TARGET_DOLLAR_MULTIPLIER,
+    }
+    log = {
+        "format_version": ONLINE_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "feature_names": feature_names,
+        "seed_rows": len(y),
+        "rows_seen": len(y),
+        "baseline_mae": state["baseline_mae"],
+        "deltas": [],
+    }
+    _save_online_state(checkpoint_dir, state, log)
+    return log
+
+
+def ingest_delta(
+    csv_path: Path,
+    checkpoint_dir: Path = ONLINE_DIR,
+    chunk_size: int = DELTA_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Update the incremental model with one CSV of new sales.
+
+    The CSV has the dataset's feature columns and ``Price``. It is read
+    in ``chunk_size`` rows. Each chunk is scored *before* the model
+    learns from it (test-then-train), so the reported MAE and R^2 are
+    honest out-of-sample numbers for the new batch. Then the scaler's
+    running statistics and the model are updated with ``partial_fit``,
+    and the checkpoint is rewritten. A file whose checksum was already
+    ingested is skipped, so re-running a refresh is harmless.
+
+    Returns:
+        Dict with ``file``, ``rows``, ``seconds``, ``mae`` and ``r2``
+        (pre-update), ``mae_ratio`` (against the seed baseline), the
+        per-feature ``psi`` and the ``drifted`` features above
+        ``PSI_ALERT``; or ``{"file": ..., "skipped": True}``.
+    """
+    start = time.perf_counter()
+    state, log = load_online_state(checkpoint_dir)
+    digest = _file_sha256(csv_path)
+    if any(delta["sha256"] == digest for delta in log["deltas"]):
+        return {"file": csv_path.name, "skipped": True}
+
+    feature_names = state["feature_names"]
+    scaler, model = state["scaler"], state["model"]
+    counts = np.zeros_like(state["reference_counts"])
+    n = 0
+    abs_error = sq_error = y_sum = y_sq_sum = 0.0
+    with pd.read_csv(csv_path, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            missing = {*feature_names, TARGET_COL} - set(chunk.columns)
+            if missing:
+                raise ValueError(f"{csv_path.name} is missing columns {sorted(missing)}")
+            X = chunk[feature_names].to_numpy(np.float64)
+            y = chunk[TARGET_COL].to_numpy(np.float64)
+            residual = y - model.predict(scaler.transform(X))
+            n += len(y)
+            abs_error += float(np.abs(residual).sum())
+            sq_error += float(residual @ residual)
+            y_sum += float(y.sum())
+            y_sq_sum += float(y @ y)
+            counts += _bin_counts(X, state["edges"])
+            scaler.partial_fit(X)
+            model.partial_fit(scaler.transform(X), y)
+    if n == 0:
+        raise ValueError(f"{csv_path.name} has no rows")
+
+    psi = population_stability_index(state["reference_counts"], counts)
+    total = y_sq_sum - y_sum**2 / n
+    mae = abs_error / n * TARGET_DOLLAR_MULTIPLIER
+    entry = {
+        "file": csv_path.name,
+        "sha256": digest,
+        "ingested": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rows": n,
+        "mae": mae,
+        "r2": 1 - sq_error / total if total > 0 else float("nan"),
+        "mae_ratio": mae / state["baseline_mae"],
+        "psi": dict(zip(feature_names, psi.round(4).tolist(), strict=True)),
+        "drifted": [
+            name for name, value in zip(feature_names, psi, strict=True) if value > PSI_ALERT
+        ],
+    }
+    log["deltas"].append(entry)
+    log["rows_seen"] += n
+    _save_online_state(checkpoint_dir, state, log)
+    return {**entry, "seconds": time.perf_counter() - start}
+
+
+def _delta_files(paths: Iterable[Path]) -> list[Path]:
+    """Expand directories into their ``*.csv`` files, oldest name first."""
+    files = []
+    for path in paths:
+        files.extend(sorted(path.glob("*.csv")) if path.is_dir() else [path])
+    return files
+
+
+def print_delta_report(report: dict[str, Any]) -> None:
+    """Print one :func:`ingest_delta` result."""
+    if report.get("skipped"):
+        print(f"{report['file']}: already ingested, skipped")
+        return
+    print(
+        f"{report['file']}: {report['rows']:,} rows in {report['seconds']:.2f}s, "
+        f"MAE ${report['mae']:,.0f} ({report['mae_ratio']:.2f}x baseline), "
+        f"R2 {report['r2']:.4f}",
+    )
+    for name in report["drifted"]:
+        print(f"  drift: {name} PSI {report['psi'][name]:.3f} > {PSI_ALERT}")
+
+
 def print_metrics(name: str, metrics: dict[str, float]) -> None:
     """Print metrics in a standard format."""
     print(f"\n--- {name} Results ---")
@@ -159,9 +635,10 @@ def print_cv_comparison(cv_results: dict[str, tuple[float, float]]) -> None:
 def print_feature_importance(
     feature_names: list[str],
     importances: np.ndarray,
+    model_name: str = "Random Forest",
 ) -> None:
     """Print feature importances sorted high to low."""
-    print("\n--- Random Forest Feature Importance ---")
+    print(f"\n--- {model_name} Feature Importance ---")
     pairs = sorted(
         zip(feature_names, importances, strict=False),
         key=lambda x: x[1],
@@ -175,14 +652,16 @@ def plot_feature_importance(
     feature_names: list[str],
     importances: np.ndarray,
     output_path: Path,
+    model_name: str = "Random Forest",
 ) -> None:
     """Save a horizontal bar chart of feature importances to ``output_path``."""
+    plt = pyplot()
     imp_df = pd.DataFrame(
         {"Feature": feature_names, "Importance": importances},
     ).sort_values("Importance")
     _fig, ax = plt.subplots(figsize=(10, 6))
     ax.barh(imp_df["Feature"], imp_df["Importance"], color="steelblue")
-    ax.set_title("Feature Importance (Random Forest)")
+    ax.set_title(f"Feature Importance ({model_name})")
     ax.set_xlabel("Importance")
     plt.tight_layout()
     plt.savefig(output_path, dpi=150, bbox_inches="tight")
@@ -195,6 +674,7 @@ def plot_predictions_vs_actual(
     output_path: Path,
 ) -> None:
     """Save a scatter of predicted vs actual for each model."""
+    plt = pyplot()
     _fig, ax = plt.subplots(figsize=(8, 8))
     for name, pred in predictions.items():
         ax.scatter(y_test, pred, alpha=0.4, s=10, label=name)
@@ -214,6 +694,7 @@ def plot_model_comparison(
     output_path: Path,
 ) -> None:
     """Save a side-by-side MAE/RMSE bar chart for each model."""
+    plt = pyplot()
     names = list(metrics.keys())
     mae_scores = [metrics[n]["mae"] for n in names]
     rmse_scores = [metrics[n]["rmse"] for n in names]
@@ -237,6 +718,7 @@ def plot_correlation_matrix(
     output_path: Path,
 ) -> None:
     """Save a heatmap of pairwise feature correlations."""
+    plt, sns = pyplot(), seaborn()
     corr = df.corr()
     _fig, ax = plt.subplots(figsize=(10, 8))
     sns.heatmap(
@@ -267,16 +749,28 @@ def save_predictions(
     return output
 
 
-def run_pipeline(figures_dir: Path | None = None, data_dir: Path | None = None) -> dict[str, Any]:
+def run_pipeline(
+    figures_dir: Path | None = None,
+    data_dir: Path | None = None,
+    make_plots: bool = True,
+    plot_workers: int = PLOT_WORKERS,
+    dataset: str = "auto",
+    engine: str = "rf",
+) -> dict[str, Any]:
     """Run the full California house-price pipeline end to end.
 
-    Loads the bundled sklearn dataset, trains both models, evaluates
+    Loads the California Housing dataset, trains both models, evaluates
     them, writes figures to ``figures_dir/`` and predictions to
     ``data_dir/predictions.csv``.
 
     Args:
         figures_dir: Where to write PNGs. Defaults to ``./figures``.
         data_dir: Where to write CSVs. Defaults to ``./data``.
+        make_plots: ``False`` skips every PNG (and the matplotlib import).
+        plot_workers: Processes rendering PNGs in the background while
+            the models train; ``0`` renders them inline.
+        dataset: Data source, see :func:`load_housing_data`.
+        engine: Tree model next to Linear Regression, one of ``ENGINES``.
 
     Returns:
         Dict with the trained models, their metrics, the CV results,
@@ -293,7 +787,7 @@ def run_pipeline(figures_dir: Path | None = None, data_dir: Path | None = None)
     print("CAPSTONE: HOUSE PRICE PREDICTION")
     print("=" * 60)
 
-    df, _ = load_housing_data()
+    df, _ = load_housing_data(dataset)
     print(f"\nDataset: {df.shape[0]} rows, {df.shape[1]} columns")
     print(f"Target: Median House Value (${TARGET_DOLLAR_MULTIPLIER:,}s)")
     print(
@@ -302,65 +796,112 @@ def run_pipeline(figures_dir: Path | None = None, data_dir: Path | None = None)
     )
     summarise_data(df)
 
-    plot_correlation_matrix(df, figures_dir / "correlation_matrix.png")
-    print("\nSaved: figures/correlation_matrix.png")
-
-    X_train, X_test, y_train, y_test, _ = split_data(df)
-
-    lr_model, lr_metrics = train_linear_regression(X_train, y_train, X_test, y_test)
-    print_metrics("Linear Regression", lr_metrics)
-
-    rf_model, rf_metrics = train_random_forest(X_train, y_train, X_test, y_test)
-    print_metrics("Random Forest", rf_metrics)
-
-    cv_results = {
-        "Linear Regression": cross_validate_model(lr_model, X_train, y_train),
-        "Random Forest": cross_validate_model(rf_model, X_train, y_train),
-    }
-    print_cv_comparison(cv_results)
-
-    print_feature_importance(
-        list(df.drop(columns=[TARGET_COL]).columns),
-        rf_model.feature_importances_,
-    )
-
-    feature_names = list(df.drop(columns=[TARGET_COL]).columns)
-    plot_feature_importance(
-        feature_names,
-        rf_model.feature_importances_,
-        figures_dir / "feature_distributions.png",
-    )
-    print("Saved: figures/feature_distributions.png")
-
-    predictions = {
-        "Linear Regression": lr_model.predict(X_test),
-        "Random Forest": rf_model.predict(X_test),
-    }
-    plot_predictions_vs_actual(
-        y_test,
-        predictions,
-        figures_dir / "model_evaluation.png",
-    )
-    print("Saved: figures/model_evaluation.png")
-
-    metrics = {"Linear Regression": lr_metrics, "Random Forest": rf_metrics}
-    plot_model_comparison(metrics, figures_dir / "model_comparison.png")
-    print("Saved: figures/model_comparison.png")
-
-    save_predictions(y_test, predictions, data_dir / "predictions.csv")
-    print("Predictions saved to data/predictions.csv")
+    with PlotStage(enabled=make_plots, max_workers=plot_workers) as plots:
+        plots.submit(plot_correlation_matrix, df, figures_dir / "correlation_matrix.png")
+
+        X_train, X_test, y_train, y_test, _ = split_data(df)
+
+        lr_model, lr_metrics = train_linear_regression(X_train, y_train, X_test, y_test)
+        print_metrics("Linear Regression", lr_metrics)
+
+        tree_name = ENGINE_NAMES[engine]
+        rf_model, rf_metrics = train_random_forest(X_train, y_train, X_test, y_test, engine=engine)
+        print_metrics(tree_name, rf_metrics)
+
+        cv_results = {
+            "Linear Regression": cross_validate_model(lr_model, X_train, y_train),
+            tree_name: cross_validate_model(
+                rf_model, X_train, y_train, n_jobs=ENGINE_CV_JOBS[engine]
+            ),
+        }
+        print_cv_comparison(cv_results)
+
+        feature_names = list(df.drop(columns=[TARGET_COL]).columns)
+        importances = tree_feature_importances(rf_model, X_test, y_test)
+        print_feature_importance(feature_names, importances, tree_name)
+        plots.submit(
+            plot_feature_importance,
+            feature_names,
+            importances,
+            figures_dir / "feature_distributions.png",
+            tree_name,
+        )
+
+        predictions = {
+            "Linear Regression": lr_model.predict(X_test),
+            tree_name: rf_model.predict(X_test),
+        }
+        plots.submit(
+            plot_predictions_vs_actual,
+            y_test,
+            predictions,
+            figures_dir / "model_evaluation.png",
+        )
+
+        metrics = {"Linear Regression": lr_metrics, tree_name: rf_metrics}
+        plots.submit(plot_model_comparison, metrics, figures_dir / "model_comparison.png")
+
+        save_predictions(y_test, predictions, data_dir / "predictions.csv")
+        print("Predictions saved to data/predictions.csv")
+
+    if make_plots:
+        print(
+            "Saved: figures/correlation_matrix.png, figures/feature_distributions.png, "
+            "figures/model_evaluation.png, figures/model_comparison.png",
+        )
 
     print("\n" + "=" * 60)
     print("PIPELINE COMPLETE")
     print("=" * 60)
 
     return {
-        "models": {"Linear Regression": lr_model, "Random Forest": rf_model},
+        "models": {"Linear Regression": lr_model, tree_name: rf_model},
         "metrics": metrics,
         "cv_results": cv_results,
         "predictions": predictions,
     }
 
 
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Day 80 house-price pipeline.")
+    parser.add_argument("--no-plots", action="store_true", help="skip rendering the PNGs")
+    parser.add_argument("--dataset", choices=DATASET_SOURCES, default="auto")
+    parser.add_argument("--engine", choices=ENGINES, default="rf", help="tree model to train")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="time every engine (fit, CV, peak RSS) instead of running the pipeline",
+    )
+    parser.add_argument(
+        "--init-online",
+        action="store_true",
+        help="seed the incremental model from --dataset and checkpoint it",
+    )
+    parser.add_argument(
+        "--ingest",
+        type=Path,
+        nargs="+",
+        metavar="CSV",
+        help="update the incremental model with new-sales CSVs (or folders of them)",
+    )
+    parser.add_argument("--online-dir", type=Path, default=ONLINE_DIR)
+    args = parser.parse_args()
+    if args.init_online or args.ingest:
+        if args.init_online:
+            df, _ = load_housing_data(args.dataset)
+            log = init_online_model(df, args.online_dir)
+            print(f"Seeded {args.online_dir} with {log['seed_rows']:,} rows")
+        for csv_path in _delta_files(args.ingest or []):
+            print_delta_report(ingest_delta(csv_path, args.online_dir))
+        return
+    if args.benchmark:
+        df, _ = load_housing_data(args.dataset)
+        print(f"{len(df):,} rows, {os.cpu_count()} CPUs")
+        print(benchmark_engines(df).round(3).to_string(index=False))
+        return
+    run_pipeline(make_plots=not args.no_plots, dataset=args.dataset, engine=args.engine)
+
+
 if __name__ == "__main__":
-    run_pipeline()
+    main()
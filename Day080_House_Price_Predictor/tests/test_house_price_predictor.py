@@ -2,36 +2,51 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import house_price_predictor
 import pytest
 from house_price_predictor import (
     CV_FOLDS,
+    ENGINES,
+    FIXTURE_DIR,
+    PSI_ALERT,
     RANDOM_STATE,
     RF_N_ESTIMATORS,
     TARGET_COL,
     TARGET_DOLLAR_MULTIPLIER,
     TEST_SIZE,
+    benchmark_engines,
     compute_metrics,
     cross_validate_model,
+    ingest_delta,
+    init_online_model,
+    load_online_state,
     load_housing_data,
+    make_tree_model,
+    read_dataset_cache,
     plot_correlation_matrix,
     plot_feature_importance,
     plot_model_comparison,
     plot_predictions_vs_actual,
+    population_stability_index,
     save_predictions,
     split_data,
     train_linear_regression,
     train_random_forest,
+    tree_feature_importances,
+    write_dataset_cache,
 )
 
 
 @pytest.fixture(scope="module")
 def housing_data() -> tuple[pd.DataFrame, pd.Series]:
-    """Load the bundled California Housing dataset once for the module."""
-    return load_housing_data()
+    """Load the bundled California Housing sample once for the module (no network)."""
+    return load_housing_data("fixture")
 
 
 @pytest.fixture(scope="module")
@@ -74,6 +89,69 @@ class TestData:
         assert df.isna().sum().sum() == 0
 
 
+class TestDatasetCache:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        df = pd.DataFrame({"a": [1.0, 2.0], TARGET_COL: [0.5, 1.5]})
+        write_dataset_cache(tmp_path, df, source="test")
+        pd.testing.assert_frame_equal(read_dataset_cache(tmp_path), df)
+
+    def test_frame_is_memory_mapped(self) -> None:
+        df = read_dataset_cache(FIXTURE_DIR)
+        values = df.to_numpy()
+        assert not values.flags.writeable
+        assert isinstance(values.base, np.memmap) or isinstance(values.base.base, np.memmap)
+
+    def test_corrupt_file_rejected(self, tmp_path: Path) -> None:
+        df = pd.DataFrame({"a": [1.0, 2.0], TARGET_COL: [0.5, 1.5]})
+        write_dataset_cache(tmp_path, df, source="test")
+        with (tmp_path / "columns.npy").open("r+b") as f:
+            f.seek(-1, 2)
+            f.write(b"\xff")
+        with pytest.raises(ValueError, match="checksum"):
+            read_dataset_cache(tmp_path)
+
+    def test_auto_prefers_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        def no_download(cache_dir: Path) -> pd.DataFrame:
+            raise AssertionError("should not download when the cache is valid")
+
+        monkeypatch.setattr(house_price_predictor, "download_housing_data", no_download)
+        df = pd.DataFrame({"a": [1.0, 2.0], TARGET_COL: [0.5, 1.5]})
+        write_dataset_cache(tmp_path, df, source="test")
+        loaded, y = load_housing_data("auto", cache_dir=tmp_path)
+        pd.testing.assert_frame_equal(loaded, df)
+        assert list(y) == [0.5, 1.5]
+
+    def test_auto_falls_back_to_fixture_offline(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def offline(cache_dir: Path) -> pd.DataFrame:
+            raise OSError("Name or service not known")
+
+        monkeypatch.setattr(house_price_predictor, "download_housing_data", offline)
+        df, _ = load_housing_data("auto", cache_dir=tmp_path / "empty")
+        pd.testing.assert_frame_equal(df, read_dataset_cache(FIXTURE_DIR))
+
+    def test_fixture_has_housing_schema(self) -> None:
+        df, _ = load_housing_data("fixture")
+        assert list(df.columns) == [
+            "MedInc",
+            "HouseAge",
+            "AveRooms",
+            "AveBedrms",
+            "Population",
+            "AveOccup",
+            "Latitude",
+            "Longitude",
+            TARGET_COL,
+        ]
+
+    def test_unknown_source_rejected(self) -> None:
+        with pytest.raises(ValueError, match="unknown dataset source"):
+            load_housing_data("s3")
+
+
 class TestSplit:
     def test_split_sizes(
         self,
@@ -147,6 +225,30 @@ class TestModels:
         assert metrics["mae"] >= TARGET_DOLLAR_MULTIPLIER * 0.1
         assert metrics["rmse"] >= TARGET_DOLLAR_MULTIPLIER * 0.1
 
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_every_engine_outperforms_lr(self, split_data_fixture: tuple, engine: str) -> None:
+        X_train, X_test, y_train, y_test, _ = split_data_fixture
+        _, lr_metrics = train_linear_regression(X_train, y_train, X_test, y_test)
+        model, metrics = train_random_forest(
+            X_train, y_train, X_test, y_test, n_estimators=20, engine=engine
+        )
+        assert metrics["r2"] > lr_metrics["r2"]
+        importances = tree_feature_importances(model, X_test, y_test)
+        assert importances.shape == (X_train.shape[1],)
+
+    def test_parallel_forest_matches_serial(self, split_data_fixture: tuple) -> None:
+        X_train, X_test, y_train, y_test, _ = split_data_fixture
+        serial, _ = train_random_forest(X_train, y_train, X_test, y_test, n_estimators=10)
+        parallel, _ = train_random_forest(
+            X_train, y_train, X_test, y_test, n_estimators=10, engine="rf_parallel"
+        )
+        assert parallel.n_jobs == -1
+        np.testing.assert_allclose(parallel.predict(X_test), serial.predict(X_test))
+
+    def test_unknown_engine_rejected(self) -> None:
+        with pytest.raises(ValueError, match="unknown engine"):
+            make_tree_model("xgboost")
+
     def test_compute_metrics_keys(self) -> None:
         y_true = pd.Series([1.0, 2.0, 3.0])
         y_pred = np.array([1.1, 1.9, 3.2])
@@ -183,6 +285,98 @@ class TestCrossValidation:
         # Sanity: defaults match CV_FOLDS
         assert CV_FOLDS == 5
 
+    def test_parallel_folds_match_serial(self, split_data_fixture: tuple) -> None:
+        X_train, _, y_train, _, _ = split_data_fixture
+        model = make_tree_model("rf_parallel", n_estimators=10)
+        serial = cross_validate_model(model, X_train, y_train, cv=3)
+        parallel = cross_validate_model(model, X_train, y_train, cv=3, n_jobs=-1)
+        assert parallel == pytest.approx(serial)
+        # folds own the cores; the caller's model is left alone
+        assert model.n_jobs == -1
+
+
+def test_benchmark_engines_table(housing_data: tuple[pd.DataFrame, pd.Series]) -> None:
+    df, _ = housing_data
+    table = benchmark_engines(df, engines=("hist_gb",), cv=2)
+    assert list(table["Engine"]) == ["hist_gb"]
+    assert (table[["Fit_s", "CV_s", "Peak_RSS_MB"]] > 0).all(axis=None)
+    assert 0.5 < table.loc[0, "Test_R2"] <= 1.0
+
+
+class TestOnline:
+    @pytest.fixture
+    def seeded(self, housing_data: tuple[pd.DataFrame, pd.Series], tmp_path: Path) -> Path:
+        df, _ = housing_data
+        init_online_model(df.iloc[:1500], tmp_path / "online")
+        return tmp_path / "online"
+
+    def test_delta_updates_checkpoint(
+        self,
+        housing_data: tuple[pd.DataFrame, pd.Series],
+        seeded: Path,
+    ) -> None:
+        df, _ = housing_data
+        delta = seeded.parent / "delta.csv"
+        df.iloc[1500:].to_csv(delta, index=False)
+        before, _ = load_online_state(seeded)
+
+        report = ingest_delta(delta, seeded, chunk_size=128)
+        state, log = load_online_state(seeded)
+        assert report["rows"] == 500
+        assert report["r2"] > 0.5  # scored before the model saw the rows
+        assert report["drifted"] == []
+        assert log["rows_seen"] == 2000
+        assert state["scaler"].n_samples_seen_ == 2000
+        assert not np.allclose(state["model"].coef_, before["model"].coef_)
+
+    def test_repeated_delta_is_skipped(
+        self,
+        housing_data: tuple[pd.DataFrame, pd.Series],
+        seeded: Path,
+    ) -> None:
+        df, _ = housing_data
+        delta = seeded.parent / "delta.csv"
+        df.iloc[1500:].to_csv(delta, index=False)
+        ingest_delta(delta, seeded)
+        assert ingest_delta(delta, seeded) == {"file": "delta.csv", "skipped": True}
+        assert load_online_state(seeded)[1]["rows_seen"] == 2000
+
+    def test_shifted_feature_flagged(
+        self,
+        housing_data: tuple[pd.DataFrame, pd.Series],
+        seeded: Path,
+    ) -> None:
+        df, _ = housing_data
+        shifted = df.iloc[1500:].copy()
+        shifted["MedInc"] *= 1.5
+        delta = seeded.parent / "shifted.csv"
+        shifted.to_csv(delta, index=False)
+        report = ingest_delta(delta, seeded)
+        assert report["drifted"] == ["MedInc"]
+        assert report["psi"]["MedInc"] > PSI_ALERT
+        assert report["mae_ratio"] > 1.2
+
+    def test_missing_column_rejected(
+        self,
+        housing_data: tuple[pd.DataFrame, pd.Series],
+        seeded: Path,
+    ) -> None:
+        df, _ = housing_data
+        delta = seeded.parent / "delta.csv"
+        df.iloc[1500:].drop(columns=[TARGET_COL]).to_csv(delta, index=False)
+        with pytest.raises(ValueError, match="missing columns"):
+            ingest_delta(delta, seeded)
+
+    def test_corrupt_state_rejected(self, seeded: Path) -> None:
+        with (seeded / "state.joblib").open("ab") as f:
+            f.write(b"junk")
+        with pytest.raises(ValueError, match="checksum"):
+            load_online_state(seeded)
+
+    def test_psi_zero_for_identical_counts(self) -> None:
+        counts = np.array([[10, 20, 30], [5, 5, 5]])
+        np.testing.assert_allclose(population_stability_index(counts, counts * 3), 0.0)
+
 
 class TestIO:
     def test_save_predictions_csv(
@@ -261,3 +455,35 @@ class TestConstants:
         assert isinstance(RF_N_ESTIMATORS, int)
         assert isinstance(CV_FOLDS, int)
         assert 0.0 < TEST_SIZE < 1.0
+
+
+def test_import_defers_plotting_libraries() -> None:
+    code = "import sys, house_price_predictor; print('matplotlib' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(house_price_predictor.__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_failed_run_cancels_the_queued_figures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    closed = []
+
+    def fail(df: pd.DataFrame):
+        raise RuntimeError("split failed")
+
+    monkeypatch.setattr(house_price_predictor.PlotStage, "submit", lambda self, *a, **k: None)
+    monkeypatch.setattr(
+        house_price_predictor.PlotStage, "close", lambda self, cancel=False: closed.append(cancel)
+    )
+    monkeypatch.setattr(house_price_predictor, "split_data", fail)
+    with pytest.raises(RuntimeError, match="split failed"):
+        house_price_predictor.run_pipeline(
+            figures_dir=tmp_path / "figures", data_dir=tmp_path / "data", dataset="fixture"
+        )
+    assert closed == [True]
@@ -1,4 +1,6 @@
 import os
+import sys
+from pathlib import Path
 from flask import Flask, render_template, request, redirect, url_for
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
@@ -6,9 +8,12 @@ from flask_wtf import FlaskForm
 from wtforms import StringField, IntegerField, SelectField, TextAreaField, SubmitField
 from wtforms.validators import DataRequired, URL, NumberRange
 
+# Shared SQLite engine profile (WAL, pool sizing, read-only bind) lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.sqlite_engine import init_sqlite_db
+
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-cafe-key")
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///cafes.db"
 
 
 class Base(DeclarativeBase):
@@ -16,7 +21,7 @@ class Base(DeclarativeBase):
 
 
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get("DATABASE_URI", "sqlite:///cafes.db"))
 
 
 class Cafe(db.Model):
@@ -0,0 +1,73 @@
+"""Test configuration for the Day 95 book API.
+
+Points the app at a temp-file database, then loads this day's
+``main.py`` under a per-day module name so pytest collecting tests
+from multiple days doesn't return a previously-cached ``main``
+module. Exposes the app, db and model via fixtures.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+THIS_DIR = Path(__file__).parent
+sys.path.insert(0, str(THIS_DIR))
+
+# Must be set before main.py is executed - it reads DATABASE_URI at import
+_TMP_DB_DIR = tempfile.mkdtemp(prefix="day095_test_")
+os.environ["DATABASE_URI"] = f"sqlite:///{os.path.join(_TMP_DB_DIR, 'test.db')}"
+
+_MODULE_NAME = f"_main_{THIS_DIR.name}"
+_spec = importlib.util.spec_from_file_location(_MODULE_NAME, THIS_DIR / "main.py")
+_mod = importlib.util.module_from_spec(_spec)
+sys.modules[_MODULE_NAME] = _mod
+_spec.loader.exec_module(_mod)
+
+APP = _mod.app
+DB = _mod.db
+BOOK = _mod.Book
+API_KEY = _mod.API_KEY
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Flask test client for making requests to the app."""
+    return APP.test_client()
+
+
+@pytest.fixture
+def app():
+    """The Flask app (for app_context() in tests that query the db directly)."""
+    return APP
+
+
+@pytest.fixture
+def db():
+    """SQLAlchemy db instance."""
+    return DB
+
+
+@pytest.fixture
+def books_query():
+    """The query builder behind GET /api/books."""
+    return _mod.books_query
+
+
+@pytest.fixture
+def api_key():
+    """API key used by the write endpoints."""
+    return API_KEY
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    """Recreate the tables and the five sample books before each test."""
+    with APP.app_context():
+        DB.drop_all()
+        DB.create_all()
+        _mod.seed_books()
+    yield
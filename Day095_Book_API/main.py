@@ -1,12 +1,23 @@
+import operator
 import os
+import sys
+from pathlib import Path
+
 from flask import Flask, render_template, request, jsonify
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import text
+from sqlalchemy.orm import DeclarativeBase, validates
+
+# Shared SQLite engine profile and orjson JSON provider live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.json_provider import use_orjson
+from shared.sqlite_engine import init_sqlite_db
 
 app = Flask(__name__)
+use_orjson(app)
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-api-key")
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///books.db"
 API_KEY = os.environ.get("API_KEY", "book-api-secret-2024")
+MAX_PAGE_SIZE = 1000
 
 
 class Base(DeclarativeBase):
@@ -14,7 +25,16 @@ class Base(DeclarativeBase):
 
 
 db = SQLAlchemy(model_class=Base)
-db.init_app(app)
+init_sqlite_db(app, db, os.environ.get("DATABASE_URI", "sqlite:///books.db"))
+
+
+def normalize_genre(genre):
+    """Case-folded genre used for indexed filtering ("Sci-Fi" -> "sci-fi")."""
+    return genre.strip().casefold() if genre is not None else None
+
+
+def _genre_key_default(context):
+    return normalize_genre(context.get_current_parameters().get("genre"))
 
 
 class Book(db.Model):
@@ -25,13 +45,54 @@ class Book(db.Model):
     genre = db.Column(db.String(50))
     rating = db.Column(db.Float)
     read = db.Column(db.Boolean, default=False)
+    # Filter key for ?genre= - internal, never serialized
+    genre_key = db.Column(db.String(50), default=_genre_key_default, info={"private": True})
+
+    # Composite indexes for the common list queries: filter by genre and
+    # sort by rating, or filter by author and sort by year
+    __table_args__ = (
+        db.Index("ix_book_genre_key_rating", "genre_key", "rating"),
+        db.Index("ix_book_author_year", "author", "year"),
+    )
+
+    @validates("genre")
+    def _sync_genre_key(self, key, genre):
+        self.genre_key = normalize_genre(genre)
+        return genre
 
     def to_dict(self):
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return dict(zip(BOOK_FIELDS, _book_values(self), strict=True))
 
 
-with app.app_context():
-    db.create_all()
+# Serializer compiled once instead of reflecting on __table__ for every row:
+# list endpoints select these columns as plain tuples and zip them with the names.
+BOOK_FIELDS = tuple(c.name for c in Book.__table__.columns if not c.info.get("private"))
+BOOK_COLUMNS = tuple(Book.__table__.c[name] for name in BOOK_FIELDS)
+_book_values = operator.attrgetter(*BOOK_FIELDS)
+
+
+def book_row_to_dict(row):
+    return dict(zip(BOOK_FIELDS, row, strict=True))
+
+
+def upgrade_genre_key():
+    """Add, index and backfill genre_key on databases created before it existed."""
+    columns = {column["name"] for column in db.inspect(db.engine).get_columns("book")}
+    if "genre_key" in columns:
+        return
+    with db.engine.begin() as connection:
+        connection.execute(text("ALTER TABLE book ADD COLUMN genre_key VARCHAR(50)"))
+        for index in Book.__table__.indexes:
+            index.create(connection, checkfirst=True)
+        rows = connection.execute(db.select(Book.id, Book.genre)).all()
+        if rows:
+            connection.execute(
+                db.update(Book).where(Book.id == db.bindparam("book_id")),
+                [{"book_id": row.id, "genre_key": normalize_genre(row.genre)} for row in rows],
+            )
+
+
+def seed_books():
     if Book.query.count() == 0:
         books = [
             Book(title="1984", author="George Orwell", year=1949, genre="Dystopian", rating=4.5, read=True),
@@ -45,6 +106,12 @@ with app.app_context():
         db.session.commit()
 
 
+with app.app_context():
+    db.create_all()
+    upgrade_genre_key()
+    seed_books()
+
+
 def require_api_key(func):
     from functools import wraps
     @wraps(func)
@@ -63,6 +130,9 @@ def home():
         {"method": "GET", "path": "/api/books/<id>", "description": "Get a single book"},
         {"method": "GET", "path": "/api/books?genre=Sci-Fi", "description": "Filter by genre"},
         {"method": "GET", "path": "/api/books?sort=rating&order=desc", "description": "Sort results"},
+        {"method": "GET", "path": "/api/books?author=Frank Herbert", "description": "Filter by author"},
+        {"method": "GET", "path": "/api/books?limit=10&offset=20", "description": "Page through results"},
+        {"method": "GET", "path": "/api/books?limit=10&after_id=5", "description": "Keyset page (sort=id)"},
         {"method": "POST", "path": "/api/books", "description": "Create a book (API key required)"},
         {"method": "PUT", "path": "/api/books/<id>", "description": "Update a book (API key required)"},
         {"method": "DELETE", "path": "/api/books/<id>", "description": "Delete a book (API key required)"},
@@ -70,24 +140,90 @@ def home():
     return render_template("index.html", endpoints=endpoints, api_key=API_KEY)
 
 
-@app.route("/api/books", methods=["GET"])
-def get_books():
-    query = Book.query
+def parse_int_arg(args, name, minimum=0, maximum=None):
+    value = args.get(name)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+    if value < minimum or (maximum is not None and value > maximum):
+        raise ValueError(f"{name} must be between {minimum} and {maximum or 'infinity'}")
+    return value
 
-    genre = request.args.get("genre")
-    if genre:
-        query = query.filter(Book.genre.ilike(f"%{genre}%"))
 
-    sort_by = request.args.get("sort", "id")
-    order = request.args.get("order", "asc")
+def books_query(args):
+    """Build the SELECT behind GET /api/books from its query-string args.
 
-    valid_sort_cols = [c.name for c in Book.__table__.columns]
-    if sort_by in valid_sort_cols:
-        col = getattr(Book, sort_by)
-        query = query.order_by(col.desc() if order == "desc" else col.asc())
+    Every filter hits an index: genre is a prefix match on the normalized
+    genre_key (a range scan of ix_book_genre_key_rating, unlike the old
+    leading-wildcard ILIKE), author an exact match on ix_book_author_year.
+    When ``limit`` is given one extra row is fetched so the caller can tell
+    whether there is a next page.
 
-    books = query.all()
-    return jsonify({"count": len(books), "books": [b.to_dict() for b in books]})
+    Returns:
+        (select, limit, offset, keyset) - limit is None when the caller
+        asked for everything; keyset is True for sort=id, the only order
+        an after_id cursor can resume.
+
+    Raises:
+        ValueError: On bad sort or pagination arguments.
+    """
+    query = db.select(*BOOK_COLUMNS)
+
+    genre = normalize_genre(args.get("genre"))
+    if genre:
+        query = query.where(Book.genre_key.between(genre, genre + "\U0010ffff"))
+    author = args.get("author")
+    if author:
+        query = query.where(Book.author == author)
+
+    sort_by = args.get("sort", "id")
+    if sort_by not in BOOK_FIELDS:
+        sort_by = "id"
+    descending = args.get("order", "asc") == "desc"
+    # id breaks ties in the same direction, so pages are stable and the
+    # composite indexes (which end in the rowid) can still supply the order
+    sort_cols = [getattr(Book, sort_by)] if sort_by == "id" else [getattr(Book, sort_by), Book.id]
+    query = query.order_by(*(col.desc() if descending else col.asc() for col in sort_cols))
+
+    limit = parse_int_arg(args, "limit", minimum=1, maximum=MAX_PAGE_SIZE)
+    offset = parse_int_arg(args, "offset")
+    after_id = parse_int_arg(args, "after_id")
+    if after_id is not None:
+        if sort_by != "id":
+            raise ValueError("after_id only works with sort=id; use offset for other sorts")
+        query = query.where(Book.id < after_id if descending else Book.id > after_id)
+    if limit is not None:
+        query = query.limit(limit + 1)
+    if offset:
+        query = query.offset(offset)
+    return query, limit, offset or 0, sort_by == "id"
+
+
+@app.route("/api/books", methods=["GET"])
+def get_books():
+    try:
+        query, limit, offset, keyset = books_query(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    books = [book_row_to_dict(row) for row in db.session.execute(query)]
+    if limit is None:
+        return jsonify({"count": len(books), "books": books})
+
+    has_more = len(books) > limit
+    books = books[:limit]
+    # after_id is rejected for other sorts, so only sort=id gets a keyset cursor
+    next_after_id = books[-1]["id"] if has_more and keyset else None
+    next_offset = offset + limit if has_more else None
+    return jsonify({
+        "count": len(books),
+        "books": books,
+        "next_after_id": next_after_id,
+        "next_offset": next_offset,
+    })
 
 
 @app.route("/api/books/<int:book_id>", methods=["GET"])
@@ -0,0 +1,101 @@
+"""Tests for the Day 95 book API: filtering, pagination and query plans."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def titles(response) -> list[str]:
+    return [book["title"] for book in response.get_json()["books"]]
+
+
+class TestListBooks:
+    def test_lists_all_books(self, client) -> None:
+        body = client.get("/api/books").get_json()
+        assert body["count"] == 5
+        assert "next_after_id" not in body
+
+    def test_genre_filter_is_case_insensitive_prefix(self, client) -> None:
+        assert titles(client.get("/api/books", query_string={"genre": "sci"})) == ["Dune"]
+        assert titles(client.get("/api/books", query_string={"genre": "SCI-FI"})) == ["Dune"]
+
+    def test_author_filter(self, client) -> None:
+        response = client.get("/api/books", query_string={"author": "Harper Lee"})
+        assert titles(response) == ["To Kill a Mockingbird"]
+
+    def test_sort_by_rating_desc(self, client) -> None:
+        response = client.get("/api/books", query_string={"sort": "rating", "order": "desc"})
+        assert titles(response)[0] == "To Kill a Mockingbird"
+
+    def test_genre_key_is_not_serialized(self, client) -> None:
+        book = client.get("/api/books").get_json()["books"][0]
+        assert "genre_key" not in book
+
+    def test_updated_genre_is_filterable(self, client, api_key) -> None:
+        client.put("/api/books/5", json={"genre": "Space Opera"}, headers={"X-API-Key": api_key})
+        assert titles(client.get("/api/books", query_string={"genre": "space"})) == ["Dune"]
+
+
+class TestPagination:
+    def test_limit_and_offset(self, client) -> None:
+        response = client.get("/api/books", query_string={"limit": 2, "offset": 2})
+        assert [book["id"] for book in response.get_json()["books"]] == [3, 4]
+
+    def test_keyset_walks_every_page(self, client) -> None:
+        seen, cursor = [], 0
+        while cursor is not None:
+            body = client.get("/api/books", query_string={"limit": 2, "after_id": cursor}).get_json()
+            seen += [book["id"] for book in body["books"]]
+            cursor = body["next_after_id"]
+        assert seen == [1, 2, 3, 4, 5]
+
+    def test_other_sorts_page_by_offset(self, client) -> None:
+        seen, offset = [], 0
+        while offset is not None:
+            body = client.get(
+                "/api/books", query_string={"sort": "rating", "limit": 2, "offset": offset}
+            ).get_json()
+            assert body["next_after_id"] is None
+            seen += [book["id"] for book in body["books"]]
+            offset = body["next_offset"]
+        everything = client.get("/api/books", query_string={"sort": "rating"}).get_json()
+        assert seen == [book["id"] for book in everything["books"]]
+
+    def test_keyset_descending(self, client) -> None:
+        response = client.get("/api/books", query_string={"order": "desc", "after_id": 3})
+        assert [book["id"] for book in response.get_json()["books"]] == [2, 1]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"limit": 0},
+            {"limit": "many"},
+            {"offset": -1},
+            {"after_id": 2, "sort": "rating"},
+        ],
+    )
+    def test_bad_pagination_returns_400(self, client, params) -> None:
+        assert client.get("/api/books", query_string=params).status_code == 400
+
+
+class TestQueryPlans:
+    """Common list queries must be answered from an index, never a full table scan."""
+
+    @pytest.mark.parametrize(
+        ("params", "index"),
+        [
+            ({"genre": "sci-fi"}, "ix_book_genre_key_rating"),
+            ({"genre": "sci-fi", "sort": "rating", "order": "desc"}, "ix_book_genre_key_rating"),
+            ({"genre": "sci", "limit": 10, "offset": 10}, "ix_book_genre_key_rating"),
+            ({"author": "Frank Herbert"}, "ix_book_author_year"),
+            ({"author": "Frank Herbert", "sort": "year"}, "ix_book_author_year"),
+            ({"after_id": 100, "limit": 10}, "PRIMARY KEY"),
+        ],
+    )
+    def test_no_full_scan(self, app, db, books_query, params, index) -> None:
+        with app.app_context():
+            query, *_ = books_query(params)
+            sql = str(query.compile(db.engine, compile_kwargs={"literal_binds": True}))
+            plan = [row[-1] for row in db.session.execute(db.text(f"EXPLAIN QUERY PLAN {sql}"))]
+        assert not any(step.startswith("SCAN book") for step in plan), plan
+        assert any(index in step for step in plan), plan
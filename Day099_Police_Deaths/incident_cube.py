@@ -0,0 +1,230 @@
+"""Persisted incident counts for the Day 99 report, updated by appending new incidents.
+
+Every chart and the chi-square test in ``police_deaths_analysis.py`` is a
+count over one or two columns. :class:`IncidentCube` keeps those counts
+as dense integer arrays, one per group of dimensions:
+
+- ``state x year x month x race x armed`` (50 x 23 x 12 x 6 x 7 cells,
+  2.3 MB as int32), from which the state, race, year and armed-status
+  charts, the state x year heatmap and the race x armed crosstab are
+  all sums;
+- ``circumstance`` and ``age`` on their own, since crossing them with
+  the rest would multiply the cube by a thousand.
+
+:meth:`IncidentCube.append` adds a batch of incidents in time linear in
+the batch, so a day's new incidents update the report without rescanning
+the history. Labels not seen before (a new year, say) grow the affected
+axis. A batch appended with a ``day`` is recorded, and appending the
+same day again raises ``ValueError`` instead of counting it twice. The
+cube is saved as ``counts.npz`` plus a JSON manifest with the axis
+labels, row count, appended days and a SHA-256 of the arrays:
+
+    cube = IncidentCube.from_frame(incidents)
+    cube.save(cube_dir)
+    ...
+    cube = IncidentCube.load(cube_dir)
+    cube.append(todays_incidents, day="2023-01-01")
+    cube.save(cube_dir)
+    heatmap = cube.total("state", "year")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+GROUPS = (("state", "year", "month", "race", "armed"), ("circumstance",), ("age",))
+COUNT_DTYPE = np.int32
+CUBE_FORMAT_VERSION = 1
+CUBE_FILE = "counts.npz"
+CUBE_MANIFEST = "manifest.json"
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _group_key(group: Sequence[str]) -> str:
+    return "__".join(group)
+
+
+class IncidentCube:
+    """Incident counts over fixed groups of dimensions.
+
+    Args:
+        groups: Tuples of column names; each gets a dense count array
+            with one axis per name. A name may appear in several groups.
+    """
+
+    def __init__(self, groups: Iterable[Sequence[str]] = GROUPS) -> None:
+        self.groups = tuple(tuple(group) for group in groups)
+        self.axes: dict[str, pd.Index] = {dim: pd.Index([]) for group in self.groups for dim in group}
+        self.counts = {
+            group: np.zeros((0,) * len(group), dtype=COUNT_DTYPE) for group in self.groups
+        }
+        self.rows = 0
+        # ISO dates of the batches appended with a ``day``, in order
+        self.days: list[str] = []
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, groups: Iterable[Sequence[str]] = GROUPS) -> IncidentCube:
+        """Count every row of ``df``."""
+        cube = cls(groups)
+        cube.append(df)
+        return cube
+
+    def append(self, df: pd.DataFrame, day: str | None = None) -> int:
+        """Add ``df``'s rows to the counts; returns how many were added.
+
+        Takes time linear in ``len(df)`` (plus a one-off copy of a count
+        array when a new label grows one of its axes). With ``day`` (an
+        ISO date), the batch is recorded in :attr:`days`.
+
+        Raises:
+            KeyError: ``df`` lacks one of the cube's dimensions.
+            ValueError: A dimension has missing values, or ``day`` was
+                already appended.
+        """
+        if day is not None and day in self.days:
+            raise ValueError(f"{day} is already in the cube")
+        codes = {dim: self._codes(dim, df[dim]) for dim in self.axes}
+        for group in self.groups:
+            counts = self.counts[group]
+            flat = np.zeros(len(df), dtype=np.intp)
+            for dim, size in zip(group, counts.shape, strict=True):
+                flat *= size
+                flat += codes[dim]
+            if len(flat) < counts.size:
+                # Small batches (a day's incidents) touch only their own cells
+                np.add.at(counts.reshape(-1), flat, 1)
+            else:
+                counts += np.bincount(flat, minlength=counts.size).reshape(counts.shape).astype(COUNT_DTYPE)
+        self.rows += len(df)
+        if day is not None:
+            self.days.append(day)
+        return len(df)
+
+    def _codes(self, dim: str, values: pd.Series) -> np.ndarray:
+        """Position of each value on ``dim``'s axis, growing the axis for new labels.
+
+        Only labels that occur in ``values`` are added: a categorical's
+        unused categories would otherwise become all-zero rows and
+        columns, which ``chi2_contingency`` rejects.
+        """
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype("category")
+        if values.hasnans:
+            raise ValueError(f"{dim!r} has missing values")
+        values = values.cat.remove_unused_categories()
+        labels = values.cat.categories
+        positions = self.axes[dim].get_indexer(labels) if len(self.axes[dim]) else np.full(len(labels), -1)
+        if (positions < 0).any():
+            self._extend(dim, labels[positions < 0])
+            positions = self.axes[dim].get_indexer(labels)
+        return positions.astype(np.int32)[values.cat.codes.to_numpy()]
+
+    def _extend(self, dim: str, labels: pd.Index) -> None:
+        """Append ``labels`` to ``dim``'s axis; numeric axes are kept sorted."""
+        axis = self.axes[dim].append(labels) if len(self.axes[dim]) else labels
+        order = None
+        if pd.api.types.is_numeric_dtype(axis):
+            if pd.api.types.is_integer_dtype(axis):
+                # int64 whatever the column's width, as the axis comes back from JSON
+                axis = axis.astype(np.int64)
+            order = np.argsort(axis, kind="stable")
+        for group, counts in self.counts.items():
+            if dim not in group:
+                continue
+            i = group.index(dim)
+            padding = [(0, 0)] * counts.ndim
+            padding[i] = (0, len(labels))
+            counts = np.pad(counts, padding)
+            self.counts[group] = counts if order is None else counts.take(order, axis=i)
+        self.axes[dim] = (axis if order is None else axis[order]).rename(dim)
+
+    def total(self, *dims: str) -> pd.Series | pd.DataFrame:
+        """Counts over ``dims``, summing out every other dimension of their group.
+
+        One dimension gives a Series named ``count`` (like
+        ``value_counts``), two a DataFrame with the first along the
+        index (like ``crosstab``), more a Series on a MultiIndex.
+
+        Raises:
+            KeyError: No group contains all of ``dims``.
+        """
+        group = next((g for g in self.groups if set(dims) <= set(g)), None)
+        if group is None or not dims:
+            raise KeyError(f"no group of {self.groups} covers {dims}")
+        summed_out = tuple(i for i, dim in enumerate(group) if dim not in dims)
+        counts = self.counts[group].sum(axis=summed_out, dtype=np.int64)
+        kept = [dim for dim in group if dim in dims]
+        counts = counts.transpose([kept.index(dim) for dim in dims])
+        axes = [self.axes[dim] for dim in dims]
+        if len(dims) == 1:
+            return pd.Series(counts, index=axes[0], name="count")
+        if len(dims) == 2:
+            return pd.DataFrame(counts, index=axes[0], columns=axes[1])
+        return pd.Series(counts.reshape(-1), index=pd.MultiIndex.from_product(axes), name="count")
+
+    def save(self, directory: Path) -> Path:
+        """Write the counts and manifest to ``directory``; returns the manifest path.
+
+        Each file is written to a temporary name and renamed into place.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        data_path = directory / CUBE_FILE
+        tmp_path = directory / f"{CUBE_FILE}.{os.getpid()}.tmp"
+        with tmp_path.open("wb") as f:
+            np.savez(f, **{_group_key(group): counts for group, counts in self.counts.items()})
+        tmp_path.replace(data_path)
+
+        manifest = {
+            "format_version": CUBE_FORMAT_VERSION,
+            "groups": [list(group) for group in self.groups],
+            "axes": {dim: axis.tolist() for dim, axis in self.axes.items()},
+            "rows": self.rows,
+            "days": self.days,
+            "dtype": np.dtype(COUNT_DTYPE).name,
+            "sha256": _file_sha256(data_path),
+        }
+        manifest_path = directory / CUBE_MANIFEST
+        tmp_path = directory / f"{CUBE_MANIFEST}.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        tmp_path.replace(manifest_path)
+        return manifest_path
+
+    @classmethod
+    def load(cls, directory: Path, verify: bool = True) -> IncidentCube:
+        """Read a cube written by :meth:`save`.
+
+        Raises:
+            FileNotFoundError: No cube in ``directory``.
+            ValueError: Unknown format version, or (with ``verify``) the
+                counts don't match the manifest's checksum or axes.
+        """
+        manifest = json.loads((directory / CUBE_MANIFEST).read_text())
+        if manifest.get("format_version") != CUBE_FORMAT_VERSION:
+            raise ValueError(f"unsupported cube format {manifest.get('format_version')!r}")
+        data_path = directory / CUBE_FILE
+        if verify and _file_sha256(data_path) != manifest["sha256"]:
+            raise ValueError(f"{data_path} does not match the checksum in {CUBE_MANIFEST}")
+
+        cube = cls(manifest["groups"])
+        cube.axes = {dim: pd.Index(labels, name=dim) for dim, labels in manifest["axes"].items()}
+        cube.rows = manifest["rows"]
+        cube.days = manifest.get("days", [])
+        with np.load(data_path) as arrays:
+            for group in cube.groups:
+                counts = arrays[_group_key(group)]
+                expected = tuple(len(cube.axes[dim]) for dim in group)
+                if counts.shape != expected:
+                    raise ValueError(f"{data_path}: {group} has shape {counts.shape}, manifest says {expected}")
+                cube.counts[group] = counts.astype(COUNT_DTYPE, copy=False)
+        return cube
@@ -1,17 +1,50 @@
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import seaborn as sns
+"""Day 99: statistical analysis of a synthetic police-involved deaths dataset.
+
+The incidents are counted into an :class:`~incident_cube.IncidentCube`,
+saved under ``output/cube/``. :func:`compute_report` derives every
+chart's table and the chi-square crosstab from the cube, and
+``--append-day`` adds one day of new incidents to the saved cube
+instead of regenerating the whole history. :func:`render_figure` then
+draws one chart from its table; the charts are independent, so they are
+fanned out across a process pool while the main process runs the
+chi-square test and writes the CSV.
+
+    python police_deaths_analysis.py
+    python police_deaths_analysis.py --scale 1250 --no-save --formats png,svg
+    python police_deaths_analysis.py --append-day 2023-01-01
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 from scipy.stats import chi2_contingency
 
-np.random.seed(42)
-sns.set_theme(style="whitegrid")
+from incident_cube import IncidentCube
+
+# The synthetic-data and plotting helpers live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.plotting import PlotStage, pyplot, seaborn
+from shared.synthetic import DEFAULT_SEED, choice, clipped_normal, make_rng, random_dates, scaled
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+CUBE_DIR = OUTPUT_DIR / "cube"
+FORMATS = ("png", "svg", "pdf")
+DPI = 150
+# Nothing else competes for the CPU while the figures render, so use
+# every core; on a single core a pool only adds start-up cost
+RENDER_WORKERS = (os.cpu_count() or 1) if (os.cpu_count() or 1) > 1 else 0
 
 n_incidents = 8000
-years = np.random.randint(2000, 2023, n_incidents)
+first_year, last_year = 2000, 2022
+days_covered = (pd.Timestamp(f"{last_year}-12-31") - pd.Timestamp(f"{first_year}-01-01")).days + 1
 states = [f"State_{i}" for i in range(1, 51)]
+# 10 large, 10 mid-sized and 30 small states (choice() normalizes the weights)
+state_weights = [0.04]*10 + [0.02]*10 + [0.01]*30
 races = ["White", "Black", "Hispanic", "Asian", "Native American", "Other"]
 circumstances = ["Traffic Stop", "Domestic Disturbance", "Mental Health Crisis",
                  "Armed Robbery", "Assault", "Investigation", "Warrant Service",
@@ -20,114 +53,252 @@ circumstances = ["Traffic Stop", "Domestic Disturbance", "Mental Health Crisis",
                  "Suspicious Person", "Active Shooter"]
 armed_status = ["Firearm", "Knife", "Vehicle", "Unarmed", "Toy/Replica", "Other Weapon", "Undetermined"]
 
-data = {
-    "date": pd.to_datetime([f"{y}-{np.random.randint(1,13):02d}-{np.random.randint(1,29):02d}" for y in years]),
-    "state": np.random.choice(states, n_incidents, p=[0.04]*10 + [0.02]*10 + [0.01]*30),
-    "race": np.random.choice(races, n_incidents, p=[0.45, 0.25, 0.16, 0.05, 0.03, 0.06]),
-    "age": np.clip(np.random.normal(35, 12, n_incidents), 15, 80).astype(int),
-    "gender": np.random.choice(["Male", "Female"], n_incidents, p=[0.94, 0.06]),
-    "circumstance": np.random.choice(circumstances, n_incidents),
-    "armed": np.random.choice(armed_status, n_incidents, p=[0.35, 0.10, 0.05, 0.15, 0.05, 0.15, 0.15]),
+
+def generate_incidents(scale: float = 1.0, seed: int = DEFAULT_SEED,
+                       day: pd.Timestamp | None = None) -> pd.DataFrame:
+    """``n_incidents * scale`` incidents dated 2000-2022, plus their ``year`` and ``month``.
+
+    With ``day``, one day's worth instead (the history's daily average,
+    at least one incident), all dated ``day``.
+    """
+    rng = make_rng(seed)
+    if day is None:
+        n = scaled(n_incidents, scale)
+        dates = random_dates(rng, first_year, last_year, n)
+    else:
+        n = scaled(n_incidents / days_covered, scale)
+        dates = pd.DatetimeIndex([pd.Timestamp(day)] * n)
+    df = pd.DataFrame({
+        "date": dates,
+        "state": choice(rng, states, n, p=state_weights),
+        "race": choice(rng, races, n, p=[0.45, 0.25, 0.16, 0.05, 0.03, 0.06]),
+        "age": clipped_normal(rng, 35, 12, n, 15, 80).astype(np.int8),
+        "gender": choice(rng, ["Male", "Female"], n, p=[0.94, 0.06]),
+        "circumstance": choice(rng, circumstances, n),
+        "armed": choice(rng, armed_status, n, p=[0.35, 0.10, 0.05, 0.15, 0.05, 0.15, 0.15]),
+    })
+    df["year"] = df["date"].dt.year
+    df["month"] = df["date"].dt.month
+    return df
+
+
+def compute_report(cube: IncidentCube) -> dict[str, pd.Series | pd.DataFrame]:
+    """The count tables behind each figure and the chi-square test, summed from ``cube``.
+
+    Every table is at most a few hundred cells, cheap to pickle to a
+    render worker, and costs the same however many incidents the cube
+    holds.
+    """
+    return {
+        "state": cube.total("state").sort_values(ascending=False, kind="stable"),
+        "race": cube.total("race").sort_values(ascending=False, kind="stable"),
+        "yearly": cube.total("year"),
+        "circumstance": cube.total("circumstance").sort_values(kind="stable"),
+        # Ages are whole years, so a count per age is the whole distribution
+        "age": cube.total("age"),
+        "heatmap": cube.total("state", "year"),
+        "armed": cube.total("armed").sort_values(ascending=False, kind="stable"),
+        "contingency": cube.total("race", "armed"),
+    }
+
+
+def plot_deaths_by_state(state_counts: pd.Series):
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(14, 6))
+    ax.bar(range(len(state_counts)), state_counts.values, color="steelblue")
+    ax.set_title("Incidents by State", fontsize=14)
+    ax.set_xlabel("State (anonymized)")
+    ax.set_ylabel("Number of Incidents")
+    return fig
+
+
+def plot_race_distribution(race_counts: pd.Series):
+    plt, sns = pyplot(), seaborn()
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.pie(race_counts, labels=race_counts.index, autopct="%1.1f%%",
+           colors=sns.color_palette("Set2"), startangle=90)
+    ax.set_title("Distribution by Race/Ethnicity", fontsize=14)
+    return fig
+
+
+def plot_time_series(yearly: pd.Series):
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.plot(yearly.index, yearly.values, marker="o", linewidth=2, color="#e74c3c")
+    z = np.polyfit(yearly.index, yearly.values, 1)
+    trend = np.poly1d(z)
+    ax.plot(yearly.index, trend(yearly.index), "--", color="gray", label="Trend")
+    ax.set_title("Incidents Over Time", fontsize=14)
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Number of Incidents")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def plot_by_circumstance(circ_counts: pd.Series):
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    ax.barh(circ_counts.index, circ_counts.values, color="steelblue")
+    ax.set_title("Incidents by Circumstance", fontsize=14)
+    ax.set_xlabel("Number of Incidents")
+    return fig
+
+
+def plot_age_distribution(age_counts: pd.Series):
+    plt, sns = pyplot(), seaborn()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    # Weighted by count, the KDE's bandwidth would follow the number of
+    # distinct ages rather than incidents; scale it back to what the raw
+    # ages give (Scott's rule, n ** -1/5)
+    n = age_counts.sum()
+    n_eff = n ** 2 / (age_counts ** 2).sum()
+    sns.histplot(x=age_counts.index, weights=age_counts.values, bins=25, kde=True,
+                 kde_kws={"bw_adjust": (n_eff / n) ** 0.2}, color="#3498db", ax=ax)
+    ax.set_title("Age Distribution", fontsize=14)
+    ax.set_xlabel("Age")
+    return fig
+
+
+def plot_heatmap(heatmap_data: pd.DataFrame):
+    plt, sns = pyplot(), seaborn()
+    fig, ax = plt.subplots(figsize=(14, 10))
+    sns.heatmap(heatmap_data.iloc[:20], cmap="YlOrRd", ax=ax)
+    ax.set_title("Incidents Heatmap: Top 20 States × Year", fontsize=14)
+    return fig
+
+
+def plot_armed_status(armed_counts: pd.Series):
+    plt, sns = pyplot(), seaborn()
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.pie(armed_counts, labels=armed_counts.index, autopct="%1.1f%%",
+           colors=sns.color_palette("Set3"), startangle=90)
+    ax.set_title("Armed Status Distribution", fontsize=14)
+    return fig
+
+
+# Output file stem -> (plot function, report table it draws)
+FIGURES = {
+    "deaths_by_state": (plot_deaths_by_state, "state"),
+    "race_distribution": (plot_race_distribution, "race"),
+    "time_series": (plot_time_series, "yearly"),
+    "by_circumstance": (plot_by_circumstance, "circumstance"),
+    "age_distribution": (plot_age_distribution, "age"),
+    "heatmap": (plot_heatmap, "heatmap"),
+    "armed_status": (plot_armed_status, "armed"),
 }
-df = pd.DataFrame(data)
-df["year"] = df["date"].dt.year
-df["month"] = df["date"].dt.month
-
-print("=" * 60)
-print("POLICE-INVOLVED DEATHS ANALYSIS (2000-2022)")
-print("=" * 60)
-print(f"Total incidents: {len(df)}")
-print(f"Year range: {df['year'].min()}-{df['year'].max()}")
-
-# 1. Deaths by state
-fig, ax = plt.subplots(figsize=(14, 6))
-state_counts = df["state"].value_counts()
-ax.bar(range(len(state_counts)), state_counts.values, color="steelblue")
-ax.set_title("Incidents by State", fontsize=14)
-ax.set_xlabel("State (anonymized)")
-ax.set_ylabel("Number of Incidents")
-plt.tight_layout()
-plt.savefig("Day099/deaths_by_state.png", dpi=150)
-print("Saved: deaths_by_state.png")
-plt.close()
-
-# 2. Race distribution
-fig, ax = plt.subplots(figsize=(8, 8))
-race_counts = df["race"].value_counts()
-ax.pie(race_counts, labels=race_counts.index, autopct="%1.1f%%",
-       colors=sns.color_palette("Set2"), startangle=90)
-ax.set_title("Distribution by Race/Ethnicity", fontsize=14)
-plt.tight_layout()
-plt.savefig("Day099/race_distribution.png", dpi=150)
-print("Saved: race_distribution.png")
-plt.close()
-
-# 3. Time series
-fig, ax = plt.subplots(figsize=(12, 6))
-yearly = df.groupby("year").size()
-ax.plot(yearly.index, yearly.values, marker="o", linewidth=2, color="#e74c3c")
-z = np.polyfit(yearly.index, yearly.values, 1)
-trend = np.poly1d(z)
-ax.plot(yearly.index, trend(yearly.index), "--", color="gray", label="Trend")
-ax.set_title("Incidents Over Time", fontsize=14)
-ax.set_xlabel("Year")
-ax.set_ylabel("Number of Incidents")
-ax.legend()
-ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig("Day099/time_series.png", dpi=150)
-print("Saved: time_series.png")
-plt.close()
-
-# 4. Circumstances
-fig, ax = plt.subplots(figsize=(10, 8))
-circ_counts = df["circumstance"].value_counts().sort_values()
-ax.barh(circ_counts.index, circ_counts.values, color="steelblue")
-ax.set_title("Incidents by Circumstance", fontsize=14)
-ax.set_xlabel("Number of Incidents")
-plt.tight_layout()
-plt.savefig("Day099/by_circumstance.png", dpi=150)
-print("Saved: by_circumstance.png")
-plt.close()
-
-# 5. Age distribution
-fig, ax = plt.subplots(figsize=(10, 6))
-sns.histplot(df["age"], bins=25, kde=True, color="#3498db", ax=ax)
-ax.set_title("Age Distribution", fontsize=14)
-ax.set_xlabel("Age")
-plt.tight_layout()
-plt.savefig("Day099/age_distribution.png", dpi=150)
-print("Saved: age_distribution.png")
-plt.close()
-
-# 6. Heatmap: state × year
-heatmap_data = df.pivot_table(index="state", columns="year", aggfunc="size", fill_value=0)
-fig, ax = plt.subplots(figsize=(14, 10))
-sns.heatmap(heatmap_data.iloc[:20], cmap="YlOrRd", ax=ax)
-ax.set_title("Incidents Heatmap: Top 20 States × Year", fontsize=14)
-plt.tight_layout()
-plt.savefig("Day099/heatmap.png", dpi=150)
-print("Saved: heatmap.png")
-plt.close()
-
-# 7. Armed status
-fig, ax = plt.subplots(figsize=(8, 8))
-armed_counts = df["armed"].value_counts()
-ax.pie(armed_counts, labels=armed_counts.index, autopct="%1.1f%%",
-       colors=sns.color_palette("Set3"), startangle=90)
-ax.set_title("Armed Status Distribution", fontsize=14)
-plt.tight_layout()
-plt.savefig("Day099/armed_status.png", dpi=150)
-print("Saved: armed_status.png")
-plt.close()
-
-# Chi-square test
-print("\n--- Chi-Square Test: Race vs Armed Status ---")
-contingency = pd.crosstab(df["race"], df["armed"])
-chi2, p, dof, expected = chi2_contingency(contingency)
-print(f"Chi²: {chi2:.2f}")
-print(f"p-value: {p:.6f}")
-print(f"Significant: {'Yes' if p < 0.05 else 'No'} (α=0.05)")
-
-df.to_csv("Day099/police_deaths.csv", index=False)
-print("\nData saved to Day099/police_deaths.csv")
+
+
+def render_figure(name: str, data: pd.Series | pd.DataFrame, output_dir: Path,
+                  formats: tuple[str, ...] = ("png",)) -> tuple[str, float, list[Path]]:
+    """Draw figure ``name`` from its table and save it once per format.
+
+    Returns the name, the seconds spent drawing and saving, and the
+    files written.
+    """
+    start = time.perf_counter()
+    plt = pyplot()
+    plot, _ = FIGURES[name]
+    fig = plot(data)
+    fig.tight_layout()
+    paths = []
+    for fmt in formats:
+        path = output_dir / f"{name}.{fmt}"
+        fig.savefig(path, dpi=DPI)
+        paths.append(path)
+    plt.close(fig)
+    return name, time.perf_counter() - start, paths
+
+
+def parse_formats(value: str) -> tuple[str, ...]:
+    """``"png,svg"`` -> ``("png", "svg")``, for ``--formats``."""
+    formats = tuple(dict.fromkeys(f.strip().lower() for f in value.split(",") if f.strip()))
+    unknown = [f for f in formats if f not in FORMATS]
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated list of {', '.join(FORMATS)}, got {value!r}")
+    return formats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the row count")
+    parser.add_argument("--no-save", action="store_true", help="skip writing the CSV")
+    parser.add_argument("--formats", type=parse_formats, default=("png",),
+                        help=f"comma-separated image formats from {', '.join(FORMATS)} (default: png)")
+    parser.add_argument("--workers", type=int, default=RENDER_WORKERS,
+                        help="render processes; 0 renders in this process "
+                             f"(default: {RENDER_WORKERS})")
+    parser.add_argument("--cube", type=Path, default=CUBE_DIR,
+                        help="where the incident counts are saved (default: output/cube)")
+    parser.add_argument("--append-day", type=pd.Timestamp, metavar="YYYY-MM-DD",
+                        help="add one day of new incidents to the saved cube "
+                             "instead of regenerating the history")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.append_day is None:
+        df = generate_incidents(args.scale)
+    else:
+        try:
+            cube = IncidentCube.load(args.cube)
+        except FileNotFoundError:
+            parser.error(f"no cube in {args.cube}; run once without --append-day to build it")
+        if args.append_day.date().isoformat() in cube.days:
+            # Re-running a day's update must not count its incidents twice
+            print(f"{args.append_day.date()} is already in {args.cube}; nothing to append")
+            return
+        df = generate_incidents(args.scale, seed=args.append_day.toordinal(), day=args.append_day)
+    generated = time.perf_counter()
+    if args.append_day is None:
+        cube = IncidentCube.from_frame(df)
+    else:
+        cube.append(df, day=args.append_day.date().isoformat())
+    cube.save(args.cube)
+    counted = time.perf_counter()
+    report = compute_report(cube)
+    computed = time.perf_counter()
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    yearly = report["yearly"]
+    years = yearly.index[yearly > 0]
+    print("=" * 60)
+    print(f"POLICE-INVOLVED DEATHS ANALYSIS ({years.min()}-{years.max()})")
+    print("=" * 60)
+    if args.append_day is not None:
+        print(f"Appended: {len(df)} incidents on {args.append_day.date()}")
+    print(f"Total incidents: {cube.rows}")
+    print(f"Year range: {years.min()}-{years.max()}")
+
+    with PlotStage(max_workers=args.workers) as figures:
+        for name, (_, table) in FIGURES.items():
+            figures.submit(render_figure, name, report[table], OUTPUT_DIR, args.formats)
+
+        # The workers render while this process runs the test and writes the CSV
+        print("\n--- Chi-Square Test: Race vs Armed Status ---")
+        chi2, p, dof, expected = chi2_contingency(report["contingency"])
+        print(f"Chi²: {chi2:.2f}")
+        print(f"p-value: {p:.6f}")
+        print(f"Significant: {'Yes' if p < 0.05 else 'No'} (α=0.05)")
+
+        csv_path = OUTPUT_DIR / "police_deaths.csv"
+        if not args.no_save and args.append_day is None:
+            df.to_csv(csv_path, index=False)
+            print("\nData saved to output/police_deaths.csv")
+        elif not args.no_save:
+            df.to_csv(csv_path, mode="a", header=not csv_path.exists(), index=False)
+            print("\nData appended to output/police_deaths.csv")
+        timings = figures.wait()
+    rendered = time.perf_counter()
+
+    print(f"\n--- Figures ({', '.join(args.formats)}, "
+          f"{args.workers or 'no'} worker{'s' if args.workers != 1 else ''}) ---")
+    for name, seconds, paths in timings:
+        print(f"{name:<20} {seconds:6.2f} s  {', '.join(p.name for p in paths)}")
+    print(f"{'total render':<20} {sum(t for _, t, _ in timings):6.2f} s")
+    print(f"\nGenerate {generated - start:.2f} s, count + save cube {counted - generated:.2f} s, "
+          f"report {computed - counted:.3f} s, render + test + save {rendered - computed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
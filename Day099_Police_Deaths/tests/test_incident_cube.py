@@ -0,0 +1,134 @@
+"""Tests for the Day 99 incident count cube."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from incident_cube import CUBE_FILE, CUBE_MANIFEST, IncidentCube
+from police_deaths_analysis import generate_incidents
+
+
+@pytest.fixture(scope="module")
+def incidents() -> pd.DataFrame:
+    return generate_incidents(scale=0.5)
+
+
+def _totals(cube: IncidentCube) -> dict:
+    return {
+        "state_year": cube.total("state", "year"),
+        "race_armed": cube.total("race", "armed"),
+        "month": cube.total("month"),
+        "circumstance": cube.total("circumstance"),
+        "age": cube.total("age"),
+    }
+
+
+def test_totals_match_groupby(incidents: pd.DataFrame) -> None:
+    cube = IncidentCube.from_frame(incidents)
+    assert cube.rows == len(incidents)
+    assert cube.counts[("state", "year", "month", "race", "armed")].shape == (50, 23, 12, 6, 7)
+    expected = incidents.groupby(["race", "month"], observed=True).size()
+    both = cube.total("race", "month").stack()
+    assert both[both > 0].to_dict() == expected.to_dict()
+    assert cube.total("armed", "race").equals(cube.total("race", "armed").T)
+    assert list(cube.total("year").index) == list(range(2000, 2023))
+    three = cube.total("state", "year", "month")
+    assert three.index.names == ["state", "year", "month"]
+    assert three.sum() == len(incidents)
+
+
+def test_appending_in_batches_equals_counting_once(incidents: pd.DataFrame) -> None:
+    whole = IncidentCube.from_frame(incidents)
+    batched = IncidentCube()
+    for start in range(0, len(incidents), 1500):
+        batched.append(incidents.iloc[start : start + 1500])
+    assert batched.rows == whole.rows
+    for name, table in _totals(whole).items():
+        pd.testing.assert_frame_equal(pd.DataFrame(_totals(batched)[name]), pd.DataFrame(table))
+
+
+def test_new_labels_grow_the_axis_in_order(incidents: pd.DataFrame) -> None:
+    cube = IncidentCube.from_frame(incidents)
+    day = generate_incidents(scale=100, seed=1, day=pd.Timestamp("2023-01-01"))
+    day.loc[day.index[0], "age"] = 14  # below every age seen so far
+    cube.append(day)
+    years = cube.total("year")
+    assert years.index[-1] == 2023 and years[2023] == len(day)
+    assert cube.total("age").index.is_monotonic_increasing
+    assert cube.total("age")[14] == 1
+    assert cube.total("state", "year")[2023].sum() == len(day)
+
+
+def test_unused_categories_stay_off_the_axes(incidents: pd.DataFrame) -> None:
+    batch = incidents[incidents["race"].isin(["White", "Black"])].head(20)
+    assert len(batch["race"].cat.categories) == 6
+    cube = IncidentCube.from_frame(batch)
+    assert sorted(cube.axes["race"]) == ["Black", "White"]
+    assert (cube.total("race", "armed").sum(axis=1) > 0).all()
+    assert (cube.total("race", "armed").sum(axis=0) > 0).all()
+
+
+def test_missing_values_are_rejected(incidents: pd.DataFrame) -> None:
+    batch = incidents.head(10).copy()
+    batch["race"] = batch["race"].astype(object)
+    batch.loc[batch.index[0], "race"] = None
+    cube = IncidentCube()
+    with pytest.raises(ValueError, match="race"):
+        cube.append(batch)
+
+
+def test_unknown_dimensions_are_rejected() -> None:
+    with pytest.raises(KeyError):
+        IncidentCube().total("state", "circumstance")
+
+
+def test_save_and_load_round_trip(incidents: pd.DataFrame, tmp_path: Path) -> None:
+    cube = IncidentCube.from_frame(incidents)
+    cube.save(tmp_path)
+    loaded = IncidentCube.load(tmp_path)
+    assert loaded.rows == cube.rows
+    for group, counts in cube.counts.items():
+        np.testing.assert_array_equal(loaded.counts[group], counts)
+    for name, table in _totals(cube).items():
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(_totals(loaded)[name]), pd.DataFrame(table), check_index_type=False
+        )
+    # A loaded cube keeps accepting appends
+    loaded.append(incidents.head(3))
+    assert loaded.rows == cube.rows + 3
+
+
+def test_a_day_is_appended_once(incidents: pd.DataFrame, tmp_path: Path) -> None:
+    cube = IncidentCube.from_frame(incidents)
+    day = generate_incidents(scale=10, seed=1, day=pd.Timestamp("2023-01-01"))
+    cube.append(day, day="2023-01-01")
+    cube.save(tmp_path)
+
+    loaded = IncidentCube.load(tmp_path)
+    assert loaded.days == ["2023-01-01"]
+    with pytest.raises(ValueError, match="already"):
+        loaded.append(day, day="2023-01-01")
+    assert loaded.rows == len(incidents) + len(day)
+    assert loaded.total("year")[2023] == len(day)
+
+
+def test_load_rejects_a_tampered_or_missing_cube(incidents: pd.DataFrame, tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        IncidentCube.load(tmp_path)
+    IncidentCube.from_frame(incidents).save(tmp_path)
+    with (tmp_path / CUBE_FILE).open("r+b") as f:
+        f.seek(-1, 2)
+        f.write(b"\x00" if f.read(1) != b"\x00" else b"\x01")
+    with pytest.raises(ValueError, match="checksum"):
+        IncidentCube.load(tmp_path)
+    IncidentCube.load(tmp_path, verify=False)
+
+    manifest = json.loads((tmp_path / CUBE_MANIFEST).read_text())
+    manifest["format_version"] = 99
+    (tmp_path / CUBE_MANIFEST).write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match="format"):
+        IncidentCube.load(tmp_path)
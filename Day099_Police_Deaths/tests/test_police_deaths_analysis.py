@@ -0,0 +1,132 @@
+"""Tests for the Day 99 compute and render stages."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+import police_deaths_analysis
+import pytest
+from scipy.stats import chi2_contingency
+from incident_cube import IncidentCube
+from police_deaths_analysis import (
+    FIGURES,
+    armed_status,
+    compute_report,
+    generate_incidents,
+    main,
+    parse_formats,
+    races,
+    render_figure,
+    states,
+)
+
+
+@pytest.fixture(scope="module")
+def incidents() -> pd.DataFrame:
+    return generate_incidents(scale=0.5)
+
+
+@pytest.fixture(scope="module")
+def report(incidents: pd.DataFrame) -> dict:
+    return compute_report(IncidentCube.from_frame(incidents))
+
+
+def test_every_table_accounts_for_every_incident(incidents: pd.DataFrame, report: dict) -> None:
+    n = len(incidents)
+    for table in ("state", "race", "yearly", "circumstance", "age", "armed"):
+        assert report[table].sum() == n, table
+    assert report["heatmap"].to_numpy().sum() == n
+    assert report["contingency"].to_numpy().sum() == n
+
+
+def test_tables_stay_small_whatever_the_row_count(report: dict) -> None:
+    assert report["heatmap"].shape == (len(states), 23)
+    assert report["contingency"].shape == (len(races), len(armed_status))
+    assert report["age"].index.is_monotonic_increasing
+    assert report["age"].index.min() >= 15 and report["age"].index.max() <= 80
+
+
+def test_tables_match_the_frame_scans_they_replace(incidents: pd.DataFrame, report: dict) -> None:
+    def same(derived, expected) -> None:
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(derived), pd.DataFrame(expected),
+            check_dtype=False, check_index_type=False, check_column_type=False,
+            check_categorical=False,
+        )
+
+    same(report["contingency"], pd.crosstab(incidents["race"], incidents["armed"]))
+    same(report["heatmap"],
+         incidents.pivot_table(index="state", columns="year", aggfunc="size", fill_value=0))
+    same(report["yearly"].rename(None), incidents.groupby("year").size())
+    same(report["age"], incidents["age"].value_counts().sort_index())
+    for table, column in (("state", "state"), ("race", "race"), ("armed", "armed")):
+        assert report[table].to_dict() == incidents[column].value_counts().to_dict()
+        assert report[table].is_monotonic_decreasing
+
+
+@pytest.mark.parametrize("scale", [0.001, 0.0001])
+def test_chi_square_runs_at_small_scales(scale: float) -> None:
+    # A few incidents leave most races and armed statuses unused
+    report = compute_report(IncidentCube.from_frame(generate_incidents(scale=scale)))
+    chi2, p, _, _ = chi2_contingency(report["contingency"])
+    assert chi2 >= 0 and 0 <= p <= 1
+
+
+def test_generate_one_day(incidents: pd.DataFrame) -> None:
+    day = generate_incidents(scale=100, seed=1, day=pd.Timestamp("2023-01-01"))
+    assert len(day) == round(8000 * 100 / 8401)
+    assert (day["date"] == pd.Timestamp("2023-01-01")).all()
+    assert list(day.columns) == list(incidents.columns)
+
+
+@pytest.mark.parametrize("name", list(FIGURES))
+def test_render_figure_writes_each_format(name: str, report: dict, tmp_path: Path) -> None:
+    _, table = FIGURES[name]
+    rendered, seconds, paths = render_figure(name, report[table], tmp_path, ("png", "svg"))
+    assert rendered == name
+    assert seconds > 0
+    assert paths == [tmp_path / f"{name}.png", tmp_path / f"{name}.svg"]
+    assert all(path.stat().st_size > 0 for path in paths)
+
+
+def test_parse_formats() -> None:
+    assert parse_formats("png,svg") == ("png", "svg")
+    assert parse_formats(" SVG, png ,svg") == ("svg", "png")
+    with pytest.raises(argparse.ArgumentTypeError, match="jpeg"):
+        parse_formats("png,jpeg")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_formats(",")
+
+
+def test_append_day_twice_changes_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    monkeypatch.setattr(police_deaths_analysis, "OUTPUT_DIR", tmp_path)
+    cube_dir = tmp_path / "cube"
+
+    def run(*args: str) -> None:
+        monkeypatch.setattr(
+            sys, "argv", ["police_deaths_analysis.py", "--scale", "0.1", "--workers", "0",
+                          "--formats", "svg", "--cube", str(cube_dir), *args],
+        )
+        main()
+
+    run()
+    run("--append-day", "2023-01-01")
+    appended = IncidentCube.load(cube_dir)
+    csv_rows = len(pd.read_csv(tmp_path / "police_deaths.csv"))
+    assert appended.days == ["2023-01-01"]
+    assert csv_rows == appended.rows > 800
+
+    capsys.readouterr()
+    run("--append-day", "2023-01-01")
+    assert "already" in capsys.readouterr().out
+    assert IncidentCube.load(cube_dir).rows == appended.rows
+    assert len(pd.read_csv(tmp_path / "police_deaths.csv")) == csv_rows
+
+    # A full rebuild starts the list of appended days afresh
+    run()
+    assert IncidentCube.load(cube_dir).days == []
@@ -0,0 +1,111 @@
+"""
+Stage benchmarks for Day 100, run by the shared harness.
+
+Sizes are rows of ``generate_synthetic_data`` (the pipeline's default
+is 5,000). The search stages run at the smaller sizes only; a full
+grid search at 5,000 rows takes about a minute per call.
+
+Usage (from the repo root):
+    python -m shared.benchmark Day100_Earnings_Predictor
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from pathlib import Path
+
+from earnings_predictor import (
+    RANDOM_STATE,
+    TARGET_COL,
+    evaluate_baseline_models,
+    generate_synthetic_data,
+    iter_synthetic_chunks,
+    plot_correlation_matrix,
+    plot_eda,
+    plot_feature_importance,
+    plot_predictions_vs_actual,
+    split_data,
+    train_streaming,
+    tune_gradient_boosting,
+)
+from sklearn.ensemble import GradientBoostingRegressor
+
+# The benchmark harness lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.benchmark import Stage
+
+SIZES = (1_000, 5_000, 20_000)
+STREAM_CHUNK_SIZE = 10_000
+
+
+@functools.cache
+def earnings(n: int):
+    return generate_synthetic_data(n)
+
+
+@functools.cache
+def split(n: int):
+    return split_data(earnings(n))
+
+
+@functools.cache
+def fitted(n: int):
+    """A default GradientBoostingRegressor and its test predictions, for the plot stages."""
+    X_train, X_test, y_train, _, _ = split(n)
+    model = GradientBoostingRegressor(random_state=RANDOM_STATE).fit(X_train, y_train)
+    return model, model.predict(X_test)
+
+
+def _train_args(n: int, scratch: Path) -> tuple:
+    X_train, X_test, y_train, y_test, _ = split(n)
+    return X_train, y_train, X_test, y_test
+
+
+def _tune(strategy: str):
+    def tune(X_train, y_train):
+        return tune_gradient_boosting(X_train, y_train, strategy=strategy)
+
+    return tune
+
+
+def _tune_args(n: int, scratch: Path) -> tuple:
+    X_train, _, y_train, _, _ = split(n)
+    return X_train, y_train
+
+
+def _stream_args(n: int, scratch: Path) -> tuple:
+    return (lambda: iter_synthetic_chunks(n, STREAM_CHUNK_SIZE),)
+
+
+def _features(n: int):
+    return earnings(n).drop(columns=[TARGET_COL]).columns
+
+
+STAGES = [
+    Stage("split_data", split_data, lambda n, scratch: (earnings(n),)),
+    Stage("evaluate_baseline_models", evaluate_baseline_models, _train_args, sizes=SIZES[:2]),
+    Stage("train_streaming", train_streaming, _stream_args),
+    Stage("tune_gradient_boosting[grid]", _tune("grid"), _tune_args, sizes=SIZES[:1]),
+    Stage("tune_gradient_boosting[halving]", _tune("halving"), _tune_args, sizes=SIZES[:1]),
+    Stage(
+        "plot_eda",
+        plot_eda,
+        lambda n, scratch: (earnings(n), scratch / "eda.png"),
+    ),
+    Stage(
+        "plot_correlation_matrix",
+        plot_correlation_matrix,
+        lambda n, scratch: (earnings(n), scratch / "correlation_matrix.png"),
+    ),
+    Stage(
+        "plot_feature_importance",
+        plot_feature_importance,
+        lambda n, scratch: (fitted(n)[0], _features(n), scratch / "importance.png"),
+    ),
+    Stage(
+        "plot_predictions_vs_actual",
+        plot_predictions_vs_actual,
+        lambda n, scratch: (split(n)[3], fitted(n)[1], scratch / "predictions.png"),
+    ),
+]
@@ -1,8 +1,10 @@
 """Day 100 capstone: predict earnings from education, experience, and other features.
 
 This module generates a synthetic earnings dataset, performs exploratory
-analysis, trains a small model zoo, tunes the best one with GridSearchCV,
-and writes the trained model outputs to disk.
+analysis, trains a small model zoo, tunes Gradient Boosting with one of
+the ``SEARCH_STRATEGIES`` (grid, successive halving, warm-start or a
+time-budgeted random search), and writes the trained model outputs to
+disk.
 
 The data is synthetic — earnings are a deterministic function of the
 features plus noise — so the metrics are illustrative rather than
@@ -12,6 +14,11 @@ pipeline structure, not the model accuracy.
 Run from the command line:
 
     python earnings_predictor.py
+    python earnings_predictor.py --no-plots
+    python earnings_predictor.py --search-strategy random --time-budget 20
+    python earnings_predictor.py --compare-search
+    python earnings_predictor.py --stream-rows 100_000_000
+    python earnings_predictor.py --predict partitions/ --output scores.parquet
 
 Or import the pipeline:
 
@@ -21,33 +28,66 @@ Or import the pipeline:
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
 import warnings
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import matplotlib
-
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
+import joblib
 import numpy as np
 import pandas as pd
-import seaborn as sns
+import sklearn
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
-from sklearn.linear_model import Lasso, LinearRegression, Ridge
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import GridSearchCV, cross_val_score, train_test_split
+from sklearn.linear_model import Lasso, LinearRegression, Ridge, SGDRegressor
+from sklearn.metrics import get_scorer, mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    KFold,
+    ParameterGrid,
+    train_test_split,
+)
 from sklearn.preprocessing import StandardScaler
 
+# Lazy plotting imports and the background plot stage live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.plotting import PLOT_WORKERS, PlotStage, pyplot, seaborn
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for Parquet input and output
+    pa = pq = None
+
 warnings.filterwarnings("ignore")
 
-sns.set_theme(style="whitegrid")
 np.random.seed(42)
 
 OUTPUT_DIR = Path(__file__).parent
+MODEL_CACHE_DIR = OUTPUT_DIR / "model_cache"
+PARTITION_DIR = OUTPUT_DIR / "partitions"
+ARTIFACT_DIR = OUTPUT_DIR / "artifacts"
 DATA_N = 5000
 TEST_SIZE = 0.2
 RANDOM_STATE = 42
+CV_FOLDS = 5
+CHUNK_SIZE = 1_000_000
+PREDICT_CHUNK_SIZE = 250_000
+# Bump when the artifact layout or manifest fields change incompatibly
+ARTIFACT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+PREDICTION_COL = "predicted_earnings"
 
 JOB_CATEGORIES = [
     "Tech",
@@ -76,6 +116,26 @@ NUMERIC_FEATURES = [
 ]
 TARGET_COL = "earnings"
 
+# Dollars per unit of each feature, before the job-category multiplier
+EARNINGS_WEIGHTS = {
+    "education_years": 2500,
+    "experience_years": 1200,
+    "hours_per_week": 200,
+    "certifications": 3000,
+}
+# Chunked generator: 10 bytes a row instead of ~100 (int64 + object strings)
+STREAM_DTYPES = {
+    "education_years": np.int8,
+    "experience_years": np.int8,
+    "hours_per_week": np.int8,
+    "age": np.int8,
+    "certifications": np.int8,
+    TARGET_COL: np.int32,
+}
+# get_dummies orders categories alphabetically; fixing them keeps every
+# chunk's one-hot columns identical to generate_synthetic_data's
+JOB_CATEGORY_DTYPE = pd.CategoricalDtype(sorted(JOB_CATEGORIES))
+
 BASELINE_MODELS: dict[str, Any] = {
     "Linear Regression": LinearRegression(),
     "Ridge Regression": Ridge(alpha=1.0),
@@ -92,6 +152,13 @@ GRADIENT_BOOSTING_PARAM_GRID: dict[str, list[Any]] = {
     "max_depth": [3, 5, 7],
     "learning_rate": [0.05, 0.1, 0.2],
 }
+# "grid": exhaustive GridSearchCV, every n_estimators trained from scratch
+# "halving": HalvingGridSearchCV, candidates race on growing row samples
+# "warm_start": exhaustive, but each n_estimators extends the previous fit
+# "random": warm_start over the grid in random order, stopped by a time budget
+SEARCH_STRATEGIES = ("grid", "halving", "warm_start", "random")
+# Only WarmStartSearchCV can stop between candidates; grid and halving run to the end
+BUDGETED_STRATEGIES = ("warm_start", "random")
 
 
 def generate_synthetic_data(n: int = DATA_N, seed: int = RANDOM_STATE) -> pd.DataFrame:
@@ -123,25 +190,134 @@ def generate_synthetic_data(n: int = DATA_N, seed: int = RANDOM_STATE) -> pd.Dat
         },
     )
 
-    base_earnings = (
-        15000
-        + df["education_years"] * 2500
-        + df["experience_years"] * 1200
-        + df["hours_per_week"] * 200
-        + df["certifications"] * 3000
-        + rng.normal(0, 10000, n)
-    )
-    df[TARGET_COL] = np.clip(
-        base_earnings * df["job_category"].map(JOB_MULTIPLIERS),
-        15_000,
-        250_000,
+    df[TARGET_COL] = _earnings(
+        df,
+        df["job_category"].map(JOB_MULTIPLIERS),
+        rng.normal(0, 10000, n),
     ).astype(int)
 
     return pd.get_dummies(df, columns=["job_category"], drop_first=True)
 
 
+def _earnings(features: Mapping[str, Any], multiplier: Any, noise: np.ndarray) -> np.ndarray:
+    """Earnings formula shared by the in-memory and chunked generators."""
+    base = 15000
+    for column, weight in EARNINGS_WEIGHTS.items():
+        # widen first: int8 columns would overflow
+        base = base + np.asarray(features[column], dtype=np.int32) * weight
+    return np.clip((base + noise) * np.asarray(multiplier, dtype=np.float64), 15_000, 250_000)
+
+
+def synthetic_chunk(index: int, size: int, seed: int = RANDOM_STATE) -> pd.DataFrame:
+    """Generate chunk ``index`` of a chunked synthetic dataset.
+
+    Each chunk draws from its own stream, ``SeedSequence(seed)``'s
+    ``index``-th spawned child, so any chunk can be regenerated (or
+    generated by another process) without producing the ones before it.
+    Columns use ``STREAM_DTYPES`` and ``job_category`` stays a
+    categorical; :func:`encode_chunk` turns it into model inputs.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    codes = rng.integers(0, len(JOB_CATEGORY_DTYPE.categories), size, dtype=np.int8)
+    job_category = pd.Categorical.from_codes(codes, dtype=JOB_CATEGORY_DTYPE)
+    chunk = pd.DataFrame(
+        {
+            "education_years": rng.integers(8, 22, size, dtype=np.int8),
+            "experience_years": rng.integers(0, 40, size, dtype=np.int8),
+            "hours_per_week": rng.integers(20, 80, size, dtype=np.int8),
+            "age": rng.integers(18, 65, size, dtype=np.int8),
+            "certifications": np.minimum(rng.poisson(2, size), 127).astype(np.int8),
+            "job_category": job_category,
+        },
+    )
+    multipliers = np.array([JOB_MULTIPLIERS[c] for c in JOB_CATEGORY_DTYPE.categories])
+    chunk[TARGET_COL] = _earnings(chunk, multipliers[codes], rng.normal(0, 10000, size)).astype(
+        np.int32,
+    )
+    return chunk
+
+
+def iter_synthetic_chunks(
+    n: int,
+    chunk_size: int = CHUNK_SIZE,
+    seed: int = RANDOM_STATE,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``n`` synthetic rows as :func:`synthetic_chunk` batches of ``chunk_size``.
+
+    Only one chunk is in memory at a time. The same ``(n, chunk_size,
+    seed)`` always yields the same rows.
+    """
+    for index, start in enumerate(range(0, n, chunk_size)):
+        yield synthetic_chunk(index, min(chunk_size, n - start), seed)
+
+
+def encode_chunk(chunk: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Split a chunk into a float32 feature matrix and the target.
+
+    The feature columns (:func:`stream_feature_names`) match
+    ``generate_synthetic_data(...).drop(columns=[TARGET_COL])`` whenever
+    that frame contains every job category; here the set is fixed, so
+    every chunk has all of them.
+    """
+    dummies = pd.get_dummies(chunk["job_category"], prefix="job_category", drop_first=True)
+    features = chunk.drop(columns=[TARGET_COL, "job_category"])
+    X = np.hstack([features.to_numpy(np.float32), dummies.to_numpy(np.float32)])
+    return X, chunk[TARGET_COL].to_numpy()
+
+
+def stream_feature_names() -> list[str]:
+    """Column names of the :func:`encode_chunk` feature matrix."""
+    numeric = [column for column in STREAM_DTYPES if column != TARGET_COL]
+    return numeric + [f"job_category_{c}" for c in JOB_CATEGORY_DTYPE.categories[1:]]
+
+
+def _write_partition(index: int, size: int, seed: int, path: Path) -> Path:
+    """Generate one chunk and write it to ``path``."""
+    synthetic_chunk(index, size, seed).to_parquet(path, engine="pyarrow", index=False)
+    return path
+
+
+def write_parquet_partitions(
+    output_dir: Path,
+    n: int,
+    chunk_size: int = CHUNK_SIZE,
+    seed: int = RANDOM_STATE,
+    n_jobs: int | None = 1,
+) -> list[Path]:
+    """Write ``n`` synthetic rows to ``output_dir/part-NNNNN.parquet``, one file per chunk.
+
+    Chunks are independent, so ``n_jobs`` processes can generate and
+    write them in parallel. Requires ``pyarrow``.
+
+    Returns:
+        The partition paths, in chunk order.
+    """
+    if pq is None:
+        raise ImportError("writing Parquet partitions requires pyarrow (pip install pyarrow)")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        delayed(_write_partition)(
+            index,
+            min(chunk_size, n - start),
+            seed,
+            output_dir / f"part-{index:05d}.parquet",
+        )
+        for index, start in enumerate(range(0, n, chunk_size))
+    ]
+    return Parallel(n_jobs=n_jobs)(tasks)
+
+
+def iter_parquet_chunks(paths: Iterable[Path]) -> Iterator[pd.DataFrame]:
+    """Yield the partitions written by :func:`write_parquet_partitions`, one at a time."""
+    if pq is None:
+        raise ImportError("reading Parquet partitions requires pyarrow (pip install pyarrow)")
+    for path in paths:
+        yield pq.read_table(path).to_pandas()
+
+
 def plot_eda(df: pd.DataFrame, output_path: Path) -> None:
     """Save a 2x3 EDA grid to ``output_path``."""
+    plt = pyplot()
     fig, axes = plt.subplots(2, 3, figsize=(16, 10))
     fig.suptitle(
         "Earnings Prediction: Exploratory Data Analysis",
@@ -174,6 +350,7 @@ def plot_eda(df: pd.DataFrame, output_path: Path) -> None:
 
 def plot_correlation_matrix(df: pd.DataFrame, output_path: Path) -> None:
     """Save a triangle correlation heatmap to ``output_path``."""
+    plt, sns = pyplot(), seaborn()
     _fig, ax = plt.subplots(figsize=(12, 10))
     corr = df.corr()
     mask = np.triu(np.ones_like(corr, dtype=bool))
@@ -217,37 +394,340 @@ def split_data(
     return X_train_scaled, X_test_scaled, y_train, y_test, scaler
 
 
+def train_streaming(
+    make_chunks: Callable[[], Iterable[pd.DataFrame]],
+    model: Any = None,
+    epochs: int = 1,
+) -> tuple[StandardScaler, Any]:
+    """Fit a scaler and a ``partial_fit`` model without holding the data in memory.
+
+    The first pass over ``make_chunks()`` fits the ``StandardScaler``
+    incrementally; each of the ``epochs`` further passes feeds every
+    scaled chunk to ``model.partial_fit``.
+
+    Args:
+        make_chunks: Returns a fresh iterable of raw chunks on each call,
+            e.g. ``lambda: iter_parquet_chunks(paths)``.
+        model: Any regressor with ``partial_fit``. Defaults to an
+            ``SGDRegressor``.
+        epochs: Passes over the data for the model.
+
+    Returns:
+        Tuple of (fitted scaler, fitted model).
+    """
+    if model is None:
+        model = SGDRegressor(random_state=RANDOM_STATE)
+    scaler = StandardScaler()
+    for chunk in make_chunks():
+        scaler.partial_fit(encode_chunk(chunk)[0])
+    for _ in range(epochs):
+        for chunk in make_chunks():
+            X, y = encode_chunk(chunk)
+            model.partial_fit(scaler.transform(X), y)
+    return scaler, model
+
+
+def score_streaming(
+    scaler: StandardScaler,
+    model: Any,
+    chunks: Iterable[pd.DataFrame],
+) -> dict[str, float]:
+    """R² and MAE of ``model`` over ``chunks``, accumulated chunk by chunk."""
+    n = 0
+    abs_error = sq_error = y_sum = y_sq_sum = 0.0
+    for chunk in chunks:
+        X, y = encode_chunk(chunk)
+        y = y.astype(np.float64)
+        residual = y - model.predict(scaler.transform(X))
+        n += len(y)
+        abs_error += float(np.abs(residual).sum())
+        sq_error += float(residual @ residual)
+        y_sum += float(y.sum())
+        y_sq_sum += float(y @ y)
+    total = y_sq_sum - y_sum**2 / n
+    return {"r2": 1 - sq_error / total, "mae": abs_error / n, "rows": n}
+
+
+def run_streaming(
+    n: int,
+    partition_dir: Path = PARTITION_DIR,
+    chunk_size: int = CHUNK_SIZE,
+    n_jobs: int | None = 1,
+) -> dict[str, Any]:
+    """Write ``n`` rows as Parquet partitions and train on them out of core.
+
+    The last partition is held out for scoring; the rest train an
+    ``SGDRegressor`` via :func:`train_streaming`. Memory use is bounded
+    by ``chunk_size``, not ``n``.
+
+    Returns:
+        Dict with ``r2``, ``mae``, ``rows`` (scored), ``write_seconds``
+        and ``train_seconds``.
+    """
+    start = time.perf_counter()
+    paths = write_parquet_partitions(partition_dir, n, chunk_size, n_jobs=n_jobs)
+    write_seconds = time.perf_counter() - start
+    print(f"Wrote {n:,} rows to {len(paths)} partitions in {write_seconds:.1f}s")
+    if len(paths) < 2:
+        raise ValueError("need at least two partitions: lower chunk_size or raise n")
+
+    train_paths, test_paths = paths[:-1], paths[-1:]
+    start = time.perf_counter()
+    scaler, model = train_streaming(lambda: iter_parquet_chunks(train_paths))
+    train_seconds = time.perf_counter() - start
+    scores = score_streaming(scaler, model, iter_parquet_chunks(test_paths))
+    print(
+        f"Trained on {n - scores['rows']:,} rows in {train_seconds:.1f}s; "
+        f"hold-out R²={scores['r2']:.4f} MAE=${scores['mae']:,.0f}",
+    )
+    return {**scores, "write_seconds": write_seconds, "train_seconds": train_seconds}
+
+
+def data_fingerprint(*arrays: Any) -> str:
+    """SHA-256 over the shape, dtype and bytes of each array."""
+    digest = hashlib.sha256()
+    for array in arrays:
+        values = np.ascontiguousarray(np.asarray(array))
+        digest.update(f"{values.shape}|{values.dtype}|".encode())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def model_cache_key(model: Any, data_hash: str, cv: int = CV_FOLDS) -> str:
+    """Content address of one baseline evaluation.
+
+    Covers the estimator class and its full parameter set, the training
+    and test data, the number of CV folds and the scikit-learn version,
+    so changing any of them misses the cache. The display name is left
+    out on purpose: renaming a model doesn't refit it.
+    """
+    params = sorted(model.get_params(deep=True).items())
+    spec = (
+        f"{type(model).__module__}.{type(model).__qualname__}|{params!r}|"
+        f"cv={cv}|sklearn={sklearn.__version__}|{data_hash}"
+    )
+    return hashlib.sha256(spec.encode()).hexdigest()
+
+
+def _fold_r2(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    val_idx: np.ndarray,
+) -> float:
+    """Fit ``model`` on one CV training fold and score R² on its validation fold."""
+    model.fit(X[train_idx], y[train_idx])
+    return float(r2_score(y[val_idx], model.predict(X[val_idx])))
+
+
+def _holdout_metrics(
+    model: Any,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+) -> dict[str, float]:
+    """Fit ``model`` on the full training set and score it on the hold-out set."""
+    model.fit(X_train, y_train)
+    pred = model.predict(X_test)
+    return {
+        "MAE": float(mean_absolute_error(y_test, pred)),
+        "RMSE": float(np.sqrt(mean_squared_error(y_test, pred))),
+        "R2": float(r2_score(y_test, pred)),
+    }
+
+
 def evaluate_baseline_models(
     X_train: np.ndarray,
     y_train: pd.Series,
     X_test: np.ndarray,
     y_test: pd.Series,
+    *,
+    cv: int = CV_FOLDS,
+    n_jobs: int | None = -1,
+    backend: str | None = None,
+    cache_dir: Path | None = None,
 ) -> pd.DataFrame:
     """Train each baseline model and return a metrics DataFrame.
 
-    Each row is one model, with MAE, RMSE, R², and 5-fold CV R² (mean and std).
+    Each row is one model, with MAE, RMSE, R², and ``cv``-fold CV R²
+    (mean and std). Every CV fold and every hold-out fit is its own
+    joblib task, so all models and folds run concurrently in one pool
+    instead of one model at a time. The folds are the unshuffled
+    ``KFold`` that ``cross_val_score`` uses, so the scores match it.
+
+    Args:
+        X_train: Scaled training features.
+        y_train: Training target.
+        X_test: Scaled test features.
+        y_test: Test target.
+        cv: Number of cross-validation folds.
+        n_jobs: joblib worker count (``-1`` = all cores, ``1`` = in-process).
+        backend: joblib backend, e.g. ``"loky"`` (processes, the default)
+            or ``"threading"``.
+        cache_dir: If given, each model's metrics are stored there as
+            ``<key>.json`` (see :func:`model_cache_key`) and models with
+            a stored result are not fitted again.
     """
-    results: list[dict[str, Any]] = []
-    for name, model in BASELINE_MODELS.items():
-        model.fit(X_train, y_train)
-        pred = model.predict(X_test)
+    X_train, y_train = np.asarray(X_train), np.asarray(y_train)
+    X_test, y_test = np.asarray(X_test), np.asarray(y_test)
+    data_hash = data_fingerprint(X_train, y_train, X_test, y_test)
 
-        mae = mean_absolute_error(y_test, pred)
-        rmse = float(np.sqrt(mean_squared_error(y_test, pred)))
-        r2 = r2_score(y_test, pred)
-        cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring="r2")
+    rows: dict[str, dict[str, float]] = {}
+    keys: dict[str, str] = {}
+    for name, model in BASELINE_MODELS.items():
+        keys[name] = model_cache_key(model, data_hash, cv)
+        cached = cache_dir / f"{keys[name]}.json" if cache_dir is not None else None
+        if cached is not None and cached.exists():
+            rows[name] = json.loads(cached.read_text())
+
+    pending = [name for name in BASELINE_MODELS if name not in rows]
+    folds = list(KFold(n_splits=cv).split(X_train))
+    tasks = []
+    for name in pending:
+        model = BASELINE_MODELS[name]
+        tasks.append(delayed(_holdout_metrics)(clone(model), X_train, y_train, X_test, y_test))
+        tasks.extend(
+            delayed(_fold_r2)(clone(model), X_train, y_train, train_idx, val_idx)
+            for train_idx, val_idx in folds
+        )
+    outputs = Parallel(n_jobs=n_jobs, backend=backend)(tasks) if tasks else []
+
+    per_model = 1 + cv
+    for i, name in enumerate(pending):
+        holdout, *cv_scores = outputs[i * per_model : (i + 1) * per_model]
+        rows[name] = {
+            **holdout,
+            "CV_R2": float(np.mean(cv_scores)),
+            "CV_Std": float(np.std(cv_scores)),
+        }
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            path = cache_dir / f"{keys[name]}.json"
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(rows[name]))
+            tmp.replace(path)
+
+    return pd.DataFrame([{"Model": name, **rows[name]} for name in BASELINE_MODELS])
+
+
+class WarmStartSearchCV(BaseEstimator):
+    """Grid search that grows ``n_estimators`` with ``warm_start`` instead of refitting.
+
+    Candidates that differ only in ``n_estimators`` share one model per
+    fold: it is fitted with the smallest value, scored, then extended to
+    the next value and scored again, so the 50/100/200 column costs 200
+    trees instead of 350. The candidates and folds are the same as
+    ``GridSearchCV``'s, but the scores need not be: they only match when
+    the estimator has a fixed ``random_state`` (scikit-learn then carries
+    the random state across warm-start fits) and no early stopping, so
+    treat the two searches as covering the same space, not as
+    interchangeable.
+
+    The remaining parameter combinations are visited in grid order, or
+    in random order with ``shuffle=True``. With ``time_budget`` set, the
+    search stops starting new combinations once that many seconds have
+    passed (the first combination always runs), which turns it into a
+    budgeted random search.
+
+    Exposes the ``GridSearchCV`` attributes the pipeline reads:
+    ``best_estimator_``, ``best_params_``, ``best_score_`` and a
+    ``cv_results_`` dict with ``params``, ``mean_test_score`` and
+    ``std_test_score``. ``budget_exhausted_`` tells whether the time
+    budget cut the search short.
+    """
 
-        results.append(
-            {
-                "Model": name,
-                "MAE": mae,
-                "RMSE": rmse,
-                "R2": r2,
-                "CV_R2": cv_scores.mean(),
-                "CV_Std": cv_scores.std(),
-            },
+    def __init__(
+        self,
+        estimator: Any,
+        param_grid: dict[str, list[Any]],
+        *,
+        cv: int = 3,
+        scoring: str = "r2",
+        time_budget: float | None = None,
+        shuffle: bool = False,
+        random_state: int | None = None,
+        n_jobs: int | None = None,
+    ) -> None:
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.cv = cv
+        self.scoring = scoring
+        self.time_budget = time_budget
+        self.shuffle = shuffle
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    def _fold_scores(
+        self,
+        params: dict[str, Any],
+        n_values: list[int],
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        val_idx: np.ndarray,
+    ) -> list[float]:
+        """Score one fold at every ``n_estimators`` value, extending a single model."""
+        scorer = get_scorer(self.scoring)
+        model = clone(self.estimator).set_params(**params, warm_start=True)
+        scores = []
+        for n in n_values:
+            model.set_params(n_estimators=n).fit(X[train_idx], y[train_idx])
+            scores.append(float(scorer(model, X[val_idx], y[val_idx])))
+        return scores
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> WarmStartSearchCV:
+        """Run the search, then refit the best candidate on all of ``X``."""
+        X, y = np.asarray(X), np.asarray(y)
+        start = time.perf_counter()
+        grid = dict(self.param_grid)
+        n_values = sorted(grid.pop("n_estimators", [self.estimator.get_params()["n_estimators"]]))
+        combos = list(ParameterGrid(grid))
+        if self.shuffle:
+            np.random.default_rng(self.random_state).shuffle(combos)
+        folds = list(KFold(n_splits=self.cv).split(X))
+
+        results: dict[str, list[Any]] = {"params": [], "mean_test_score": [], "std_test_score": []}
+        self.budget_exhausted_ = False
+        with Parallel(n_jobs=self.n_jobs) as parallel:
+            for params in combos:
+                if (
+                    self.time_budget is not None
+                    and results["params"]
+                    and time.perf_counter() - start >= self.time_budget
+                ):
+                    self.budget_exhausted_ = True
+                    break
+                fold_scores = np.array(
+                    parallel(
+                        delayed(self._fold_scores)(params, n_values, X, y, train_idx, val_idx)
+                        for train_idx, val_idx in folds
+                    ),
+                )
+                for column, n in enumerate(n_values):
+                    results["params"].append({**params, "n_estimators": n})
+                    results["mean_test_score"].append(float(fold_scores[:, column].mean()))
+                    results["std_test_score"].append(float(fold_scores[:, column].std()))
+
+        self.cv_results_ = results
+        self.best_index_ = int(np.argmax(results["mean_test_score"]))
+        self.best_params_ = results["params"][self.best_index_]
+        self.best_score_ = results["mean_test_score"][self.best_index_]
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        self.search_time_ = time.perf_counter() - start
+        return self
+
+
+def _check_search(strategy: str, time_budget: float | None) -> None:
+    """Reject an unknown ``strategy``, or a ``time_budget`` it can't honour."""
+    if strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f"unknown search strategy {strategy!r}; pick one of {SEARCH_STRATEGIES}")
+    if time_budget is not None and strategy not in BUDGETED_STRATEGIES:
+        raise ValueError(
+            f"the {strategy!r} search can't stop early; time_budget needs one of "
+            f"{BUDGETED_STRATEGIES}",
         )
-    return pd.DataFrame(results)
 
 
 def tune_gradient_boosting(
@@ -255,30 +735,110 @@ def tune_gradient_boosting(
     y_train: pd.Series,
     param_grid: dict[str, list[Any]] | None = None,
     cv: int = 3,
-) -> GridSearchCV:
-    """Tune a GradientBoostingRegressor via GridSearchCV.
+    n_jobs: int | None = -1,
+    strategy: str = "grid",
+    time_budget: float | None = None,
+) -> Any:
+    """Tune a GradientBoostingRegressor with one of ``SEARCH_STRATEGIES``.
 
     Args:
         X_train: Scaled training features.
         y_train: Training target.
         param_grid: Optional override for the search space.
         cv: Number of cross-validation folds.
+        n_jobs: joblib worker count for the search.
+        strategy: ``"grid"`` (GridSearchCV), ``"halving"``
+            (HalvingGridSearchCV), ``"warm_start"`` or ``"random"``
+            (both :class:`WarmStartSearchCV`).
+        time_budget: Seconds after which a ``"random"`` or
+            ``"warm_start"`` search stops trying new candidates.
+
+    Raises:
+        ValueError: Unknown ``strategy``, or ``time_budget`` given for a
+            strategy outside ``BUDGETED_STRATEGIES``.
 
     Returns:
-        A fitted GridSearchCV instance with ``best_estimator_``, ``best_params_``,
+        A fitted search with ``best_estimator_``, ``best_params_``,
         and ``best_score_`` available.
     """
+    _check_search(strategy, time_budget)
     if param_grid is None:
         param_grid = GRADIENT_BOOSTING_PARAM_GRID
-    grid = GridSearchCV(
-        GradientBoostingRegressor(random_state=RANDOM_STATE),
-        param_grid,
-        cv=cv,
-        scoring="r2",
-        n_jobs=-1,
-    )
-    grid.fit(X_train, y_train)
-    return grid
+    estimator = GradientBoostingRegressor(random_state=RANDOM_STATE)
+    if strategy == "grid":
+        search = GridSearchCV(estimator, param_grid, cv=cv, scoring="r2", n_jobs=n_jobs)
+    elif strategy == "halving":
+        search = HalvingGridSearchCV(
+            estimator,
+            param_grid,
+            cv=cv,
+            scoring="r2",
+            n_jobs=n_jobs,
+            random_state=RANDOM_STATE,
+        )
+    else:
+        search = WarmStartSearchCV(
+            estimator,
+            param_grid,
+            cv=cv,
+            scoring="r2",
+            time_budget=time_budget,
+            shuffle=strategy == "random",
+            random_state=RANDOM_STATE,
+            n_jobs=n_jobs,
+        )
+    search.fit(X_train, y_train)
+    return search
+
+
+def compare_search_strategies(
+    X_train: np.ndarray,
+    y_train: pd.Series,
+    X_test: np.ndarray,
+    y_test: pd.Series,
+    strategies: tuple[str, ...] = SEARCH_STRATEGIES,
+    time_budget: float | None = None,
+    **search_options: Any,
+) -> pd.DataFrame:
+    """Run each tuning strategy and tabulate wall-clock time against score.
+
+    ``time_budget`` applies to the ``BUDGETED_STRATEGIES``; the others
+    always run their full search.
+
+    Returns:
+        DataFrame with one row per strategy: ``Strategy``, ``Seconds``,
+        ``Candidates`` (parameter sets scored), ``Best_CV_R2``,
+        ``Test_R2`` and ``Best_Params``.
+    """
+    rows = []
+    for strategy in strategies:
+        start = time.perf_counter()
+        search = tune_gradient_boosting(
+            X_train,
+            y_train,
+            strategy=strategy,
+            time_budget=time_budget if strategy in BUDGETED_STRATEGIES else None,
+            **search_options,
+        )
+        seconds = time.perf_counter() - start
+        rows.append(
+            {
+                "Strategy": strategy,
+                "Seconds": seconds,
+                "Candidates": len(search.cv_results_["params"]),
+                "Best_CV_R2": float(search.best_score_),
+                "Test_R2": float(r2_score(y_test, search.best_estimator_.predict(X_test))),
+                "Best_Params": search.best_params_,
+            },
+        )
+    return pd.DataFrame(rows)
+
+
+def feature_importance_frame(model: Any, feature_names: pd.Index) -> pd.DataFrame:
+    """Feature importances sorted ascending (least to most important)."""
+    return pd.DataFrame(
+        {"Feature": feature_names, "Importance": model.feature_importances_},
+    ).sort_values("Importance")
 
 
 def plot_feature_importance(
@@ -291,10 +851,8 @@ def plot_feature_importance(
     Returns the importance DataFrame (sorted ascending so the chart
     reads top-to-bottom from least to most important).
     """
-    importance = model.feature_importances_
-    importance_df = pd.DataFrame(
-        {"Feature": feature_names, "Importance": importance},
-    ).sort_values("Importance")
+    plt = pyplot()
+    importance_df = feature_importance_frame(model, feature_names)
 
     _fig, ax = plt.subplots(figsize=(10, 6))
     ax.barh(importance_df["Feature"], importance_df["Importance"], color="steelblue")
@@ -312,6 +870,7 @@ def plot_predictions_vs_actual(
     output_path: Path,
 ) -> None:
     """Save a scatter plot of predictions vs actual values."""
+    plt = pyplot()
     _fig, ax = plt.subplots(figsize=(8, 8))
     ax.scatter(y_test, predictions, alpha=0.3, s=8, color="#3498db")
     ax.plot(
@@ -346,21 +905,233 @@ def save_predictions(
     return output
 
 
-def run_pipeline(output_dir: Path | None = None) -> dict[str, Any]:
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def feature_schema_hash(feature_names: Iterable[str]) -> str:
+    """SHA-256 of the ordered feature names a model expects."""
+    return hashlib.sha256(json.dumps(list(feature_names)).encode()).hexdigest()
+
+
+def export_artifact(
+    artifact_dir: Path,
+    scaler: StandardScaler,
+    model: Any,
+    feature_names: Iterable[str],
+    metrics: dict[str, float] | None = None,
+    params: dict[str, Any] | None = None,
+) -> Path:
+    """Save a fitted scaler + model with a manifest describing them.
+
+    ``scaler.joblib`` and ``model.joblib`` are written uncompressed so
+    :func:`load_artifact` can memory-map their arrays. ``manifest.json``
+    records the artifact format version, the library versions, the
+    feature names and their :func:`feature_schema_hash`, the model's
+    hyperparameters and metrics, and a SHA-256 of each file.
+
+    Returns:
+        Path of the manifest.
+    """
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    feature_names = list(feature_names)
+    files = {}
+    for name, obj in (("scaler", scaler), ("model", model)):
+        path = artifact_dir / f"{name}.joblib"
+        joblib.dump(obj, path)
+        files[name] = {"path": path.name, "sha256": _file_sha256(path)}
+
+    manifest = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python_version": platform.python_version(),
+        "sklearn_version": sklearn.__version__,
+        "numpy_version": np.__version__,
+        "model_class": f"{type(model).__module__}.{type(model).__qualname__}",
+        "params": params or {},
+        "metrics": metrics or {},
+        "feature_names": feature_names,
+        "feature_schema_hash": feature_schema_hash(feature_names),
+        "files": files,
+    }
+    manifest_path = artifact_dir / MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, indent=2, default=str))
+    return manifest_path
+
+
+def load_artifact(
+    artifact_dir: Path,
+    mmap_mode: str | None = "r",
+) -> tuple[StandardScaler, Any, dict[str, Any]]:
+    """Load an :func:`export_artifact` directory after checking its manifest.
+
+    Raises ``ValueError`` if the format version is unknown or a file's
+    checksum doesn't match. A different scikit-learn version only
+    warns, since the pickles usually still load.
+
+    Returns:
+        Tuple of (scaler, model, manifest).
+    """
+    manifest = json.loads((artifact_dir / MANIFEST_NAME).read_text())
+    if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(
+            f"unsupported artifact format {manifest.get('format_version')!r} "
+            f"(expected {ARTIFACT_FORMAT_VERSION})",
+        )
+    if manifest["sklearn_version"] != sklearn.__version__:
+        warnings.warn(
+            f"artifact was saved with scikit-learn {manifest['sklearn_version']}, "
+            f"running {sklearn.__version__}",
+            UserWarning,
+            stacklevel=2,
+        )
+    loaded = {}
+    for name, entry in manifest["files"].items():
+        path = artifact_dir / entry["path"]
+        if _file_sha256(path) != entry["sha256"]:
+            raise ValueError(f"{path} does not match the checksum in {MANIFEST_NAME}")
+        loaded[name] = joblib.load(path, mmap_mode=mmap_mode)
+    return loaded["scaler"], loaded["model"], manifest
+
+
+def _feature_frame(frame: pd.DataFrame, feature_names: list[str]) -> pd.DataFrame:
+    """Arrange an input chunk as the model's float64 feature columns.
+
+    Accepts either the encoded columns (as in ``generate_synthetic_data``)
+    or a raw ``job_category`` column (as in the Parquet partitions),
+    which is one-hot encoded here. Extra columns are ignored.
+    """
+    if "job_category" in frame.columns:
+        codes = pd.Categorical(frame["job_category"], dtype=JOB_CATEGORY_DTYPE)
+        dummies = pd.get_dummies(codes, prefix="job_category", drop_first=True)
+        dummies.index = frame.index
+        frame = pd.concat([frame.drop(columns=["job_category"]), dummies], axis=1)
+    missing = [name for name in feature_names if name not in frame.columns]
+    if missing:
+        raise ValueError(f"input is missing feature columns: {', '.join(missing)}")
+    return frame[feature_names].astype(np.float64)
+
+
+def _iter_input_chunks(input_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read a CSV, a Parquet file or a directory of Parquet partitions in chunks."""
+    if input_path.is_dir() or input_path.suffix == ".parquet":
+        if pq is None:
+            raise ImportError("reading Parquet input requires pyarrow (pip install pyarrow)")
+        paths = sorted(input_path.glob("*.parquet")) if input_path.is_dir() else [input_path]
+        for path in paths:
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(input_path, chunksize=chunk_size)
+
+
+def predict(
+    input_path: Path,
+    artifact_dir: Path = ARTIFACT_DIR,
+    output_path: Path | None = None,
+    chunk_size: int = PREDICT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Score a CSV or Parquet file with a saved artifact, ``chunk_size`` rows at a time.
+
+    The artifact is loaded once. Each chunk is scaled and predicted as
+    one vectorized batch; predictions are appended to ``output_path``
+    (CSV, or Parquet if the suffix is ``.parquet``) as a single
+    ``predicted_earnings`` column in input order.
+
+    Returns:
+        Dict with ``rows``, ``seconds``, ``rows_per_second`` and
+        ``feature_schema_hash``.
+    """
+    start = time.perf_counter()
+    scaler, model, manifest = load_artifact(artifact_dir)
+    feature_names = manifest["feature_names"]
+    if feature_schema_hash(feature_names) != manifest["feature_schema_hash"]:
+        raise ValueError(f"feature_names don't match feature_schema_hash in {MANIFEST_NAME}")
+
+    rows = 0
+    writer = None
+    if output_path is not None and output_path.exists():
+        output_path.unlink()
+    try:
+        for chunk in _iter_input_chunks(input_path, chunk_size):
+            X = _feature_frame(chunk, feature_names)
+            # split_data's scaler was fitted on a DataFrame and checks the names
+            if not hasattr(scaler, "feature_names_in_"):
+                X = X.to_numpy()
+            pred = model.predict(scaler.transform(X))
+            rows += len(pred)
+            if output_path is None:
+                continue
+            out = pd.DataFrame({PREDICTION_COL: pred})
+            if output_path.suffix == ".parquet":
+                if pq is None:
+                    raise ImportError("writing Parquet output requires pyarrow")
+                table = pa.Table.from_pandas(out, preserve_index=False)
+                writer = writer or pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            else:
+                header = not output_path.exists()
+                out.to_csv(output_path, mode="a", header=header, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds else float("inf"),
+        "feature_schema_hash": manifest["feature_schema_hash"],
+    }
+
+
+def run_pipeline(
+    output_dir: Path | None = None,
+    n_jobs: int | None = -1,
+    cache_dir: Path | None = None,
+    search_strategy: str = "grid",
+    time_budget: float | None = None,
+    artifact_dir: Path | None = None,
+    make_plots: bool = True,
+    plot_workers: int = PLOT_WORKERS,
+) -> dict[str, Any]:
     """Run the full earnings-prediction pipeline end to end.
 
     Generates synthetic data, performs EDA, trains and evaluates the
-    baseline model zoo, tunes the best one with GridSearchCV, writes
-    outputs to ``output_dir``, and returns a summary dict.
+    baseline model zoo, tunes Gradient Boosting with ``search_strategy``,
+    writes outputs to ``output_dir``, and returns a summary dict.
 
     Args:
         output_dir: Where to write PNGs and CSVs. Defaults to the
             module's parent directory.
+        n_jobs: joblib worker count for the baseline models and the
+            search.
+        cache_dir: Baseline-metrics cache (see
+            :func:`evaluate_baseline_models`); ``None`` disables it.
+        search_strategy: One of ``SEARCH_STRATEGIES``, see
+            :func:`tune_gradient_boosting`.
+        time_budget: Seconds for a ``"random"`` / ``"warm_start"`` search.
+        artifact_dir: If given, the scaler and tuned model are saved
+            there with :func:`export_artifact`.
+        make_plots: ``False`` skips every PNG (and the matplotlib import).
+        plot_workers: Processes rendering PNGs in the background while
+            the models train; ``0`` renders them inline.
 
     Returns:
         Dict with keys ``best_model``, ``best_params``, ``r2``,
-        ``mae``, ``feature_importance``.
+        ``mae``, ``feature_importance``, ``scaler``.
+
+    Raises:
+        ValueError: Unknown ``search_strategy``, or ``time_budget`` set
+            for one outside ``BUDGETED_STRATEGIES``; checked before any
+            model is trained.
     """
+    _check_search(search_strategy, time_budget)
     if output_dir is None:
         output_dir = OUTPUT_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -377,53 +1148,87 @@ def run_pipeline(output_dir: Path | None = None) -> dict[str, Any]:
         f"Mean earnings: ${df[TARGET_COL].mean():,.0f}",
     )
 
-    plot_eda(df, output_dir / "eda_dashboard.png")
-    print("Saved: eda_dashboard.png")
-    plot_correlation_matrix(df, output_dir / "correlation_heatmap.png")
-    print("Saved: correlation_heatmap.png")
-
-    X_train, X_test, y_train, y_test, _ = split_data(df)
-
-    print("\n--- Model Performance ---")
-    print(f"{'Model':<22} {'MAE':>10} {'RMSE':>10} {'R²':>8} {'CV R²':>8}")
-    print("-" * 60)
-    results = evaluate_baseline_models(X_train, y_train, X_test, y_test)
-    for row in results.itertuples():
+    with PlotStage(enabled=make_plots, max_workers=plot_workers) as plots:
+        plots.submit(plot_eda, df, output_dir / "eda_dashboard.png")
+        plots.submit(plot_correlation_matrix, df, output_dir / "correlation_heatmap.png")
+
+        X_train, X_test, y_train, y_test, scaler = split_data(df)
+
+        print("\n--- Model Performance ---")
+        print(f"{'Model':<22} {'MAE':>10} {'RMSE':>10} {'R²':>8} {'CV R²':>8}")
+        print("-" * 60)
+        results = evaluate_baseline_models(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            n_jobs=n_jobs,
+            cache_dir=cache_dir,
+        )
+        for row in results.itertuples():
+            print(
+                f"{row.Model:<22} ${row.MAE:>8,.0f} ${row.RMSE:>8,.0f} "
+                f"R²={row.R2:>7.4f} CV_R²={row.CV_R2:>7.4f} (±{row.CV_Std:.4f})",
+            )
+        results.to_csv(output_dir / "model_comparison.csv", index=False)
+        print("Model comparison saved to model_comparison.csv")
+
+        print("\n--- Hyperparameter Tuning (Gradient Boosting) ---")
+        start = time.perf_counter()
+        grid = tune_gradient_boosting(
+            X_train,
+            y_train,
+            n_jobs=n_jobs,
+            strategy=search_strategy,
+            time_budget=time_budget,
+        )
         print(
-            f"{row.Model:<22} ${row.MAE:>8,.0f} ${row.RMSE:>8,.0f} "
-            f"R²={row.R2:>7.4f} CV_R²={row.CV_R2:>7.4f} (±{row.CV_Std:.4f})",
+            f"Strategy: {search_strategy} ({len(grid.cv_results_['params'])} candidates, "
+            f"{time.perf_counter() - start:.1f}s)",
+        )
+        print(f"Best params: {grid.best_params_}")
+        print(f"Best CV R²: {grid.best_score_:.4f}")
+
+        final_pred = grid.best_estimator_.predict(X_test)
+        final_r2 = r2_score(y_test, final_pred)
+        final_mae = mean_absolute_error(y_test, final_pred)
+        print(f"Tuned model R²: {final_r2:.4f}")
+        print(f"Tuned model MAE: ${final_mae:,.0f}")
+
+        feature_names = df.drop(columns=[TARGET_COL]).columns
+        importance_df = feature_importance_frame(grid.best_estimator_, feature_names)
+        plots.submit(
+            plot_feature_importance,
+            grid.best_estimator_,
+            feature_names,
+            output_dir / "feature_importance.png",
+        )
+        plots.submit(
+            plot_predictions_vs_actual,
+            y_test,
+            final_pred,
+            output_dir / "predictions_vs_actual.png",
         )
-    results.to_csv(output_dir / "model_comparison.csv", index=False)
-    print("Model comparison saved to model_comparison.csv")
-
-    print("\n--- Hyperparameter Tuning (Gradient Boosting) ---")
-    grid = tune_gradient_boosting(X_train, y_train)
-    print(f"Best params: {grid.best_params_}")
-    print(f"Best CV R²: {grid.best_score_:.4f}")
-
-    final_pred = grid.best_estimator_.predict(X_test)
-    final_r2 = r2_score(y_test, final_pred)
-    final_mae = mean_absolute_error(y_test, final_pred)
-    print(f"Tuned model R²: {final_r2:.4f}")
-    print(f"Tuned model MAE: ${final_mae:,.0f}")
-
-    feature_names = df.drop(columns=[TARGET_COL]).columns
-    importance_df = plot_feature_importance(
-        grid.best_estimator_,
-        feature_names,
-        output_dir / "feature_importance.png",
-    )
-    print("Saved: feature_importance.png")
 
-    plot_predictions_vs_actual(
-        y_test,
-        final_pred,
-        output_dir / "predictions_vs_actual.png",
-    )
-    print("Saved: predictions_vs_actual.png")
+        save_predictions(y_test, final_pred, output_dir / "predictions.csv")
+        print("Predictions saved to predictions.csv")
+
+        if artifact_dir is not None:
+            manifest_path = export_artifact(
+                artifact_dir,
+                scaler,
+                grid.best_estimator_,
+                feature_names,
+                metrics={"r2": final_r2, "mae": final_mae, "cv_r2": grid.best_score_},
+                params=grid.best_params_,
+            )
+            print(f"Model artifact saved to {manifest_path.parent}")
 
-    save_predictions(y_test, final_pred, output_dir / "predictions.csv")
-    print("Predictions saved to predictions.csv")
+    if make_plots:
+        print(
+            "Saved: eda_dashboard.png, correlation_heatmap.png, "
+            "feature_importance.png, predictions_vs_actual.png",
+        )
 
     print("\n" + "=" * 60)
     print("DAY 100 COMPLETE!")
@@ -439,8 +1244,85 @@ def run_pipeline(output_dir: Path | None = None) -> dict[str, Any]:
         "r2": final_r2,
         "mae": final_mae,
         "feature_importance": importance_df,
+        "scaler": scaler,
     }
 
 
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Day 100 earnings-prediction pipeline.")
+    parser.add_argument("--search-strategy", choices=SEARCH_STRATEGIES, default="grid")
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="seconds for the random / warm_start search (with --compare-search, "
+        "applied to those two only)",
+    )
+    parser.add_argument(
+        "--compare-search",
+        action="store_true",
+        help="time every search strategy instead of running the pipeline",
+    )
+    parser.add_argument(
+        "--stream-rows",
+        type=int,
+        default=None,
+        help="write this many rows as Parquet partitions and train out of core",
+    )
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument(
+        "--predict",
+        type=Path,
+        default=None,
+        metavar="INPUT",
+        help="score a CSV / Parquet file or partition folder with the saved artifact",
+    )
+    parser.add_argument("--artifact-dir", type=Path, default=ARTIFACT_DIR)
+    parser.add_argument("--no-plots", action="store_true", help="skip rendering the PNGs")
+    parser.add_argument("--output", type=Path, default=None, help="where --predict writes")
+    args = parser.parse_args()
+    if (
+        args.time_budget is not None
+        and not args.compare_search
+        and args.search_strategy not in BUDGETED_STRATEGIES
+    ):
+        parser.error(f"--time-budget needs --search-strategy {' or '.join(BUDGETED_STRATEGIES)}")
+
+    if args.predict is not None:
+        stats = predict(
+            args.predict,
+            args.artifact_dir,
+            args.output,
+            chunk_size=args.chunk_size or PREDICT_CHUNK_SIZE,
+        )
+        print(
+            f"Scored {stats['rows']:,} rows in {stats['seconds']:.1f}s "
+            f"({stats['rows_per_second']:,.0f} rows/s)",
+        )
+        return
+    if args.stream_rows is not None:
+        run_streaming(args.stream_rows, chunk_size=args.chunk_size or CHUNK_SIZE, n_jobs=-1)
+        return
+    if args.compare_search:
+        X_train, X_test, y_train, y_test, _ = split_data(generate_synthetic_data())
+        report = compare_search_strategies(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            time_budget=args.time_budget,
+        )
+        print(report.to_string(index=False, float_format="{:.4f}".format))
+        return
+    run_pipeline(
+        cache_dir=MODEL_CACHE_DIR,
+        search_strategy=args.search_strategy,
+        time_budget=args.time_budget,
+        artifact_dir=args.artifact_dir,
+        make_plots=not args.no_plots,
+    )
+
+
 if __name__ == "__main__":
-    run_pipeline()
+    main()
@@ -2,24 +2,48 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import earnings_predictor
 import pytest
 from earnings_predictor import (
     BASELINE_MODELS,
     DATA_N,
     JOB_CATEGORIES,
+    SEARCH_STRATEGIES,
     TARGET_COL,
+    WarmStartSearchCV,
+    compare_search_strategies,
+    PREDICTION_COL,
+    encode_chunk,
+    export_artifact,
+    feature_schema_hash,
+    load_artifact,
+    predict,
+    iter_parquet_chunks,
+    iter_synthetic_chunks,
+    score_streaming,
+    stream_feature_names,
+    synthetic_chunk,
+    train_streaming,
+    write_parquet_partitions,
     evaluate_baseline_models,
     generate_synthetic_data,
+    model_cache_key,
     plot_feature_importance,
     plot_predictions_vs_actual,
     save_predictions,
     split_data,
     tune_gradient_boosting,
 )
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import cross_val_score
 
 
 @pytest.fixture
@@ -74,6 +98,57 @@ class TestDataGeneration:
         assert len(df) == DATA_N
 
 
+class TestChunkedData:
+    def test_chunks_cover_n_rows(self) -> None:
+        sizes = [len(chunk) for chunk in iter_synthetic_chunks(2500, chunk_size=1000)]
+        assert sizes == [1000, 1000, 500]
+
+    def test_chunks_are_reproducible_and_independent(self) -> None:
+        chunks = list(iter_synthetic_chunks(3000, chunk_size=1000, seed=7))
+        pd.testing.assert_frame_equal(chunks[2], synthetic_chunk(2, 1000, seed=7))
+        assert not chunks[0].equals(chunks[1])
+
+    def test_compact_dtypes(self) -> None:
+        chunk = synthetic_chunk(0, 1000)
+        assert chunk["education_years"].dtype == np.int8
+        assert chunk[TARGET_COL].dtype == np.int32
+        assert isinstance(chunk["job_category"].dtype, pd.CategoricalDtype)
+        assert chunk.memory_usage(deep=True).sum() < 12 * len(chunk)
+
+    def test_target_in_expected_range(self) -> None:
+        chunk = synthetic_chunk(0, 5000)
+        assert chunk[TARGET_COL].min() >= 15_000
+        assert chunk[TARGET_COL].max() <= 250_000
+
+    def test_encoded_columns_match_in_memory_frame(self) -> None:
+        X, y = encode_chunk(synthetic_chunk(0, 10))
+        expected = generate_synthetic_data(n=1000).drop(columns=[TARGET_COL]).columns
+        assert stream_feature_names() == list(expected)
+        assert X.shape == (10, len(expected))
+        assert X.dtype == np.float32
+        assert y.shape == (10,)
+
+
+class TestStreaming:
+    def test_parquet_round_trip(self, tmp_path: Path) -> None:
+        pytest.importorskip("pyarrow")
+        paths = write_parquet_partitions(tmp_path, 2500, chunk_size=1000, seed=3)
+        assert [path.name for path in paths] == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+            "part-00002.parquet",
+        ]
+        expected = list(iter_synthetic_chunks(2500, chunk_size=1000, seed=3))
+        for chunk, original in zip(iter_parquet_chunks(paths), expected, strict=True):
+            pd.testing.assert_frame_equal(chunk, original)
+
+    def test_partial_fit_learns(self) -> None:
+        scaler, model = train_streaming(lambda: iter_synthetic_chunks(20_000, chunk_size=5000))
+        scores = score_streaming(scaler, model, [synthetic_chunk(99, 5000)])
+        assert scores["rows"] == 5000
+        assert scores["r2"] > 0.8
+
+
 class TestSplit:
     def test_split_sizes(self, small_data: pd.DataFrame) -> None:
         X_train, X_test, y_train, y_test, _ = split_data(
@@ -122,6 +197,56 @@ class TestModels:
             assert isinstance(r2, float)
             assert -1.0 <= r2 <= 1.0
 
+    def test_cv_matches_cross_val_score(self, split_small: tuple) -> None:
+        X_train, X_test, y_train, y_test, _ = split_small
+        results = evaluate_baseline_models(X_train, y_train, X_test, y_test, n_jobs=1)
+        expected = cross_val_score(Ridge(alpha=1.0), X_train, y_train, cv=5, scoring="r2")
+        ridge = results.set_index("Model").loc["Ridge Regression"]
+        assert ridge["CV_R2"] == pytest.approx(expected.mean())
+        assert ridge["CV_Std"] == pytest.approx(expected.std())
+
+    def test_parallel_matches_sequential(self, split_small: tuple) -> None:
+        X_train, X_test, y_train, y_test, _ = split_small
+        sequential = evaluate_baseline_models(X_train, y_train, X_test, y_test, n_jobs=1)
+        parallel = evaluate_baseline_models(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            n_jobs=2,
+            backend="threading",
+        )
+        pd.testing.assert_frame_equal(sequential, parallel)
+
+    def test_cache_skips_refit(
+        self,
+        split_small: tuple,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        X_train, X_test, y_train, y_test, _ = split_small
+        first = evaluate_baseline_models(
+            X_train, y_train, X_test, y_test, n_jobs=1, cache_dir=tmp_path
+        )
+        assert len(list(tmp_path.glob("*.json"))) == len(BASELINE_MODELS)
+
+        def no_fit(*args: object) -> None:
+            raise AssertionError("cached model was refitted")
+
+        monkeypatch.setattr(earnings_predictor, "_holdout_metrics", no_fit)
+        monkeypatch.setattr(earnings_predictor, "_fold_r2", no_fit)
+        second = evaluate_baseline_models(
+            X_train, y_train, X_test, y_test, n_jobs=1, cache_dir=tmp_path
+        )
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_cache_key_tracks_params_and_data(self) -> None:
+        key = model_cache_key(Ridge(alpha=1.0), "data-a")
+        assert key == model_cache_key(Ridge(alpha=1.0), "data-a")
+        assert key != model_cache_key(Ridge(alpha=2.0), "data-a")
+        assert key != model_cache_key(Ridge(alpha=1.0), "data-b")
+        assert key != model_cache_key(Ridge(alpha=1.0), "data-a", cv=3)
+
     def test_tune_returns_fitted_grid(self, split_small: tuple) -> None:
         X_train, _, y_train, _, _ = split_small
         grid = tune_gradient_boosting(
@@ -140,6 +265,181 @@ class TestModels:
         assert isinstance(grid.best_score_, float)
 
 
+SMALL_GRID = {"n_estimators": [10, 20, 40], "max_depth": [2, 3], "learning_rate": [0.1]}
+
+
+class TestSearchStrategies:
+    @pytest.mark.parametrize("strategy", SEARCH_STRATEGIES)
+    def test_every_strategy_fits(self, split_small: tuple, strategy: str) -> None:
+        X_train, X_test, y_train, _, _ = split_small
+        search = tune_gradient_boosting(
+            X_train,
+            y_train,
+            param_grid=SMALL_GRID,
+            cv=2,
+            n_jobs=1,
+            strategy=strategy,
+        )
+        assert set(search.best_params_) == set(SMALL_GRID)
+        assert search.best_estimator_.predict(X_test).shape == (X_test.shape[0],)
+
+    def test_unknown_strategy_rejected(self, split_small: tuple) -> None:
+        X_train, _, y_train, _, _ = split_small
+        with pytest.raises(ValueError, match="unknown search strategy"):
+            tune_gradient_boosting(X_train, y_train, strategy="bayes")
+
+    def test_warm_start_matches_grid(self, split_small: tuple) -> None:
+        X_train, _, y_train, _, _ = split_small
+        grid = tune_gradient_boosting(
+            X_train, y_train, param_grid=SMALL_GRID, cv=2, n_jobs=1, strategy="grid"
+        )
+        warm = tune_gradient_boosting(
+            X_train, y_train, param_grid=SMALL_GRID, cv=2, n_jobs=1, strategy="warm_start"
+        )
+        assert warm.best_params_ == grid.best_params_
+        assert warm.best_score_ == pytest.approx(grid.best_score_)
+        assert len(warm.cv_results_["params"]) == len(grid.cv_results_["params"])
+
+    def test_time_budget_stops_after_first_combination(self, split_small: tuple) -> None:
+        X_train, _, y_train, _, _ = split_small
+        search = WarmStartSearchCV(
+            GradientBoostingRegressor(random_state=42),
+            SMALL_GRID,
+            cv=2,
+            time_budget=0,
+            shuffle=True,
+            random_state=0,
+        ).fit(X_train, y_train)
+        assert search.budget_exhausted_
+        # one (max_depth, learning_rate) combination, scored at every n_estimators
+        assert len(search.cv_results_["params"]) == len(SMALL_GRID["n_estimators"])
+
+    @pytest.mark.parametrize("strategy", ["grid", "halving"])
+    def test_time_budget_rejected_where_it_cannot_stop(
+        self, split_small: tuple, strategy: str
+    ) -> None:
+        X_train, _, y_train, _, _ = split_small
+        with pytest.raises(ValueError, match="time_budget"):
+            tune_gradient_boosting(
+                X_train, y_train, param_grid=SMALL_GRID, strategy=strategy, time_budget=5
+            )
+
+    def test_compare_budgets_only_the_warm_start_strategies(self, split_small: tuple) -> None:
+        X_train, X_test, y_train, y_test, _ = split_small
+        report = compare_search_strategies(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            strategies=("grid", "random"),
+            time_budget=0,
+            param_grid=SMALL_GRID,
+            cv=2,
+            n_jobs=1,
+        )
+        n_candidates = len(SMALL_GRID["n_estimators"])
+        assert report.loc[report["Strategy"] == "random", "Candidates"].item() == n_candidates
+        assert report.loc[report["Strategy"] == "grid", "Candidates"].item() > n_candidates
+
+    def test_compare_reports_each_strategy(self, split_small: tuple) -> None:
+        X_train, X_test, y_train, y_test, _ = split_small
+        report = compare_search_strategies(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            strategies=("grid", "warm_start"),
+            param_grid=SMALL_GRID,
+            cv=2,
+            n_jobs=1,
+        )
+        assert list(report["Strategy"]) == ["grid", "warm_start"]
+        assert (report["Seconds"] > 0).all()
+        assert list(report["Candidates"]) == [6, 6]
+
+
+@pytest.fixture
+def artifact(tmp_path: Path) -> tuple:
+    """A small tuned model exported to ``tmp_path/artifact``."""
+    df = generate_synthetic_data(n=500, seed=1)
+    X_train, _, y_train, _, scaler = split_data(df)
+    model = GradientBoostingRegressor(n_estimators=20, random_state=42).fit(X_train, y_train)
+    feature_names = list(df.drop(columns=[TARGET_COL]).columns)
+    artifact_dir = tmp_path / "artifact"
+    export_artifact(artifact_dir, scaler, model, feature_names, metrics={"r2": 0.9})
+    return artifact_dir, scaler, model, feature_names
+
+
+class TestArtifact:
+    def test_manifest_describes_artifact(self, artifact: tuple) -> None:
+        artifact_dir, _, _, feature_names = artifact
+        _, _, manifest = load_artifact(artifact_dir)
+        assert manifest["format_version"] == 1
+        assert manifest["feature_names"] == feature_names
+        assert manifest["feature_schema_hash"] == feature_schema_hash(feature_names)
+        assert manifest["model_class"].endswith("GradientBoostingRegressor")
+        assert manifest["metrics"] == {"r2": 0.9}
+
+    def test_round_trip_predicts_the_same(self, artifact: tuple) -> None:
+        artifact_dir, scaler, model, feature_names = artifact
+        loaded_scaler, loaded_model, _ = load_artifact(artifact_dir)
+        X = generate_synthetic_data(n=100, seed=2)[feature_names].astype(float)
+        np.testing.assert_array_equal(
+            loaded_model.predict(loaded_scaler.transform(X)),
+            model.predict(scaler.transform(X)),
+        )
+
+    def test_tampered_file_rejected(self, artifact: tuple) -> None:
+        artifact_dir, *_ = artifact
+        with (artifact_dir / "model.joblib").open("ab") as f:
+            f.write(b"x")
+        with pytest.raises(ValueError, match="checksum"):
+            load_artifact(artifact_dir)
+
+    def test_unknown_format_version_rejected(self, artifact: tuple) -> None:
+        artifact_dir, *_ = artifact
+        manifest_path = artifact_dir / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["format_version"] = 99
+        manifest_path.write_text(json.dumps(manifest))
+        with pytest.raises(ValueError, match="unsupported artifact format"):
+            load_artifact(artifact_dir)
+
+    def test_schema_hash_depends_on_order(self) -> None:
+        assert feature_schema_hash(["a", "b"]) != feature_schema_hash(["b", "a"])
+
+
+class TestPredict:
+    def test_csv_in_csv_out(self, artifact: tuple, tmp_path: Path) -> None:
+        artifact_dir, scaler, model, feature_names = artifact
+        df = generate_synthetic_data(n=1000, seed=3)
+        df.to_csv(tmp_path / "input.csv", index=False)
+        stats = predict(tmp_path / "input.csv", artifact_dir, tmp_path / "out.csv", chunk_size=300)
+        assert stats["rows"] == 1000
+        assert stats["rows_per_second"] > 0
+        scored = pd.read_csv(tmp_path / "out.csv")
+        expected = model.predict(scaler.transform(df[feature_names].astype(float)))
+        np.testing.assert_allclose(scored[PREDICTION_COL], expected)
+
+    def test_parquet_partitions_with_raw_category(self, artifact: tuple, tmp_path: Path) -> None:
+        pytest.importorskip("pyarrow")
+        artifact_dir, scaler, model, feature_names = artifact
+        paths = write_parquet_partitions(tmp_path / "parts", 2500, chunk_size=1000)
+        stats = predict(tmp_path / "parts", artifact_dir, tmp_path / "out.parquet", chunk_size=400)
+        assert stats["rows"] == 2500
+        scored = pd.read_parquet(tmp_path / "out.parquet")
+        X = np.vstack([encode_chunk(chunk)[0] for chunk in iter_parquet_chunks(paths)])
+        X = pd.DataFrame(X, columns=feature_names, dtype=float)
+        np.testing.assert_allclose(scored[PREDICTION_COL], model.predict(scaler.transform(X)))
+
+    def test_missing_feature_rejected(self, artifact: tuple, tmp_path: Path) -> None:
+        artifact_dir, *_ = artifact
+        df = generate_synthetic_data(n=50, seed=4).drop(columns=["age"])
+        df.to_csv(tmp_path / "input.csv", index=False)
+        with pytest.raises(ValueError, match="missing feature columns: age"):
+            predict(tmp_path / "input.csv", artifact_dir)
+
+
 class TestIO:
     def test_save_predictions_writes_csv(
         self,
@@ -205,3 +505,47 @@ class TestIO:
         assert "Importance" in importance_df.columns
         # Importances should sum to ~1
         assert importance_df["Importance"].sum() == pytest.approx(1.0, abs=1e-6)
+
+
+def test_import_defers_plotting_libraries() -> None:
+    code = "import sys, earnings_predictor; print('matplotlib' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(earnings_predictor.__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_failed_run_cancels_the_queued_figures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    closed = []
+
+    def fail(df: pd.DataFrame):
+        raise RuntimeError("split failed")
+
+    monkeypatch.setattr(earnings_predictor.PlotStage, "submit", lambda self, *a, **k: None)
+    monkeypatch.setattr(
+        earnings_predictor.PlotStage, "close", lambda self, cancel=False: closed.append(cancel)
+    )
+    monkeypatch.setattr(earnings_predictor, "split_data", fail)
+    with pytest.raises(RuntimeError, match="split failed"):
+        earnings_predictor.run_pipeline(output_dir=tmp_path, cache_dir=None, artifact_dir=None)
+    assert closed == [True]
+
+
+def test_pipeline_rejects_a_budget_before_training(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_training(*args, **kwargs):
+        raise AssertionError("trained before checking the search options")
+
+    monkeypatch.setattr(earnings_predictor, "evaluate_baseline_models", no_training)
+    with pytest.raises(ValueError, match="time_budget"):
+        earnings_predictor.run_pipeline(
+            output_dir=tmp_path / "out", search_strategy="grid", time_budget=5
+        )
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,6 @@
+"""Helpers shared by several day folders.
+
+Day folders stay self-contained tutorial projects; anything here is
+strictly opt-in. A day that wants a shared helper puts the repo root on
+``sys.path`` and imports from ``shared`` (see ``LAYOUT.md``).
+"""
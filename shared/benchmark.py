@@ -0,0 +1,323 @@
+"""Stage benchmarks for the modelling days, with a JSON history and a regression gate.
+
+A day opts in with a ``benchmarks.py`` next to its module that defines
+``STAGES``, a list of :class:`Stage`, and ``SIZES``, the data sizes to
+run them at. Each stage's ``setup(n, scratch)`` builds the inputs for
+``n`` rows (untimed); ``func(*inputs)`` is the timed call. Every
+(stage, size) pair is timed ``--repeat`` times, then run once more
+under :mod:`tracemalloc` for its peak Python-level allocation (numpy
+buffers included), since tracing slows the code it watches.
+tracemalloc can't see what compiled code allocates for itself (tree
+nodes in a forest, OpenMP buffers), so on Linux the timed calls also
+record how far the process's peak RSS rose above its RSS at the start.
+
+Results are appended to ``benchmark_history.json`` in the day folder.
+A stage regresses when its median time or either memory peak exceeds the
+median of its last ``BASELINE_RUNS`` runs on the same machine by more
+than ``--threshold``; the command then exits with status 1.
+
+Usage:
+    python -m shared.benchmark Day080_House_Price_Predictor
+    python -m shared.benchmark Day077_Linear_Regression Day100_Earnings_Predictor --repeat 5
+    python -m shared.benchmark Day080_House_Price_Predictor --stage train_* --sizes 1000 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+HISTORY_FILE = "benchmark_history.json"
+HISTORY_FORMAT_VERSION = 1
+BASELINE_RUNS = 5
+THRESHOLD = 0.25
+# Changes smaller than this are timer noise, whatever the percentage
+MIN_DELTA_S = 0.01
+MIN_DELTA_MB = 1.0
+MIN_DELTA_RSS_MB = 5.0
+METRIC_FLOORS = {"median_s": MIN_DELTA_S, "peak_mb": MIN_DELTA_MB, "rss_mb": MIN_DELTA_RSS_MB}
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One timed pipeline step.
+
+    Args:
+        name: Row label in the report and key in the history.
+        func: The timed call, ``func(*setup(n, scratch))``.
+        setup: Builds ``func``'s arguments for ``n`` rows. ``scratch``
+            is a temporary directory for stages that write files.
+        sizes: Overrides the suite's ``SIZES`` for slow stages.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    setup: Callable[[int, Path], tuple[Any, ...]]
+    sizes: tuple[int, ...] | None = None
+
+
+def _read_status_mb(field: str) -> float:
+    """A ``kB`` field of ``/proc/self/status`` in MB."""
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1]) / 1024
+    raise KeyError(field)
+
+
+def _reset_peak_rss() -> float | None:
+    """Reset the kernel's peak-RSS mark (``VmHWM``) and return the current RSS in MB.
+
+    ``None`` where that isn't possible (not Linux, or no ``/proc``).
+    """
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+        return _read_status_mb("VmRSS")
+    except (OSError, KeyError):
+        return None
+
+
+def measure(stage: Stage, n: int, scratch: Path, repeat: int = 3) -> dict[str, Any]:
+    """Time ``stage`` at ``n`` rows, then trace one more call's peak memory."""
+    args = stage.setup(n, scratch)
+    samples = []
+    rss_start = _reset_peak_rss()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage.func(*args)
+        samples.append(time.perf_counter() - start)
+    rss_mb = None if rss_start is None else _read_status_mb("VmHWM") - rss_start
+
+    tracemalloc.start()
+    try:
+        stage.func(*args)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "stage": stage.name,
+        "n": n,
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "peak_mb": peak / 1024**2,
+        "rss_mb": rss_mb,
+    }
+
+
+def run_suite(
+    stages: Iterable[Stage],
+    sizes: Iterable[int],
+    repeat: int = 3,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """:func:`measure` every stage at each of its sizes, in order."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        for stage in stages:
+            for n in stage.sizes or sizes:
+                result = measure(stage, n, Path(tmp), repeat)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return results
+
+
+def machine_id() -> str:
+    """Which machine a run came from; only runs with the same id are compared."""
+    return (
+        f"{platform.node()}/{platform.machine()}/{os.cpu_count()}cpu/py{platform.python_version()}"
+    )
+
+
+def git_commit(cwd: Path) -> str | None:
+    """Short hash of HEAD, or ``None`` outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_history(path: Path) -> dict[str, Any]:
+    """Read a history file, or start an empty one."""
+    if not path.exists():
+        return {"format_version": HISTORY_FORMAT_VERSION, "runs": []}
+    history = json.loads(path.read_text())
+    if history.get("format_version") != HISTORY_FORMAT_VERSION:
+        raise ValueError(f"unsupported benchmark history format {history.get('format_version')!r}")
+    return history
+
+
+def save_history(path: Path, history: dict[str, Any]) -> None:
+    """Write ``history`` atomically, so an interrupted run can't truncate it."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(history, indent=2))
+    tmp_path.replace(path)
+
+
+def baselines(
+    history: dict[str, Any],
+    machine: str,
+    runs: int = BASELINE_RUNS,
+) -> dict[tuple[str, int], dict[str, float]]:
+    """Median of each metric per (stage, n) over this machine's last ``runs`` runs."""
+    samples: dict[tuple[str, int], dict[str, list[float]]] = {}
+    for run in [run for run in history["runs"] if run["machine"] == machine][-runs:]:
+        for result in run["results"]:
+            metrics = samples.setdefault((result["stage"], result["n"]), {})
+            for metric in METRIC_FLOORS:
+                if result.get(metric) is not None:
+                    metrics.setdefault(metric, []).append(result[metric])
+    return {
+        key: {metric: statistics.median(values) for metric, values in metrics.items()}
+        for key, metrics in samples.items()
+    }
+
+
+def find_regressions(
+    results: Iterable[dict[str, Any]],
+    baseline: dict[tuple[str, int], dict[str, float]],
+    threshold: float = THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Results whose time or memory grew more than ``threshold`` over ``baseline``.
+
+    Returns:
+        One dict per regression: ``stage``, ``n``, ``metric`` (a key of
+        ``METRIC_FLOORS``), ``baseline``, ``value`` and ``change``
+        (fractional increase).
+    """
+    regressions = []
+    for result in results:
+        before = baseline.get((result["stage"], result["n"]))
+        if before is None:
+            continue
+        for metric, floor in METRIC_FLOORS.items():
+            value, reference = result.get(metric), before.get(metric)
+            if value is None or reference is None:
+                continue
+            if value > reference * (1 + threshold) and value - reference > floor:
+                regressions.append(
+                    {
+                        "stage": result["stage"],
+                        "n": result["n"],
+                        "metric": metric,
+                        "baseline": reference,
+                        "value": value,
+                        "change": value / reference - 1,
+                    },
+                )
+    return regressions
+
+
+def load_suite(day_dir: Path) -> Any:
+    """Import ``day_dir/benchmarks.py`` with the day folder on ``sys.path``."""
+    path = day_dir / "benchmarks.py"
+    if not path.exists():
+        raise FileNotFoundError(f"{day_dir} has no benchmarks.py")
+    sys.path.insert(0, str(day_dir))
+    spec = importlib.util.spec_from_file_location(f"{day_dir.name}_benchmarks", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, "STAGES"):
+        raise ValueError(f"{path} defines no STAGES")
+    return module
+
+
+def _format_change(result: dict[str, Any], before: dict[str, float] | None, metric: str) -> str:
+    if result.get(metric) is None:
+        return "-"
+    if before is None or not before.get(metric):
+        return "new"
+    return f"{result[metric] / before[metric] - 1:+.0%}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("days", type=Path, nargs="+", help="day folders with a benchmarks.py")
+    parser.add_argument("--sizes", type=int, nargs="+", help="override every stage's sizes")
+    parser.add_argument("--stage", nargs="+", default=["*"], help="stage name patterns")
+    parser.add_argument("--repeat", type=int, default=3, help="timed calls per stage and size")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown")
+    parser.add_argument("--no-save", action="store_true", help="don't append to the history")
+    args = parser.parse_args()
+
+    machine = machine_id()
+    failed = False
+    for day_dir in args.days:
+        day_dir = day_dir.resolve()
+        suite = load_suite(day_dir)
+        stages = [
+            stage
+            for stage in suite.STAGES
+            if any(fnmatch.fnmatch(stage.name, pattern) for pattern in args.stage)
+        ]
+        if args.sizes:
+            stages = [replace(stage, sizes=None) for stage in stages]
+        history_path = day_dir / HISTORY_FILE
+        history = load_history(history_path)
+        baseline = baselines(history, machine)
+
+        print(f"{day_dir.name} ({machine})")
+        print(
+            f"  {'stage':<34} {'n':>8} {'median s':>9} {'min s':>8} {'traced MB':>9} "
+            f"{'RSS MB':>7} {'time':>6} {'traced':>6} {'RSS':>6}"
+        )
+
+        def report(result: dict[str, Any], baseline=baseline) -> None:
+            before = baseline.get((result["stage"], result["n"]))
+            rss = "-" if result["rss_mb"] is None else f"{result['rss_mb']:.1f}"
+            print(
+                f"  {result['stage']:<34} {result['n']:>8,} {result['median_s']:>9.4f} "
+                f"{result['min_s']:>8.4f} {result['peak_mb']:>9.1f} {rss:>7} "
+                + " ".join(
+                    f"{_format_change(result, before, metric):>6}" for metric in METRIC_FLOORS
+                )
+            )
+
+        results = run_suite(stages, args.sizes or suite.SIZES, args.repeat, progress=report)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"  REGRESSION {regression['stage']} n={regression['n']:,} "
+                f"{regression['metric']}: {regression['baseline']:.4g} -> "
+                f"{regression['value']:.4g} ({regression['change']:+.0%})"
+            )
+        failed = failed or bool(regressions)
+
+        if not args.no_save:
+            history["runs"].append(
+                {
+                    "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+                    "commit": git_commit(day_dir),
+                    "machine": machine,
+                    "repeat": args.repeat,
+                    "results": results,
+                    "regressions": regressions,
+                },
+            )
+            save_history(history_path, history)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""``pd.read_csv`` with a binary sidecar cache, for CSVs that are read on every run.
+
+The first :func:`cached_read_csv` of a file parses it as usual and writes
+the DataFrame to an uncompressed Feather (Arrow IPC) file, or Parquet,
+in a cache directory. Later calls with the same options memory-map that
+file instead of parsing text again. An entry is keyed by the CSV's
+resolved path, size and modification time, a hash of the ``read_csv``
+options, and the pandas/pyarrow versions, so editing the CSV or changing
+an option misses the cache rather than returning stale data.
+
+The cache lives in ``.csv_cache/`` next to the CSV unless ``cache_dir``
+or the ``CSV_CACHE_DIR`` environment variable says otherwise. After each
+write, entries unused for ``MAX_AGE_DAYS`` are removed, then the least
+recently used ones until the directory is under ``MAX_CACHE_BYTES``; the
+entry just written is always kept, even if it alone is over the cap.
+Without pyarrow, or with options that can't be hashed reliably (callable
+converters, say), it is a plain ``pd.read_csv``.
+
+Usage:
+    python -m shared.csv_cache Day025_CSV_Data_Analysis/*.csv --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+except ImportError:  # reads fall back to plain pd.read_csv
+    pa = pa_feather = None
+
+CACHE_DIR_NAME = ".csv_cache"
+CACHE_DIR_ENV = "CSV_CACHE_DIR"
+CACHE_FORMAT_VERSION = 1
+FORMATS = {"feather": ".feather", "parquet": ".parquet"}
+MAX_CACHE_BYTES = 512 << 20
+MAX_AGE_DAYS = 30
+# read_csv options that return a reader instead of a DataFrame
+UNSUPPORTED_OPTIONS = ("chunksize", "iterator")
+
+
+def _options_key(options: dict[str, Any]) -> str | None:
+    """A stable text form of ``read_csv`` options, or None if they have no stable form."""
+
+    def stable(value: Any) -> str:
+        # Callables repr with their address, which changes every run
+        if callable(value) and not isinstance(value, type):
+            raise TypeError(value)
+        return str(value)
+
+    try:
+        return json.dumps(options, sort_keys=True, default=stable)
+    except TypeError:
+        return None
+
+
+def cache_dir_for(csv_path: Path) -> Path:
+    """Where entries for ``csv_path`` go when no ``cache_dir`` is given."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    return csv_path.parent / CACHE_DIR_NAME
+
+
+def cache_path(
+    csv_path: Path,
+    options: dict[str, Any],
+    cache_dir: Path | None = None,
+    fmt: str = "feather",
+) -> Path | None:
+    """The cache entry for reading ``csv_path`` with ``options``, or None if uncacheable.
+
+    The name is ``<stem>.<options>.<source>.<ext>``: entries for the same
+    file and options share the middle part, so a new version of the CSV
+    can replace the old entry.
+    """
+    options_key = _options_key(options)
+    if options_key is None:
+        return None
+    csv_path = csv_path.resolve()
+    stat = csv_path.stat()
+    slot = hashlib.sha256(
+        "\0".join(
+            [
+                str(csv_path),
+                options_key,
+                pd.__version__,
+                pa.__version__ if pa is not None else "",
+                str(CACHE_FORMAT_VERSION),
+            ]
+        ).encode()
+    ).hexdigest()[:16]
+    source = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+    directory = cache_dir if cache_dir is not None else cache_dir_for(csv_path)
+    return directory / f"{csv_path.stem}.{slot}.{source}{FORMATS[fmt]}"
+
+
+def _read_entry(path: Path, fmt: str) -> pd.DataFrame:
+    if fmt == "feather":
+        table = pa_feather.read_table(path, memory_map=True)
+    else:
+        import pyarrow.parquet as pq  # ~20 ms to import, so only when asked for
+
+        table = pq.read_table(path, memory_map=True)
+    return table.to_pandas()
+
+
+def _write_entry(path: Path, df: pd.DataFrame, fmt: str) -> None:
+    """Write ``df`` to ``path`` atomically, so a concurrent reader never sees half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if fmt == "feather":
+        # Uncompressed, so reads can map the columns straight from the page cache
+        pa_feather.write_feather(table, tmp_path, compression="uncompressed")
+    else:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, tmp_path)
+    tmp_path.replace(path)
+    # Entries for older versions of the same file and options can never hit again
+    prefix = path.name.rsplit(".", 2)[0]  # <stem>.<options>
+    for stale in path.parent.glob(f"{glob.escape(prefix)}.*"):
+        if stale != path and not stale.name.endswith(".tmp"):
+            stale.unlink(missing_ok=True)
+
+
+def evict(
+    cache_dir: Path,
+    max_bytes: int = MAX_CACHE_BYTES,
+    max_age_days: float = MAX_AGE_DAYS,
+    keep: Path | None = None,
+) -> list[Path]:
+    """Trim ``cache_dir``: drop entries unused for ``max_age_days``, then least recently used.
+
+    A cache hit refreshes its entry's modification time, so that is the
+    "last used" time. ``keep`` (the entry just written) is never removed
+    and counts first against ``max_bytes``, so an entry bigger than the
+    cap evicts everything else rather than itself. Returns the removed
+    paths.
+    """
+    entries = []
+    for path in cache_dir.glob("*"):
+        if path.suffix in FORMATS.values():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    # The kept entry sorts first whatever its mtime
+    entries.sort(key=lambda entry: (entry[2] == keep, entry[0]), reverse=True)
+
+    cutoff = time.time() - max_age_days * 86_400
+    removed, kept_bytes = [], 0
+    for mtime, size, path in entries:
+        if path != keep and (mtime < cutoff or kept_bytes + size > max_bytes):
+            path.unlink(missing_ok=True)
+            removed.append(path)
+        else:
+            kept_bytes += size
+    return removed
+
+
+def cached_read_csv(
+    csv_path: str | Path,
+    cache_dir: Path | None = None,
+    fmt: str = "feather",
+    max_bytes: int = MAX_CACHE_BYTES,
+    **options: Any,
+) -> pd.DataFrame:
+    """``pd.read_csv(csv_path, **options)``, served from the sidecar cache when possible.
+
+    Args:
+        csv_path: A local CSV file.
+        cache_dir: Where to keep entries; see :func:`cache_dir_for`.
+        fmt: ``"feather"`` (fastest to load) or ``"parquet"`` (smaller).
+        max_bytes: Size cap for ``cache_dir``, enforced after each write.
+        **options: Passed to ``pd.read_csv``; part of the cache key.
+
+    Raises:
+        ValueError: For an unknown ``fmt``, or ``chunksize``/``iterator``,
+            which return a reader rather than a DataFrame.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown cache format {fmt!r}; pick one of {tuple(FORMATS)}")
+    unsupported = [name for name in UNSUPPORTED_OPTIONS if options.get(name)]
+    if unsupported:
+        raise ValueError(f"cached_read_csv can't cache a reader ({', '.join(unsupported)})")
+    csv_path = Path(csv_path)
+    if pa is None:
+        return pd.read_csv(csv_path, **options)
+    path = cache_path(csv_path, options, cache_dir, fmt)
+    if path is None:
+        return pd.read_csv(csv_path, **options)
+
+    if path.exists():
+        try:
+            df = _read_entry(path, fmt)
+        except (OSError, pa.ArrowException):
+            path.unlink(missing_ok=True)  # truncated or corrupt: rebuild it
+        else:
+            try:
+                path.touch()
+            except OSError:  # a read-only cache still serves hits, just without LRU order
+                pass
+            return df
+
+    df = pd.read_csv(csv_path, **options)
+    try:
+        _write_entry(path, df, fmt)
+    except (OSError, pa.ArrowException):
+        return df  # a read-only folder or an unsupported column type: just don't cache
+    evict(path.parent, max_bytes, keep=path)
+    return df
+
+
+def _median_s(func: Any, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def benchmark(csv_path: Path, fmt: str = "feather", repeat: int = 5) -> dict[str, Any]:
+    """Time a plain parse, the first cached read (parse + write) and warm cached reads.
+
+    Uses a temporary cache directory, so the real cache is left alone.
+    """
+    with tempfile.TemporaryDirectory(prefix="csv_cache_") as tmp:
+        cache_dir = Path(tmp)
+        parse_s = _median_s(lambda: pd.read_csv(csv_path), repeat)
+        start = time.perf_counter()
+        cached_read_csv(csv_path, cache_dir=cache_dir, fmt=fmt)
+        first_s = time.perf_counter() - start
+        warm_s = _median_s(lambda: cached_read_csv(csv_path, cache_dir=cache_dir, fmt=fmt), repeat)
+        entry_bytes = sum(path.stat().st_size for path in cache_dir.iterdir())
+    return {
+        "file": csv_path.name,
+        "format": fmt,
+        "csv_mb": csv_path.stat().st_size / 1e6,
+        "cache_mb": entry_bytes / 1e6,
+        "parse_s": parse_s,
+        "first_s": first_s,
+        "warm_s": warm_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("csv", type=Path, nargs="+", help="CSV files to time")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--repeat", type=int, default=5, help="timed reads per measurement")
+    args = parser.parse_args()
+    if pa is None:
+        parser.error("the cache needs pyarrow installed")
+
+    print(
+        f"{'file':<40} {'format':<8} {'CSV MB':>8} {'cache MB':>8} "
+        f"{'parse s':>8} {'first s':>8} {'warm s':>8} {'speedup':>8}"
+    )
+    for csv_path in args.csv:
+        for fmt in args.format:
+            result = benchmark(csv_path, fmt, args.repeat)
+            print(
+                f"{result['file']:<40} {fmt:<8} {result['csv_mb']:>8.2f} "
+                f"{result['cache_mb']:>8.2f} {result['parse_s']:>8.4f} "
+                f"{result['first_s']:>8.4f} {result['warm_s']:>8.4f} "
+                f"{result['parse_s'] / result['warm_s']:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
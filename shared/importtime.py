@@ -0,0 +1,98 @@
+"""Measure how long a day's module takes to import, using ``python -X importtime``.
+
+Each run imports the module in a fresh interpreter (cwd = the module's
+folder, so sibling imports resolve as they do for ``python module.py``)
+and parses the ``-X importtime`` report from stderr. The median over
+``--repeat`` runs is reported, with the module's heaviest direct
+imports, since the first import after a change also pays for
+bytecode compilation.
+
+Usage:
+    python -m shared.importtime Day100_Earnings_Predictor/earnings_predictor.py
+    python -m shared.importtime Day080_House_Price_Predictor/house_price_predictor.py --top 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+PREFIX = "import time:"
+
+
+def parse_importtime(report: str) -> list[tuple[int, str, int]]:
+    """Parse ``-X importtime`` output into ``(depth, module, cumulative_us)`` rows."""
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith(PREFIX) or "[us]" in line:
+            continue
+        _self_us, cumulative, name = line[len(PREFIX) :].split("|", 2)
+        # one leading space, then two spaces per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, name.strip(), int(cumulative)))
+    return rows
+
+
+def direct_imports(rows: list[tuple[int, str, int]], module: str) -> dict[str, int]:
+    """Cumulative time of each import made directly by ``module``'s top-level code.
+
+    ``-X importtime`` prints children before their parent, so the
+    direct imports are the depth+1 rows between ``module``'s own row
+    and the previous row at its depth or shallower.
+    """
+    index = next(i for i, (_, name, _) in enumerate(rows) if name == module)
+    depth = rows[index][0]
+    children: dict[str, int] = {}
+    for child_depth, name, cumulative in reversed(rows[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children[name] = cumulative
+    return children
+
+
+def measure(path: Path) -> tuple[int, dict[str, int]]:
+    """Import the module at ``path`` once and return (total_us, direct imports)."""
+    module = path.stem
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=path.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = parse_importtime(result.stderr)
+    total = next(cumulative for _, name, cumulative in rows if name == module)
+    return total, direct_imports(rows, module)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("paths", type=Path, nargs="+", help="module files to import")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=8, help="direct imports to list")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        totals = []
+        children: defaultdict[str, list[int]] = defaultdict(list)
+        for _ in range(args.repeat):
+            total, direct = measure(path.resolve())
+            totals.append(total)
+            for name, cumulative in direct.items():
+                children[name].append(cumulative)
+        print(f"{path}: {statistics.median(totals) / 1000:.0f} ms (median of {args.repeat})")
+        heaviest = sorted(
+            ((statistics.median(times), name) for name, times in children.items()),
+            reverse=True,
+        )
+        for cumulative, name in heaviest[: args.top]:
+            print(f"  {name:<48} {cumulative / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""orjson-backed Flask JSON provider for the API days.
+
+Days 066 and 095 serialize thousands of rows per response, where
+Flask's default ``json`` encoder is most of the cost. When orjson is
+installed, :func:`use_orjson` swaps it in; without it the app keeps
+Flask's default provider and behaves the same, only slower.
+
+Usage::
+
+    app = Flask(__name__)
+    use_orjson(app)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson for faster JSON encoding
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Keys are sorted, like Flask's default provider, so responses and
+    their ETags don't change with the encoder.
+    """
+
+    options = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.options).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Any:
+        # Skip the bytes -> str -> bytes round trip of the default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.options)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def use_orjson(app: Flask) -> bool:
+    """Make ``app`` encode JSON with orjson if it's installed; returns whether it did."""
+    if orjson is None:
+        return False
+    app.json = OrjsonProvider(app)
+    return True
@@ -0,0 +1,113 @@
+"""Deferred matplotlib/seaborn imports and a background plot stage.
+
+Importing seaborn and pyplot costs about two seconds, most of a
+pipeline module's import time, and a module imported only for
+``run_pipeline(make_plots=False)`` or its unit tests never draws
+anything. Plot functions call :func:`pyplot` / :func:`seaborn` instead
+of importing at module level, so the cost is paid on the first figure.
+
+:class:`PlotStage` runs those plot functions in worker processes while
+the pipeline carries on training. Each worker has its own pyplot state,
+which isn't thread-safe. Functions and arguments must be picklable:
+module-level functions of the day module, DataFrames, arrays, paths.
+Workers are spawned, so a script that uses a stage needs the usual
+``if __name__ == "__main__":`` guard.
+
+Usage::
+
+    with PlotStage(enabled=make_plots) as plots:
+        plots.submit(plot_eda, df, figures_dir / "eda.png")
+        model = train(df)  # runs while the EDA renders
+        plots.submit(plot_importance, model.feature_importances_, path)
+    # leaving the block waits for every figure and re-raises failures
+"""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+# Rendering competes with training for CPU: leave one core to the pipeline,
+# and render inline on a single-core machine, where a pool only adds the
+# workers' start-up and import cost
+PLOT_WORKERS = max(0, min(2, (os.cpu_count() or 1) - 1))
+
+
+@functools.cache
+def pyplot() -> Any:
+    """Import pyplot on the Agg backend with the seaborn whitegrid theme, once."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    seaborn().set_theme(style="whitegrid")
+    return plt
+
+
+@functools.cache
+def seaborn() -> Any:
+    """Import seaborn on first use."""
+    import seaborn as sns
+
+    return sns
+
+
+class PlotStage:
+    """Render figures in background processes; collect them on :meth:`wait`.
+
+    Args:
+        enabled: ``False`` makes :meth:`submit` a no-op (``--no-plots``).
+        max_workers: Worker processes. ``0`` renders each figure inline
+            in :meth:`submit`, which is easier to debug.
+    """
+
+    def __init__(self, enabled: bool = True, max_workers: int = PLOT_WORKERS) -> None:
+        self.enabled = enabled
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._futures: list[Future] = []
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue ``func(*args, **kwargs)``; it starts as soon as a worker is free."""
+        if not self.enabled:
+            return
+        if self.max_workers == 0:
+            future: Future = Future()
+            future.set_result(func(*args, **kwargs))
+            self._futures.append(future)
+            return
+        if self._pool is None:
+            # spawn: the pipeline may have live joblib threads, which fork can deadlock
+            self._pool = ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._futures.append(self._pool.submit(func, *args, **kwargs))
+
+    def wait(self) -> list[Any]:
+        """Block until every queued figure is done; return results in submit order."""
+        try:
+            return [future.result() for future in self._futures]
+        finally:
+            self._futures = []
+            self.close()
+
+    def close(self, cancel: bool = False) -> None:
+        """Shut the worker pool down, dropping queued figures if ``cancel``."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=cancel)
+            self._pool = None
+
+    def __enter__(self) -> PlotStage:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.wait()
+        else:
+            self.close(cancel=True)
@@ -0,0 +1,155 @@
+"""Shared SQLite engine profile for the Flask-SQLAlchemy days.
+
+Days 063, 064, 066, 067, 069, 087 and 095 used to hand
+``sqlite:///app.db`` straight to Flask-SQLAlchemy. That gives a
+rollback-journal database with ``synchronous=FULL``: every commit takes
+a lock that blocks readers and pays several fsyncs, and a second writer
+gives up with ``database is locked``. Under a few gunicorn workers the
+writes end up serialized behind each other.
+
+:func:`init_sqlite_db` replaces the ``SQLALCHEMY_DATABASE_URI`` +
+``db.init_app(app)`` pair and applies:
+
+- ``journal_mode=WAL``, so readers and the writer don't block each other
+- ``synchronous=NORMAL``, one fsync per checkpoint instead of per commit
+  (still safe against app crashes; a power cut can lose the last commits)
+- ``busy_timeout``, so a second writer waits for the lock instead of failing
+- a larger page cache and memory-mapped reads
+- a bounded connection pool with ``pool_pre_ping``
+- a ``readonly`` bind that opens the database with ``mode=ro``, or a
+  replica file given in ``DATABASE_REPLICA_URI``
+
+Usage::
+
+    db = SQLAlchemy(model_class=Base)
+    init_sqlite_db(app, db, os.environ.get("DATABASE_URI", "sqlite:///app.db"))
+
+    # Long reads (exports, reports) can go to the read-only engine
+    with reader(db).connect() as conn:
+        rows = conn.execute(db.select(Cafe.name)).all()
+
+``python -m shared.sqlite_loadtest`` compares this profile with the
+default engine under concurrent readers and writers.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import URL, make_url
+
+READONLY_BIND = "readonly"
+REPLICA_ENV_VAR = "DATABASE_REPLICA_URI"
+
+# Run on every new DBAPI connection, in this order
+PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms
+    "cache_size": -64_000,  # negative means KiB: ~64 MB per connection
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+# journal_mode belongs to the database file and a read-only connection
+# can't change it; query_only makes accidental writes fail loudly
+READONLY_PRAGMAS: dict[str, str | int] = {
+    **{name: value for name, value in PRAGMAS.items() if name != "journal_mode"},
+    "query_only": "ON",
+}
+
+# Per process, so a gunicorn worker with a handful of threads never
+# waits on the pool; pre-ping drops connections to a replaced file
+POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+}
+
+
+def is_memory_url(url: str | URL) -> bool:
+    """True for ``sqlite://`` / ``sqlite:///:memory:`` style URLs."""
+    url = make_url(url)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def readonly_url(url: str | URL) -> URL:
+    """Return a URL that opens the same SQLite file read-only (``mode=ro``)."""
+    url = make_url(url)
+    if is_memory_url(url):
+        raise ValueError("an in-memory SQLite database has no read-only view")
+    database = url.database if url.query.get("uri") else f"file:{url.database}"
+    return url.set(database=database, query={**url.query, "mode": "ro", "uri": "true"})
+
+
+def engine_options(url: str | URL) -> dict[str, Any]:
+    """Engine keyword arguments for ``url``.
+
+    In-memory databases run on a single static connection, so the pool
+    sizing options don't apply to them.
+    """
+    return {} if is_memory_url(url) else dict(POOL_OPTIONS)
+
+
+def set_pragmas(dbapi_connection: Any, pragmas: Mapping[str, str | int]) -> None:
+    """Execute ``PRAGMA name=value`` for each entry on a raw sqlite3 connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def apply_pragmas(engine: Engine, pragmas: Mapping[str, str | int] = PRAGMAS) -> None:
+    """Set ``pragmas`` on every connection ``engine`` opens from now on."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        set_pragmas(dbapi_connection, pragmas)
+
+
+def create_sqlite_engine(url: str | URL, *, readonly: bool = False, **options: Any) -> Engine:
+    """Plain-SQLAlchemy version of :func:`init_sqlite_db`, for scripts and benchmarks."""
+    if readonly:
+        url = readonly_url(url)
+    engine = create_engine(url, **{**engine_options(url), **options})
+    apply_pragmas(engine, READONLY_PRAGMAS if readonly else PRAGMAS)
+    return engine
+
+
+def init_sqlite_db(
+    app: Any, db: Any, url: str, *, replica_url: str | None = None, **options: Any
+) -> None:
+    """Point ``app`` at ``url`` with the shared SQLite profile and ``db.init_app`` it.
+
+    Args:
+        app: the Flask app.
+        db: the app's ``SQLAlchemy`` extension, not yet initialised.
+        url: primary database URL, e.g. ``sqlite:///cafes.db``. Relative
+            paths resolve against ``app.instance_path`` as usual.
+        replica_url: database behind the ``readonly`` bind. Defaults to
+            ``$DATABASE_REPLICA_URI``, then to a read-only view of ``url``.
+        **options: engine option overrides, e.g. ``pool_size=10``.
+    """
+    replica_url = replica_url or os.environ.get(REPLICA_ENV_VAR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = url
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {**engine_options(url), **options}
+    if replica_url or not is_memory_url(url):
+        replica = readonly_url(replica_url or url)
+        binds = app.config.setdefault("SQLALCHEMY_BINDS", {})
+        binds[READONLY_BIND] = {"url": replica, **engine_options(replica), **options}
+    db.init_app(app)
+
+    with app.app_context():
+        for key, engine in db.engines.items():
+            apply_pragmas(engine, READONLY_PRAGMAS if key == READONLY_BIND else PRAGMAS)
+
+
+def reader(db: Any) -> Engine:
+    """Engine for read-only work: the ``readonly`` bind if configured, else the primary."""
+    engines = db.engines
+    return engines[READONLY_BIND] if READONLY_BIND in engines else engines[None]
@@ -0,0 +1,185 @@
+"""Concurrent read/write load test: default SQLite engine vs the shared profile.
+
+Starts ``--workers`` processes (standing in for gunicorn workers), each
+running ``--threads`` client threads against a scratch database. Every
+client runs a read-heavy mix - a 50-row range read, or with probability
+``--write-ratio`` a one-row insert committed on its own - for
+``--seconds``, and counts completed reads, writes and
+``database is locked`` failures.
+
+The "default" profile is what the Flask days had before: a bare
+``create_engine(url)`` on a rollback-journal file. The "tuned" profile is
+:func:`shared.sqlite_engine.create_sqlite_engine`. Each profile gets a
+fresh database file, since WAL mode sticks to the file once set.
+
+Usage:
+    python -m shared.sqlite_loadtest
+    python -m shared.sqlite_loadtest --workers 8 --threads 4 --seconds 10 --dir /var/tmp
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import (
+    Column,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    insert,
+    select,
+)
+from sqlalchemy.exc import OperationalError
+
+from shared.sqlite_engine import create_sqlite_engine
+
+SEED_ROWS = 20_000
+RANGE_ROWS = 50
+# Give every process time to import and connect before the clock starts
+START_DELAY = 1.0
+
+metadata = MetaData()
+items = Table(
+    "item",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(50), nullable=False),
+    Column("value", Integer, nullable=False),
+)
+
+PROFILES = {
+    "default": create_engine,
+    "tuned": create_sqlite_engine,
+}
+
+
+def seed_database(url: str) -> None:
+    """Create the item table and fill it with ``SEED_ROWS`` rows."""
+    engine = create_engine(url)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(items), [{"name": f"item {i}", "value": i} for i in range(SEED_ROWS)])
+    engine.dispose()
+
+
+def run_client(
+    engine: Engine, start: float, stop: float, write_ratio: float, seed: int
+) -> tuple[Counter, list[float]]:
+    """Run the read/write mix between wall-clock ``start`` and ``stop``."""
+    rng = random.Random(seed)
+    counts: Counter = Counter()
+    write_ms: list[float] = []
+    time.sleep(max(0.0, start - time.time()))
+    while time.time() < stop:
+        began = time.perf_counter()
+        try:
+            if rng.random() < write_ratio:
+                with engine.begin() as conn:
+                    conn.execute(insert(items), {"name": "load", "value": rng.randrange(1000)})
+                write_ms.append((time.perf_counter() - began) * 1000)
+                counts["writes"] += 1
+            else:
+                low = rng.randrange(SEED_ROWS - RANGE_ROWS)
+                with engine.connect() as conn:
+                    conn.execute(
+                        select(items).where(items.c.id.between(low, low + RANGE_ROWS))
+                    ).all()
+                counts["reads"] += 1
+        except OperationalError as exc:
+            if "locked" not in str(exc):
+                raise
+            counts["locked"] += 1
+    return counts, write_ms
+
+
+def run_worker(
+    profile: str, url: str, threads: int, start: float, stop: float, write_ratio: float, seed: int
+) -> tuple[Counter, list[float]]:
+    """One process: ``threads`` clients sharing one engine (and its pool)."""
+    engine = PROFILES[profile](url)
+    results: list[tuple[Counter, list[float]]] = []
+
+    def client(n: int) -> None:
+        results.append(run_client(engine, start, stop, write_ratio, seed * 1000 + n))
+
+    clients = [threading.Thread(target=client, args=(n,)) for n in range(threads)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    engine.dispose()
+
+    counts: Counter = Counter()
+    write_ms: list[float] = []
+    for client_counts, client_ms in results:
+        counts.update(client_counts)
+        write_ms.extend(client_ms)
+    return counts, write_ms
+
+
+def run_profile(profile: str, directory: Path, args: argparse.Namespace) -> dict[str, float]:
+    """Seed a fresh database, load it with every worker and return the rates."""
+    url = f"sqlite:///{directory / f'{profile}.db'}"
+    seed_database(url)
+    start = time.time() + START_DELAY
+    stop = start + args.seconds
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [
+            pool.submit(
+                run_worker, profile, url, args.threads, start, stop, args.write_ratio, worker
+            )
+            for worker in range(args.workers)
+        ]
+        results = [future.result() for future in futures]
+
+    counts: Counter = Counter()
+    write_ms: list[float] = []
+    for worker_counts, worker_ms in results:
+        counts.update(worker_counts)
+        write_ms.extend(worker_ms)
+    p95 = statistics.quantiles(write_ms, n=20)[-1] if len(write_ms) >= 2 else float("nan")
+    return {
+        "reads/s": counts["reads"] / args.seconds,
+        "writes/s": counts["writes"] / args.seconds,
+        "locked": counts["locked"],
+        "p95 write ms": p95,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--workers", type=int, default=4, help="processes")
+    parser.add_argument("--threads", type=int, default=4, help="client threads per process")
+    parser.add_argument("--seconds", type=float, default=5.0, help="load duration per profile")
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--dir", type=Path, default=None, help="where to put the scratch databases")
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=list(PROFILES))
+    args = parser.parse_args()
+
+    print(
+        f"{args.workers} workers x {args.threads} threads, {args.seconds:g}s, "
+        f"{args.write_ratio:.0%} writes"
+    )
+    print(f"{'profile':>8} {'reads/s':>10} {'writes/s':>10} {'locked':>8} {'p95 write ms':>13}")
+    with tempfile.TemporaryDirectory(prefix="sqlite_load_", dir=args.dir) as tmp:
+        for profile in args.profiles:
+            stats = run_profile(profile, Path(tmp), args)
+            print(
+                f"{profile:>8} {stats['reads/s']:>10,.0f} {stats['writes/s']:>10,.0f} "
+                f"{stats['locked']:>8,} {stats['p95 write ms']:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
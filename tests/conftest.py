@@ -0,0 +1,10 @@
+"""Test configuration for the shared helpers in ``shared/``.
+
+Puts the repo root on ``sys.path`` so ``import shared`` works no matter
+which directory pytest is started from.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
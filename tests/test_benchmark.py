@@ -0,0 +1,137 @@
+"""Tests for the stage benchmark harness."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from shared.benchmark import (
+    HISTORY_FILE,
+    Stage,
+    baselines,
+    find_regressions,
+    load_history,
+    load_suite,
+    measure,
+    run_suite,
+    save_history,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(machine: str, median_s: float, peak_mb: float = 10.0) -> dict:
+    return {
+        "machine": machine,
+        "results": [{"stage": "fit", "n": 100, "median_s": median_s, "peak_mb": peak_mb}],
+    }
+
+
+def test_measure_records_time_and_traced_peak(tmp_path: Path) -> None:
+    calls = []
+
+    def allocate(n: int) -> bytes:
+        calls.append(n)
+        return b"x" * n
+
+    result = measure(Stage("alloc", allocate, lambda n, scratch: (n,)), 4 << 20, tmp_path, 2)
+    assert len(calls) == 3  # two timed calls, one traced
+    assert result["stage"] == "alloc"
+    assert result["n"] == 4 << 20
+    assert result["min_s"] <= result["median_s"]
+    assert result["peak_mb"] == pytest.approx(4, rel=0.1)
+    if sys.platform == "linux":
+        assert result["rss_mb"] >= 3
+
+
+def test_run_suite_uses_stage_sizes() -> None:
+    stages = [
+        Stage("all", lambda n: None, lambda n, scratch: (n,)),
+        Stage("small", lambda n: None, lambda n, scratch: (n,), sizes=(1,)),
+    ]
+    results = run_suite(stages, sizes=(1, 2), repeat=1)
+    assert [(r["stage"], r["n"]) for r in results] == [("all", 1), ("all", 2), ("small", 1)]
+
+
+def test_baselines_use_recent_runs_on_the_same_machine() -> None:
+    history = {
+        "runs": [_run("a", 100.0)] + [_run("a", t) for t in (1.0, 2.0, 3.0)] + [_run("b", 9.0)],
+    }
+    assert baselines(history, "a", runs=3) == {("fit", 100): {"median_s": 2.0, "peak_mb": 10.0}}
+    assert baselines(history, "c") == {}
+
+
+def test_find_regressions_applies_threshold_and_noise_floor() -> None:
+    baseline = {("fit", 100): {"median_s": 1.0, "peak_mb": 10.0}}
+    slower = [{"stage": "fit", "n": 100, "median_s": 1.3, "peak_mb": 10.5}]
+    (regression,) = find_regressions(slower, baseline, threshold=0.25)
+    assert regression["metric"] == "median_s"
+    assert regression["change"] == pytest.approx(0.3)
+
+    assert find_regressions(slower, baseline, threshold=0.5) == []
+    # +100% but only 5 ms: timer noise
+    tiny = {("fit", 100): {"median_s": 0.005, "peak_mb": 10.0}}
+    fast = [{"stage": "fit", "n": 100, "median_s": 0.01, "peak_mb": 10.0}]
+    assert find_regressions(fast, tiny) == []
+    # RSS is only compared when both sides have it
+    rss_baseline = {("fit", 100): {"median_s": 1.0, "rss_mb": 10.0}}
+    assert find_regressions([{**slower[0], "median_s": 1.0, "rss_mb": None}], rss_baseline) == []
+    (rss,) = find_regressions([{**slower[0], "median_s": 1.0, "rss_mb": 50.0}], rss_baseline)
+    assert rss["metric"] == "rss_mb"
+    # new stages have nothing to regress against
+    assert find_regressions([{**slower[0], "stage": "new"}], baseline) == []
+
+
+def test_history_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / HISTORY_FILE
+    history = load_history(path)
+    assert history["runs"] == []
+    history["runs"].append(_run("a", 1.0))
+    save_history(path, history)
+    assert load_history(path) == history
+    assert list(tmp_path.iterdir()) == [path]
+
+    path.write_text(json.dumps({"format_version": 99, "runs": []}))
+    with pytest.raises(ValueError, match="unsupported"):
+        load_history(path)
+
+
+def test_load_suite_requires_stages(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_suite(tmp_path)
+    (tmp_path / "benchmarks.py").write_text("SIZES = (1,)\n")
+    with pytest.raises(ValueError, match="STAGES"):
+        load_suite(tmp_path)
+
+
+def test_cli_saves_history_and_fails_on_regression(tmp_path: Path) -> None:
+    day = tmp_path / "Day999_Bench"
+    day.mkdir()
+    (day / "benchmarks.py").write_text(
+        "import os, time\n"
+        "from shared.benchmark import Stage\n"
+        "SIZES = (1,)\n"
+        "DELAY = float(os.environ['BENCH_DELAY'])\n"
+        "STAGES = [Stage('sleep', time.sleep, lambda n, scratch: (DELAY,))]\n",
+    )
+
+    def run(delay: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-m", "shared.benchmark", str(day), "--repeat", "1"],
+            cwd=REPO_ROOT,
+            env={"BENCH_DELAY": delay, "PATH": ""},
+            capture_output=True,
+            text=True,
+        )
+
+    assert run("0.02").returncode == 0
+    slow = run("0.2")
+    assert slow.returncode == 1
+    assert "REGRESSION sleep" in slow.stdout
+    runs = json.loads((day / HISTORY_FILE).read_text())["runs"]
+    assert len(runs) == 2
+    assert runs[1]["regressions"][0]["metric"] == "median_s"
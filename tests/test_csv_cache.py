@@ -0,0 +1,136 @@
+"""Tests for the CSV sidecar cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from shared import csv_cache
+from shared.csv_cache import CACHE_DIR_ENV, CACHE_DIR_NAME, cached_read_csv, evict
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    path = tmp_path / "states.v2.csv"
+    pd.DataFrame(
+        {"state": ["Ohio", "Utah", "Iowa"], "x": [1, 2, 3], "y": [0.5, None, 2.5]},
+    ).to_csv(path, index=False)
+    return path
+
+
+def _entries(directory: Path) -> list[Path]:
+    return sorted(directory.iterdir()) if directory.exists() else []
+
+
+def _no_parsing(*args, **kwargs):
+    raise AssertionError("read_csv called on a cache hit")
+
+
+@pytest.mark.parametrize("fmt", ["feather", "parquet"])
+def test_second_read_comes_from_the_cache(
+    csv_path: Path, fmt: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    options = {"index_col": "state", "dtype": {"x": "int16"}}
+    expected = pd.read_csv(csv_path, **options)
+    pd.testing.assert_frame_equal(cached_read_csv(csv_path, fmt=fmt, **options), expected)
+    (entry,) = _entries(csv_path.parent / CACHE_DIR_NAME)
+    assert entry.name.startswith("states.v2.")
+    assert entry.suffix == f".{fmt}"
+
+    monkeypatch.setattr(csv_cache.pd, "read_csv", _no_parsing)
+    pd.testing.assert_frame_equal(cached_read_csv(csv_path, fmt=fmt, **options), expected)
+
+
+def test_changed_file_or_options_miss(csv_path: Path) -> None:
+    cache_dir = csv_path.parent / CACHE_DIR_NAME
+    cached_read_csv(csv_path)
+    cached_read_csv(csv_path, usecols=["state"])
+    assert len(_entries(cache_dir)) == 2
+
+    csv_path.write_text("state,x,y\nMaine,4,1.0\n")
+    assert cached_read_csv(csv_path)["state"].tolist() == ["Maine"]
+    # the entry for the old contents was replaced, the usecols one kept
+    assert len(_entries(cache_dir)) == 2
+
+
+def test_uncacheable_options_read_directly(csv_path: Path) -> None:
+    df = cached_read_csv(csv_path, converters={"state": str.upper})
+    assert df["state"].tolist() == ["OHIO", "UTAH", "IOWA"]
+    assert _entries(csv_path.parent / CACHE_DIR_NAME) == []
+
+    with pytest.raises(ValueError, match="reader"):
+        cached_read_csv(csv_path, chunksize=2)
+    with pytest.raises(ValueError, match="format"):
+        cached_read_csv(csv_path, fmt="pickle")
+
+
+def test_corrupt_entry_is_rebuilt(csv_path: Path) -> None:
+    cached_read_csv(csv_path)
+    (entry,) = _entries(csv_path.parent / CACHE_DIR_NAME)
+    entry.write_bytes(b"not arrow")
+    assert cached_read_csv(csv_path)["x"].tolist() == [1, 2, 3]
+    assert entry.stat().st_size > len(b"not arrow")
+
+
+def test_cache_dir_from_environment(
+    csv_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "elsewhere"))
+    cached_read_csv(csv_path)
+    assert len(_entries(tmp_path / "elsewhere")) == 1
+    assert _entries(csv_path.parent / CACHE_DIR_NAME) == []
+
+
+def test_evict_drops_old_then_least_recently_used(tmp_path: Path) -> None:
+    now = time.time()
+    for name, age_days in [("a", 0), ("b", 1), ("c", 2), ("d", 40)]:
+        path = tmp_path / f"{name}.slot.src.feather"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age_days * 86_400, now - age_days * 86_400))
+    (tmp_path / "notes.txt").write_text("not an entry")
+
+    removed = evict(tmp_path, max_bytes=250, max_age_days=30)
+    assert sorted(path.name[0] for path in removed) == ["c", "d"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "a.slot.src.feather",
+        "b.slot.src.feather",
+        "notes.txt",
+    ]
+
+
+def test_evict_keeps_the_entry_just_written(tmp_path: Path) -> None:
+    now = time.time()
+    for name, age_days in [("big", 0), ("small", 1)]:
+        path = tmp_path / f"{name}.slot.src.feather"
+        path.write_bytes(b"x" * (300 if name == "big" else 100))
+        os.utime(path, (now - age_days * 86_400, now - age_days * 86_400))
+
+    removed = evict(tmp_path, max_bytes=250, keep=tmp_path / "big.slot.src.feather")
+    assert [path.name for path in removed] == ["small.slot.src.feather"]
+    assert [path.name for path in tmp_path.iterdir()] == ["big.slot.src.feather"]
+
+
+def test_entry_over_the_cap_is_still_cached(
+    csv_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cached_read_csv(csv_path, max_bytes=1)
+    assert len(_entries(csv_path.parent / CACHE_DIR_NAME)) == 1
+    monkeypatch.setattr(csv_cache.pd, "read_csv", _no_parsing)
+    assert cached_read_csv(csv_path, max_bytes=1)["x"].tolist() == [1, 2, 3]
+
+
+def test_hit_in_a_read_only_cache(csv_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cached_read_csv(csv_path)
+
+    def read_only(self: Path, *args, **kwargs) -> None:
+        raise PermissionError(13, "Read-only file system", str(self))
+
+    monkeypatch.setattr(Path, "touch", read_only)
+    monkeypatch.setattr(csv_cache.pd, "read_csv", _no_parsing)
+    assert cached_read_csv(csv_path)["state"].tolist() == ["Ohio", "Utah", "Iowa"]
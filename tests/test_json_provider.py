@@ -0,0 +1,42 @@
+"""Tests for the shared orjson Flask JSON provider."""
+
+from __future__ import annotations
+
+import pytest
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from shared import json_provider
+from shared.json_provider import OrjsonProvider, use_orjson
+
+
+def _app() -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/")
+    def index():
+        return jsonify({"b": 1, "a": [1.5, None, "é"]})
+
+    return app
+
+
+def test_orjson_matches_the_default_encoding() -> None:
+    pytest.importorskip("orjson")
+    default = _app().test_client().get("/").get_json()
+    app = _app()
+    assert use_orjson(app)
+    assert isinstance(app.json, OrjsonProvider)
+    response = app.test_client().get("/")
+    assert response.mimetype == "application/json"
+    assert response.get_json() == default
+    body = response.get_data(as_text=True)
+    assert body.index('"a"') < body.index('"b"')  # keys sorted, as Flask does
+    assert app.json.loads(app.json.dumps({"x": [1, 2]})) == {"x": [1, 2]}
+
+
+def test_without_orjson_the_default_provider_stays(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_provider, "orjson", None)
+    app = _app()
+    assert not use_orjson(app)
+    assert type(app.json) is DefaultJSONProvider
+    assert app.test_client().get("/").get_json()["b"] == 1
@@ -0,0 +1,61 @@
+"""Tests for the lazy plotting imports and the background plot stage."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from shared.plotting import PlotStage, pyplot
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_does_not_load_matplotlib() -> None:
+    code = "import sys, shared.plotting; print('matplotlib' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_pyplot_uses_agg_backend() -> None:
+    plt = pyplot()
+    assert plt.get_backend().lower() == "agg"
+    assert pyplot() is plt
+
+
+def test_disabled_stage_runs_nothing(tmp_path: Path) -> None:
+    stage = PlotStage(enabled=False)
+    stage.submit(Path.write_text, tmp_path / "figure.png", "x")
+    assert stage.wait() == []
+    assert not (tmp_path / "figure.png").exists()
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_stage_returns_results_in_order(tmp_path: Path, workers: int) -> None:
+    stage = PlotStage(max_workers=workers)
+    for name in ("a", "bb", "ccc"):
+        stage.submit(Path.write_text, tmp_path / f"{name}.png", name)
+    # write_text returns the number of characters written
+    assert stage.wait() == [1, 2, 3]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.png", "bb.png", "ccc.png"]
+
+
+def test_context_manager_waits(tmp_path: Path) -> None:
+    with PlotStage(max_workers=1) as stage:
+        stage.submit(Path.write_text, tmp_path / "figure.png", "x")
+    assert (tmp_path / "figure.png").read_text() == "x"
+
+
+def test_wait_reraises_worker_errors() -> None:
+    stage = PlotStage(max_workers=1)
+    stage.submit(int, "not a number")
+    with pytest.raises(ValueError, match="invalid literal"):
+        stage.wait()
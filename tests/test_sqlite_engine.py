@@ -0,0 +1,110 @@
+"""Tests for the shared SQLite engine profile."""
+
+from __future__ import annotations
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import DeclarativeBase
+
+from shared import sqlite_engine
+from shared.sqlite_engine import (
+    READONLY_BIND,
+    create_sqlite_engine,
+    engine_options,
+    init_sqlite_db,
+    reader,
+    readonly_url,
+)
+
+
+def pragma(conn, name: str):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+@pytest.fixture
+def db_url(tmp_path) -> str:
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_sqlite_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO item DEFAULT VALUES"))
+    engine.dispose()
+    return url
+
+
+def make_app(tmp_path, url: str, **kwargs) -> tuple[Flask, SQLAlchemy]:
+    class Base(DeclarativeBase):
+        pass
+
+    app = Flask(__name__, instance_path=str(tmp_path / "instance"))
+    db = SQLAlchemy(model_class=Base)
+    init_sqlite_db(app, db, url, **kwargs)
+    return app, db
+
+
+class TestEngine:
+    def test_pragmas_applied_to_new_connections(self, db_url) -> None:
+        engine = create_sqlite_engine(db_url)
+        with engine.connect() as conn:
+            assert pragma(conn, "journal_mode") == "wal"
+            assert pragma(conn, "synchronous") == 1  # NORMAL
+            assert pragma(conn, "busy_timeout") == 5000
+            assert pragma(conn, "cache_size") == -64_000
+            assert pragma(conn, "mmap_size") == 256 * 1024 * 1024
+        assert engine.pool.size() == 5
+        engine.dispose()
+
+    def test_readonly_engine_reads_but_refuses_writes(self, db_url) -> None:
+        engine = create_sqlite_engine(db_url, readonly=True)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM item")).scalar() == 1
+            with pytest.raises(OperationalError, match="readonly database"):
+                conn.execute(text("INSERT INTO item DEFAULT VALUES"))
+        engine.dispose()
+
+    def test_readonly_url_keeps_existing_uri_form(self) -> None:
+        url = readonly_url("sqlite:///file:data/app.db?uri=true&cache=shared")
+        assert url.database == "file:data/app.db"
+        assert dict(url.query) == {"uri": "true", "cache": "shared", "mode": "ro"}
+
+    def test_memory_database_skips_pool_sizing(self) -> None:
+        assert engine_options("sqlite://") == {}
+        assert engine_options("sqlite:///:memory:") == {}
+        with pytest.raises(ValueError):
+            readonly_url("sqlite:///:memory:")
+
+
+class TestFlaskIntegration:
+    def test_file_database_gets_readonly_bind(self, tmp_path) -> None:
+        app, db = make_app(tmp_path, "sqlite:///app.db")
+        assert app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_pre_ping"] is True
+        with app.app_context():
+            assert set(db.engines) == {None, READONLY_BIND}
+            with db.engine.begin() as conn:
+                conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+                assert pragma(conn, "journal_mode") == "wal"
+            # Relative paths land in the instance folder, for both engines
+            assert db.engine.url.database == str(tmp_path / "instance" / "app.db")
+            with reader(db).connect() as conn:
+                assert pragma(conn, "query_only") == 1
+                assert conn.execute(text("SELECT count(*) FROM item")).scalar() == 0
+
+    def test_memory_database_has_no_readonly_bind(self, tmp_path) -> None:
+        app, db = make_app(tmp_path, "sqlite://")
+        with app.app_context():
+            assert list(db.engines) == [None]
+            assert reader(db) is db.engine
+
+    def test_replica_from_environment(self, tmp_path, db_url, monkeypatch) -> None:
+        monkeypatch.setenv(sqlite_engine.REPLICA_ENV_VAR, db_url)
+        app, db = make_app(tmp_path, "sqlite://")
+        with app.app_context(), reader(db).connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM item")).scalar() == 1
+
+    def test_option_overrides(self, tmp_path) -> None:
+        app, _ = make_app(tmp_path, "sqlite:///app.db", pool_size=2)
+        assert app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 2
+        assert app.config["SQLALCHEMY_BINDS"][READONLY_BIND]["pool_size"] == 2
@@ -0,0 +1,97 @@
+"""Tests for the vectorized synthetic-data helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared import synthetic
+from shared.synthetic import (
+    choice,
+    cycle,
+    dates_from_parts,
+    integers,
+    labels,
+    make_rng,
+    random_dates,
+    scaled,
+)
+
+
+def test_scaled_rounds_and_keeps_at_least_one_row() -> None:
+    assert scaled(80, 1.0) == 80
+    assert scaled(80, 2.5) == 200
+    assert scaled(80, 0.001) == 1
+    with pytest.raises(ValueError, match="scale must be positive"):
+        scaled(80, 0)
+
+
+def test_make_rng_passes_a_generator_through() -> None:
+    rng = np.random.default_rng(1)
+    assert make_rng(rng) is rng
+    assert make_rng(7).integers(0, 1000) == np.random.default_rng(7).integers(0, 1000)
+
+
+@pytest.mark.parametrize(
+    ("low", "high", "dtype"),
+    [(1, 16, np.int8), (1978, 2024, np.int16), (50, 500_000, np.int32), (-5, 100, np.int8)],
+)
+def test_integers_use_the_smallest_dtype(low: int, high: int, dtype: type) -> None:
+    values = integers(make_rng(0), low, high, 10_000)
+    assert values.dtype == dtype
+    assert values.min() >= low and values.max() < high
+
+
+def test_choice_normalizes_weights_and_returns_a_categorical() -> None:
+    # The weights of Day 099's states sum to 0.9
+    states = [f"S{i}" for i in range(50)]
+    drawn = choice(make_rng(0), states, 50_000, p=[0.04] * 10 + [0.02] * 10 + [0.01] * 30)
+    assert isinstance(drawn, pd.Categorical)
+    assert list(drawn.categories) == states
+    assert drawn.codes.dtype == np.int8
+    share = pd.Series(drawn).value_counts(normalize=True)
+    assert share["S0"] == pytest.approx(0.04 / 0.9, abs=0.005)
+
+
+def test_cycle_repeats_in_order() -> None:
+    assert list(cycle(["a", "b", "c"], 7)) == ["a", "b", "c", "a", "b", "c", "a"]
+
+
+def test_labels_match_an_f_string(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = [f"App_{i}" for i in range(1, 6)]
+    assert labels("App_", 5).tolist() == expected
+    monkeypatch.setattr(synthetic, "pc", None)
+    assert labels("App_", 5).tolist() == expected
+
+
+def test_dates_from_parts_match_parsed_strings() -> None:
+    rng = make_rng(3)
+    year, month, day = (
+        rng.integers(1900, 2100, 1000),
+        rng.integers(1, 13, 1000),
+        rng.integers(1, 29, 1000),
+    )
+    parsed = pd.to_datetime(
+        [f"{y}-{m:02d}-{d:02d}" for y, m, d in zip(year, month, day, strict=True)]
+    )
+    assert (dates_from_parts(year, month, day) == parsed).all()
+
+
+def test_dates_from_parts_rolls_over_short_months() -> None:
+    assert dates_from_parts(np.array([2023]), np.array([2]), np.array([30]))[0] == pd.Timestamp(
+        "2023-03-02"
+    )
+
+
+def test_random_dates_stay_in_range() -> None:
+    dates = random_dates(make_rng(0), 2015, 2024, 10_000)
+    assert dates.year.min() == 2015 and dates.year.max() == 2024
+    assert dates.day.max() <= 28
+
+
+def test_same_seed_same_data() -> None:
+    first = [integers(make_rng(5), 0, 100, 10), choice(make_rng(5), "xyz", 10)]
+    second = [integers(make_rng(5), 0, 100, 10), choice(make_rng(5), "xyz", 10)]
+    assert (first[0] == second[0]).all()
+    assert first[1].equals(second[1])